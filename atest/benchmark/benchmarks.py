@@ -0,0 +1,149 @@
+"""SeleniumLibrary benchmarks run by `run.py`.
+
+Each benchmark is a function getting the library, a function returning
+the URL of a page in the test server and a function opening a new browser
+with the used browser name and remote URL. The library has a browser open
+with alias `benchmark`. Benchmarks return the measured time of one round
+in seconds, so setup done before the measured part is not included in
+results.
+
+Benchmarks registered with `fake=True` work also with the fake WebDriver
+remote end in `fakewebdriver.py`. Others need a real browser, for example,
+to execute JavaScript or to switch frames.
+"""
+
+import os
+import tempfile
+import time
+
+BENCHMARKS = {}
+FAKE_BENCHMARKS = set()
+
+
+def benchmark(name, fake=False):
+    def register(function):
+        BENCHMARKS[name] = function
+        if fake:
+            FAKE_BENCHMARKS.add(name)
+        return function
+
+    return register
+
+
+def timed(operation, *args, **kwargs):
+    start = time.perf_counter()
+    operation(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+@benchmark("browser_start", fake=True)
+def browser_start(lib, page, open_browser):
+    start = time.perf_counter()
+    open_browser(page("index.html"))
+    elapsed = time.perf_counter() - start
+    lib.close_browser()
+    lib.switch_browser("benchmark")
+    return elapsed
+
+
+@benchmark("parallel_start", fake=True)
+def parallel_start(lib, page, open_browser):
+    start = time.perf_counter()
+    aliases = open_browser(page("index.html"), count=4)
+    elapsed = time.perf_counter() - start
+    for alias in aliases:
+        lib.switch_browser(alias)
+        lib.close_browser()
+    lib.switch_browser("benchmark")
+    return elapsed
+
+
+@benchmark("keyword_dispatch", fake=True)
+def keyword_dispatch(lib, page, open_browser):
+    # Cheap keywords sending one command each, dominated by library overhead
+    # when used with the fake remote end.
+    lib.go_to(page("nested_divs.html"))
+    start = time.perf_counter()
+    for _ in range(50):
+        lib.get_title()
+    return time.perf_counter() - start
+
+
+@benchmark("locator_throughput", fake=True)
+def locator_throughput(lib, page, open_browser):
+    lib.go_to(page("nested_divs.html"))
+    locators = [
+        "id:needleC",
+        "needleD2",
+        "css:#d > #d1",
+        "xpath://div[@id='d2']",
+        "css:div",
+    ]
+    start = time.perf_counter()
+    for _ in range(10):
+        for locator in locators:
+            lib.get_webelements(locator)
+    return time.perf_counter() - start
+
+
+@benchmark("wait_latency")
+def wait_latency(lib, page, open_browser):
+    # Time from the element appearing until the wait notices it.
+    lib.go_to(page("nested_divs.html"))
+    start = time.perf_counter()
+    lib.execute_javascript(
+        "setTimeout(function () {"
+        "  var element = document.createElement('div');"
+        "  element.id = 'late';"
+        "  document.body.appendChild(element);"
+        "}, 100);"
+    )
+    lib.wait_until_page_contains_element("id:late", "5 seconds")
+    return time.perf_counter() - start - 0.1
+
+
+@benchmark("table_read")
+def table_read(lib, page, open_browser):
+    lib.go_to(page("tables/tables.html"))
+    start = time.perf_counter()
+    for row in range(1, 4):
+        for column in range(1, 4):
+            lib.get_table_cell("simpleTable", row, column)
+    lib.table_should_contain("simpleTable", "simpleTable_C3")
+    lib.table_column_should_contain("simpleTable", 2, "simpleTable_B2")
+    return time.perf_counter() - start
+
+
+@benchmark("select_read", fake=True)
+def select_read(lib, page, open_browser):
+    lib.go_to(page("forms/prefilled_email_form.html"))
+    start = time.perf_counter()
+    for _ in range(5):
+        lib.get_list_items("name:preferred_channel")
+        lib.get_selected_list_label("name:preferred_channel")
+        lib.get_selected_list_values("name:possible_channels")
+    return time.perf_counter() - start
+
+
+@benchmark("frame_switch")
+def frame_switch(lib, page, open_browser):
+    lib.go_to(page("frames/iframes.html"))
+    start = time.perf_counter()
+    for _ in range(5):
+        lib.select_frame("id:left")
+        lib.get_webelement("name:q")
+        lib.unselect_frame()
+    return time.perf_counter() - start
+
+
+@benchmark("screenshot", fake=True)
+def screenshot(lib, page, open_browser):
+    lib.go_to(page("nested_divs.html"))
+    with tempfile.TemporaryDirectory() as directory:
+        return timed(
+            lib.capture_page_screenshot, os.path.join(directory, "page.png")
+        ) + timed(
+            lib.capture_element_screenshot,
+            "id:top",
+            os.path.join(directory, "element.png"),
+        )
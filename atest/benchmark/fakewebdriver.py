@@ -0,0 +1,888 @@
+#!/usr/bin/env python
+"""Fake W3C WebDriver remote end for measuring library overhead.
+
+The server implements enough of the W3C WebDriver protocol for
+`Open Browser` with `remote_url` and common keywords to work without a
+real browser. Pages are fetched with `urllib` and parsed into a simple
+DOM model. Elements can be found with CSS selectors and XPath expressions
+using a subset of both syntaxes that covers locators generated by
+SeleniumLibrary and Selenium's `Select` class. Scripts are not executed:
+the `getAttribute` and `isDisplayed` atoms used by Selenium are emulated
+and other scripts return `null`, which makes the library use its
+fallbacks that do not depend on JavaScript. Frames are not supported and
+there is only one window.
+
+Every command can be delayed to simulate the latency of a real browser,
+either globally or per command. Command names are the ones used by
+Selenium, for example `findElement` and `getElementText`.
+
+Examples:
+
+    fakewebdriver.py --port 4444
+    fakewebdriver.py --port 4444 --latency 0.005 --command-latency newSession=1.5
+"""
+
+import argparse
+import base64
+import json
+import re
+import threading
+import time
+import uuid
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import urlopen
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+# Elements whose start tag implicitly closes an open element with same tag.
+SELF_CLOSING_SIBLINGS = {"li", "option", "p", "td", "th", "tr"}
+# 1x1 transparent PNG.
+SCREENSHOT = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+    )
+).decode("ASCII")
+
+
+class WebDriverError(Exception):
+    def __init__(self, error, message, status=404):
+        super().__init__(message)
+        self.error = error
+        self.status = status
+
+
+class Node:
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.parent = parent
+        self.children = []
+        self.id = str(uuid.uuid4())
+
+    @property
+    def elements(self):
+        return [child for child in self.children if isinstance(child, Node)]
+
+    def descendants(self):
+        for child in self.elements:
+            yield child
+            yield from child.descendants()
+
+    @property
+    def text(self):
+        parts = []
+        for child in self.children:
+            parts.append(child.text if isinstance(child, Node) else child)
+        return " ".join(" ".join(parts).split())
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+
+class DocumentParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.document = Node("#document")
+        self.stack = [self.document]
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SELF_CLOSING_SIBLINGS and self.stack[-1].tag == tag:
+            self.stack.pop()
+        node = Node(tag, [(name, value or "") for name, value in attrs])
+        node.parent = self.stack[-1]
+        node.parent.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        if data.strip() and self.stack[-1].tag not in ("script", "style"):
+            self.stack[-1].children.append(data)
+
+
+def parse_document(html):
+    parser = DocumentParser()
+    parser.feed(html)
+    parser.close()
+    return parser.document
+
+
+# CSS selectors: compound selectors like `tag#id.class[attr="value"]`
+# combined with descendant and child combinators, separated with commas.
+CSS_TOKEN = re.compile(
+    r"""\s*(?:
+    (?P<combinator>>)
+    |(?P<tag>[\w-]+|\*)
+    |\#(?P<id>[\w-]+)
+    |\.(?P<cls>[\w-]+)
+    |\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~^$*]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]+))?\s*\]
+    )""",
+    re.VERBOSE,
+)
+
+
+def parse_css(selector):
+    groups = []
+    for group in selector.split(","):
+        steps = [[">", []]]
+        position = 0
+        group = group.strip()
+        while position < len(group):
+            whitespace = group[position].isspace()
+            match = CSS_TOKEN.match(group, position)
+            if not match or match.end() == position:
+                raise WebDriverError("invalid selector", f"Unsupported CSS: {selector}")
+            if match.group("combinator"):
+                steps.append([">", []])
+            else:
+                if whitespace and steps[-1][1]:
+                    steps.append([" ", []])
+                steps[-1][1].append(match)
+            position = match.end()
+        groups.append(steps)
+    return groups
+
+
+def css_matches(node, simple):
+    for match in simple:
+        if match.group("tag") and match.group("tag") not in ("*", node.tag):
+            return False
+        if match.group("id") and node.attrs.get("id") != match.group("id"):
+            return False
+        if match.group("cls") and match.group("cls") not in node.classes:
+            return False
+        if match.group("attr") and not _attr_matches(node, match):
+            return False
+    return True
+
+
+def _attr_matches(node, match):
+    name = match.group("attr")
+    if name not in node.attrs:
+        return False
+    if not match.group("op"):
+        return True
+    actual, expected = node.attrs[name], match.group("value").strip("\"'")
+    return {
+        "=": actual == expected,
+        "~=": expected in actual.split(),
+        "^=": actual.startswith(expected),
+        "$=": actual.endswith(expected),
+        "*=": expected in actual,
+    }[match.group("op")]
+
+
+def find_css(root, selector):
+    found = []
+    for steps in parse_css(selector):
+        candidates = [root]
+        for index, (combinator, simple) in enumerate(steps):
+            if index == 0 or combinator == " ":
+                pool = [node for c in candidates for node in c.descendants()]
+            else:
+                pool = [node for c in candidates for node in c.elements]
+            candidates = _unique(node for node in pool if css_matches(node, simple))
+        found.extend(candidates)
+    return _in_document_order(root, _unique(found))
+
+
+# XPath: location paths with `/` and `//` steps, tag or `*` node tests and
+# predicates with positions, `@attr`, `@attr='value'`, `.='value'`,
+# `text()='value'`, `contains(x, 'value')`, `normalize-space(x)`, `and`,
+# `or` and parentheses.
+XPATH_TOKEN = re.compile(
+    r"""\s*(?:(?P<string>"[^"]*"|'[^']*')|(?P<number>\d+)
+    |(?P<op>!=|=|\(|\)|,)|(?P<attr>@[\w:-]+)|(?P<name>[\w-]+(?:\(\))?|\.))""",
+    re.VERBOSE,
+)
+
+
+def find_xpath(root, xpath):
+    xpath = xpath.strip()
+    if xpath.startswith("("):
+        raise WebDriverError("invalid selector", f"Unsupported XPath: {xpath}")
+    if xpath.startswith("."):
+        xpath = xpath[1:]
+    elif root.tag != "#document":
+        while root.parent:
+            root = root.parent
+    candidates = [root]
+    for axis, step in _split_steps(xpath):
+        test, predicates = _parse_step(step, xpath)
+        if axis == "//":
+            candidates = [node for c in candidates for node in (c, *c.descendants())]
+        results = []
+        # Positions in predicates are relative to children of each parent.
+        for parent in _unique(candidates):
+            matched = [node for node in parent.elements if test in ("*", node.tag)]
+            for predicate in predicates:
+                matched = _apply_predicate(matched, predicate, xpath)
+            results.extend(matched)
+        candidates = _unique(results)
+    return _in_document_order(root, candidates)
+
+
+def _split_steps(xpath):
+    steps = []
+    depth = 0
+    start = 0
+    index = 0
+    while index < len(xpath):
+        char = xpath[index]
+        if char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif char in "\"'":
+            index = xpath.index(char, index + 1)
+        elif char == "/" and depth == 0:
+            if index > start:
+                steps.append(xpath[start:index])
+            axis = "//" if xpath.startswith("//", index) else "/"
+            steps.append(axis)
+            index += len(axis)
+            start = index
+            continue
+        index += 1
+    steps.append(xpath[start:])
+    pairs = []
+    axis = "/"
+    for step in steps:
+        if step in ("/", "//"):
+            axis = step
+        elif step:
+            pairs.append((axis, step))
+    return pairs
+
+
+def _parse_step(step, xpath):
+    match = re.match(r"\s*([\w-]+|\*)", step)
+    if not match:
+        raise WebDriverError("invalid selector", f"Unsupported XPath: {xpath}")
+    predicates = []
+    rest = step[match.end() :]
+    while rest.strip():
+        if not rest.startswith("["):
+            raise WebDriverError("invalid selector", f"Unsupported XPath: {xpath}")
+        depth = 0
+        for index, char in enumerate(rest):
+            depth += {"[": 1, "]": -1}.get(char, 0)
+            if depth == 0:
+                break
+        predicates.append(rest[1:index])
+        rest = rest[index + 1 :]
+    return match.group(1), predicates
+
+
+def _apply_predicate(nodes, predicate, xpath):
+    if predicate.strip().isdigit():
+        position = int(predicate)
+        return nodes[position - 1 : position]
+    if predicate.strip() == "last()":
+        return nodes[-1:]
+    tokens = _tokenize_xpath(predicate, xpath)
+    return [node for node in nodes if _XPathPredicate(tokens, xpath).evaluate(node)]
+
+
+def _tokenize_xpath(predicate, xpath):
+    tokens = []
+    position = 0
+    while position < len(predicate):
+        match = XPATH_TOKEN.match(predicate, position)
+        if not match or match.end() == position:
+            if predicate[position:].strip():
+                raise WebDriverError("invalid selector", f"Unsupported XPath: {xpath}")
+            break
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _XPathPredicate:
+    def __init__(self, tokens, xpath):
+        self.tokens = tokens
+        self.xpath = xpath
+        self.index = 0
+
+    def evaluate(self, node):
+        self.index = 0
+        return bool(self._or(node))
+
+    def _peek(self):
+        return (
+            self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+        )
+
+    def _next(self):
+        token = self._peek()
+        self.index += 1
+        return token
+
+    def _or(self, node):
+        value = self._and(node)
+        while self._peek() == ("name", "or"):
+            self._next()
+            value = self._and(node) or value
+        return value
+
+    def _and(self, node):
+        value = self._comparison(node)
+        while self._peek() == ("name", "and"):
+            self._next()
+            value = self._comparison(node) and value
+        return value
+
+    def _comparison(self, node):
+        left = self._value(node)
+        if self._peek()[1] in ("=", "!="):
+            operator = self._next()[1]
+            right = self._value(node)
+            return (left == right) == (operator == "=")
+        return left
+
+    def _value(self, node):  # noqa: PLR0911
+        kind, value = self._next()
+        if kind == "string":
+            return value[1:-1]
+        if kind == "number":
+            return value
+        if kind == "attr":
+            return node.attrs.get(value[1:])
+        if value == "(":
+            result = self._or(node)
+            self._next()
+            return result
+        if value in (".", "text()"):
+            return node.text
+        if value in ("contains", "normalize-space", "starts-with", "not"):
+            return self._function(value, node)
+        raise WebDriverError("invalid selector", f"Unsupported XPath: {self.xpath}")
+
+    def _function(self, name, node):
+        self._next()
+        arguments = []
+        while self._peek()[1] != ")":
+            arguments.append(self._or(node))
+            if self._peek()[1] == ",":
+                self._next()
+        self._next()
+        if name == "normalize-space":
+            text = arguments[0] if arguments else node.text
+            return " ".join((text or "").split())
+        if name == "not":
+            return not arguments[0]
+        haystack, needle = (argument or "" for argument in arguments)
+        if name == "contains":
+            return needle in haystack
+        return haystack.startswith(needle)
+
+
+def _unique(nodes):
+    seen = set()
+    return [node for node in nodes if not (node.id in seen or seen.add(node.id))]
+
+
+def _in_document_order(root, nodes):
+    order = {node.id: index for index, node in enumerate(root.descendants())}
+    return sorted(nodes, key=lambda node: order.get(node.id, -1))
+
+
+class Session:
+    def __init__(self, capabilities):
+        self.id = uuid.uuid4().hex
+        self.capabilities = capabilities
+        self.url = "about:blank"
+        self.history = []
+        self.document = parse_document("")
+        self.elements = {}
+        self.cookies = []
+        self.timeouts = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+        self.lock = threading.Lock()
+
+    def navigate(self, url, remember=True):
+        if url == "about:blank":
+            html = ""
+        else:
+            try:
+                with urlopen(url, timeout=30) as response:
+                    html = response.read().decode("UTF-8", errors="replace")
+            except OSError as error:
+                raise WebDriverError("unknown error", str(error), 500) from error
+        if remember:
+            self.history.append(self.url)
+        self.url = url
+        self.document = parse_document(html)
+        self.elements = {}
+
+    @property
+    def title(self):
+        titles = find_css(self.document, "title")
+        return titles[0].text if titles else ""
+
+    def reference(self, node):
+        self.elements[node.id] = node
+        return {ELEMENT_KEY: node.id}
+
+    def element(self, element_id):
+        try:
+            return self.elements[element_id]
+        except KeyError:
+            raise WebDriverError(
+                "stale element reference", f"Element {element_id} not found"
+            ) from None
+
+    def find(self, root, using, value):
+        if using == "css selector":
+            return find_css(root, value)
+        if using == "xpath":
+            return find_xpath(root, value)
+        if using == "tag name":
+            return find_css(root, value)
+        if using in ("link text", "partial link text"):
+            links = find_css(root, "a")
+            if using == "link text":
+                return [link for link in links if link.text == value]
+            return [link for link in links if value in link.text]
+        raise WebDriverError("invalid argument", f"Unsupported strategy {using}", 400)
+
+
+class FakeWebDriverServer:
+    def __init__(self, port=0, latency=0.0, command_latency=None):
+        """Fake WebDriver remote end running in background threads.
+
+        `latency` is the delay in seconds added to every command and
+        `command_latency` can override it for individual commands.
+        """
+        self.latency = latency
+        self.command_latency = dict(command_latency or {})
+        self.sessions = {}
+        self.commands = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def execute(self, method, path, body):
+        for route_method, pattern, command in ROUTES:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                break
+        else:
+            raise WebDriverError("unknown command", f"{method} {path}")
+        with self._lock:
+            self.commands[command] = self.commands.get(command, 0) + 1
+        delay = self.command_latency.get(command, self.latency)
+        if delay:
+            time.sleep(delay)
+        arguments = match.groupdict()
+        session_id = arguments.pop("session", None)
+        handler = getattr(self, f"_{command}")
+        if session_id is None:
+            return handler(body, **arguments)
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise WebDriverError("invalid session id", f"No session {session_id}")
+        with session.lock:
+            return handler(session, body, **arguments)
+
+    def _status(self, body):
+        return {"ready": True, "message": "Fake WebDriver ready."}
+
+    def _newSession(self, body):
+        requested = body.get("capabilities", {}).get("alwaysMatch", {})
+        capabilities = {
+            "browserName": requested.get("browserName", "fake"),
+            "browserVersion": "1.0",
+            "platformName": "fake",
+            "acceptInsecureCerts": False,
+            "pageLoadStrategy": "normal",
+        }
+        session = Session(capabilities)
+        with self._lock:
+            self.sessions[session.id] = session
+        return {"sessionId": session.id, "capabilities": capabilities}
+
+    def _quit(self, session, body):
+        with self._lock:
+            self.sessions.pop(session.id, None)
+
+    def _getTimeouts(self, session, body):
+        return session.timeouts
+
+    def _setTimeouts(self, session, body):
+        session.timeouts.update(body)
+
+    def _get(self, session, body):
+        session.navigate(body["url"])
+
+    def _getCurrentUrl(self, session, body):
+        return session.url
+
+    def _goBack(self, session, body):
+        if session.history:
+            session.navigate(session.history.pop(), remember=False)
+
+    def _goForward(self, session, body):
+        pass
+
+    def _refresh(self, session, body):
+        session.navigate(session.url, remember=False)
+
+    def _getTitle(self, session, body):
+        return session.title
+
+    def _getPageSource(self, session, body):
+        with urlopen(session.url) if session.url != "about:blank" else _Empty() as page:
+            return page.read().decode("UTF-8", errors="replace")
+
+    def _getWindowHandle(self, session, body):
+        return "main"
+
+    def _getWindowHandles(self, session, body):
+        return ["main"]
+
+    def _switchToWindow(self, session, body):
+        if body.get("handle") != "main":
+            raise WebDriverError("no such window", f"No window {body.get('handle')}")
+
+    def _closeWindow(self, session, body):
+        return []
+
+    def _getWindowRect(self, session, body):
+        return {"x": 0, "y": 0, "width": 1280, "height": 1024}
+
+    def _setWindowRect(self, session, body):
+        return self._getWindowRect(session, body)
+
+    def _switchToFrame(self, session, body):
+        pass
+
+    def _switchToParentFrame(self, session, body):
+        pass
+
+    def _findElements(self, session, body, element=None):
+        root = session.element(element) if element else session.document
+        nodes = session.find(root, body["using"], body["value"])
+        return [session.reference(node) for node in nodes]
+
+    def _findElement(self, session, body, element=None):
+        found = self._findElements(session, body, element)
+        if not found:
+            raise WebDriverError(
+                "no such element", f"Unable to locate {body['using']}={body['value']}"
+            )
+        return found[0]
+
+    def _findChildElement(self, session, body, element):
+        return self._findElement(session, body, element)
+
+    def _findChildElements(self, session, body, element):
+        return self._findElements(session, body, element)
+
+    def _getActiveElement(self, session, body):
+        return session.reference(find_css(session.document, "body")[0])
+
+    def _getElementText(self, session, body, element):
+        return session.element(element).text
+
+    def _getElementTagName(self, session, body, element):
+        return session.element(element).tag
+
+    def _getElementAttribute(self, session, body, element, name):
+        return session.element(element).attrs.get(name)
+
+    def _getElementProperty(self, session, body, element, name):
+        node = session.element(element)
+        if name in ("checked", "selected", "disabled", "multiple"):
+            return name in node.attrs
+        if name == "value":
+            return node.attrs.get("value", node.text if node.tag == "option" else "")
+        return node.attrs.get(name)
+
+    def _getElementValueOfCssProperty(self, session, body, element, name):
+        return ""
+
+    def _getElementRect(self, session, body, element):
+        return {"x": 0, "y": 0, "width": 100, "height": 20}
+
+    def _isElementEnabled(self, session, body, element):
+        return "disabled" not in session.element(element).attrs
+
+    def _isElementSelected(self, session, body, element):
+        attrs = session.element(element).attrs
+        return "selected" in attrs or "checked" in attrs
+
+    def _clickElement(self, session, body, element):
+        node = session.element(element)
+        kind = node.attrs.get("type")
+        if node.tag == "option":
+            select = node.parent
+            if "multiple" in select.attrs:
+                _toggle(node.attrs, "selected")
+            else:
+                for option in find_css(select, "option"):
+                    option.attrs.pop("selected", None)
+                node.attrs["selected"] = ""
+        elif node.tag == "input" and kind == "checkbox":
+            _toggle(node.attrs, "checked")
+        elif node.tag == "input" and kind == "radio":
+            selector = f"input[name='{node.attrs.get('name', '')}']"
+            for radio in find_css(session.document, selector):
+                radio.attrs.pop("checked", None)
+            node.attrs["checked"] = ""
+
+    def _clearElement(self, session, body, element):
+        session.element(element).attrs["value"] = ""
+
+    def _sendKeysToElement(self, session, body, element):
+        attrs = session.element(element).attrs
+        attrs["value"] = attrs.get("value", "") + body.get("text", "")
+
+    def _executeScript(self, session, body):
+        script, arguments = body.get("script", ""), body.get("args", [])
+        if "/* getAttribute */" in script:
+            node = session.element(arguments[0][ELEMENT_KEY])
+            name = arguments[1]
+            if name in ("checked", "selected", "disabled", "multiple"):
+                return "true" if name in node.attrs else None
+            return node.attrs.get(name)
+        if "/* isDisplayed */" in script:
+            return True
+        return None
+
+    def _executeAsyncScript(self, session, body):
+        return None
+
+    def _getCookies(self, session, body):
+        return session.cookies
+
+    def _addCookie(self, session, body):
+        session.cookies = [
+            c for c in session.cookies if c["name"] != body["cookie"]["name"]
+        ]
+        session.cookies.append(body["cookie"])
+
+    def _deleteAllCookies(self, session, body):
+        session.cookies = []
+
+    def _deleteCookie(self, session, body, name):
+        session.cookies = [
+            cookie for cookie in session.cookies if cookie["name"] != name
+        ]
+
+    def _screenshot(self, session, body, element=None):
+        return SCREENSHOT
+
+    def _getAlertText(self, session, body):
+        raise WebDriverError("no such alert", "No alert is open.")
+
+
+class _Empty:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def read(self):
+        return b"<html><head></head><body></body></html>"
+
+
+def _toggle(attrs, name):
+    if name in attrs:
+        del attrs[name]
+    else:
+        attrs[name] = ""
+
+
+def _route(method, path, command):
+    path = path.replace("{session}", r"(?P<session>[^/]+)")
+    path = path.replace("{element}", r"(?P<element>[^/]+)")
+    path = path.replace("{name}", r"(?P<name>[^/]+)")
+    return method, re.compile(path), command
+
+
+ROUTES = [
+    _route("GET", "/status", "status"),
+    _route("POST", "/session", "newSession"),
+    _route("DELETE", "/session/{session}", "quit"),
+    _route("GET", "/session/{session}/timeouts", "getTimeouts"),
+    _route("POST", "/session/{session}/timeouts", "setTimeouts"),
+    _route("POST", "/session/{session}/url", "get"),
+    _route("GET", "/session/{session}/url", "getCurrentUrl"),
+    _route("POST", "/session/{session}/back", "goBack"),
+    _route("POST", "/session/{session}/forward", "goForward"),
+    _route("POST", "/session/{session}/refresh", "refresh"),
+    _route("GET", "/session/{session}/title", "getTitle"),
+    _route("GET", "/session/{session}/source", "getPageSource"),
+    _route("GET", "/session/{session}/window", "getWindowHandle"),
+    _route("POST", "/session/{session}/window", "switchToWindow"),
+    _route("DELETE", "/session/{session}/window", "closeWindow"),
+    _route("GET", "/session/{session}/window/handles", "getWindowHandles"),
+    _route("GET", "/session/{session}/window/rect", "getWindowRect"),
+    _route("POST", "/session/{session}/window/rect", "setWindowRect"),
+    _route("POST", "/session/{session}/window/maximize", "setWindowRect"),
+    _route("POST", "/session/{session}/frame", "switchToFrame"),
+    _route("POST", "/session/{session}/frame/parent", "switchToParentFrame"),
+    _route("POST", "/session/{session}/element", "findElement"),
+    _route("POST", "/session/{session}/elements", "findElements"),
+    _route("GET", "/session/{session}/element/active", "getActiveElement"),
+    _route("POST", "/session/{session}/element/{element}/element", "findChildElement"),
+    _route(
+        "POST", "/session/{session}/element/{element}/elements", "findChildElements"
+    ),
+    _route("GET", "/session/{session}/element/{element}/text", "getElementText"),
+    _route("GET", "/session/{session}/element/{element}/name", "getElementTagName"),
+    _route(
+        "GET",
+        "/session/{session}/element/{element}/attribute/{name}",
+        "getElementAttribute",
+    ),
+    _route(
+        "GET",
+        "/session/{session}/element/{element}/property/{name}",
+        "getElementProperty",
+    ),
+    _route(
+        "GET",
+        "/session/{session}/element/{element}/css/{name}",
+        "getElementValueOfCssProperty",
+    ),
+    _route("GET", "/session/{session}/element/{element}/rect", "getElementRect"),
+    _route("GET", "/session/{session}/element/{element}/enabled", "isElementEnabled"),
+    _route("GET", "/session/{session}/element/{element}/selected", "isElementSelected"),
+    _route("POST", "/session/{session}/element/{element}/click", "clickElement"),
+    _route("POST", "/session/{session}/element/{element}/clear", "clearElement"),
+    _route("POST", "/session/{session}/element/{element}/value", "sendKeysToElement"),
+    _route("GET", "/session/{session}/element/{element}/screenshot", "screenshot"),
+    _route("POST", "/session/{session}/execute/sync", "executeScript"),
+    _route("POST", "/session/{session}/execute/async", "executeAsyncScript"),
+    _route("GET", "/session/{session}/cookie", "getCookies"),
+    _route("POST", "/session/{session}/cookie", "addCookie"),
+    _route("DELETE", "/session/{session}/cookie", "deleteAllCookies"),
+    _route("DELETE", "/session/{session}/cookie/{name}", "deleteCookie"),
+    _route("GET", "/session/{session}/screenshot", "screenshot"),
+    _route("GET", "/session/{session}/alert/text", "getAlertText"),
+]
+
+
+def _handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately.
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_DELETE(self):
+            self._handle("DELETE")
+
+        def _handle(self, method):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+            # Remote URLs may have a prefix like `/wd/hub`.
+            match = re.search(r"/(session|status).*$", self.path)
+            path = match.group(0) if match else self.path
+            try:
+                status, value = 200, server.execute(method, path, body)
+            except WebDriverError as error:
+                status = error.status
+                value = {"error": error.error, "message": str(error), "stacktrace": ""}
+            data = json.dumps({"value": value}).encode("UTF-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def _parse_command_latency(values):
+    latency = {}
+    for value in values or []:
+        command, _, seconds = value.partition("=")
+        latency[command] = float(seconds)
+    return latency
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[2:]),
+    )
+    parser.add_argument("--port", default=4444, type=int)
+    parser.add_argument(
+        "--latency", default=0.0, type=float, help="Delay of every command in seconds."
+    )
+    parser.add_argument(
+        "--command-latency",
+        action="append",
+        help="Delay of one command as `command=seconds`. Can be given multiple times.",
+    )
+    args = parser.parse_args()
+    server = FakeWebDriverServer(
+        args.port, args.latency, _parse_command_latency(args.command_latency)
+    )
+    print(f"Fake WebDriver running at {server.url}")
+    server.start()
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
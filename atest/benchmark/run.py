@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+"""Script to run SeleniumLibrary benchmarks.
+
+Benchmarks use the same test server and html files as the acceptance
+tests. Each benchmark is run once to warm up and then the given number
+of rounds. Results are written as JSON containing the minimum, median,
+mean and maximum time of each benchmark in seconds, together with the
+used versions, browser and git commit.
+
+With `--fake`, browsers are opened using the fake WebDriver remote end in
+`fakewebdriver.py` instead of a real browser. Only benchmarks supported by
+it are run by default and, because the remote end answers immediately or
+after the latency given with `--latency`, results show the overhead of the
+library itself. Results then also contain the number of WebDriver commands
+each benchmark round sent.
+
+Results can be compared with results from an earlier run, for example,
+from the main branch. A benchmark has regressed if its median is more
+than the threshold percentage slower than in the earlier results. The
+script exits with the number of regressed benchmarks, so it can be used
+in CI.
+
+Examples:
+
+    run.py headlesschrome
+    run.py headlessfirefox --rounds 10 --output firefox.json
+    run.py headlesschrome --benchmark locator_throughput --benchmark table_read
+    run.py headlesschrome --compare baseline.json --threshold 20
+    run.py chrome --fake --latency 0.002 --output fake.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from robot import __version__ as robot_version
+from selenium import __version__ as selenium_version
+from selenium.webdriver.common.utils import free_port
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.normpath(os.path.join(ROOT_DIR, os.pardir, os.pardir, "src"))
+RESOURCES_DIR = os.path.join(ROOT_DIR, os.pardir, "resources")
+HTTP_SERVER_FILE = os.path.join(RESOURCES_DIR, "testserver", "testserver.py")
+RESULTS_FILE = os.path.join(ROOT_DIR, "results", "benchmark.json")
+
+sys.path.insert(0, SRC_DIR)
+
+from benchmarks import BENCHMARKS, FAKE_BENCHMARKS  # noqa: E402
+from fakewebdriver import FakeWebDriverServer  # noqa: E402
+
+from SeleniumLibrary import SeleniumLibrary  # noqa: E402
+
+
+@contextmanager
+def http_server(port):
+    process = subprocess.Popen(
+        [sys.executable, HTTP_SERVER_FILE, "start", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        wait_until_server_started(port)
+        yield
+    finally:
+        subprocess.call([sys.executable, HTTP_SERVER_FILE, "stop", "--port", str(port)])
+        process.wait()
+
+
+def wait_until_server_started(port):
+    for _ in range(50):
+        try:
+            urlopen(f"http://localhost:{port}/html/index.html").close()
+            return
+        except URLError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Test server did not start in port {port}.")
+
+
+@contextmanager
+def fake_webdriver(enabled, latency):
+    if not enabled:
+        yield None
+        return
+    with FakeWebDriverServer(latency=latency) as server:
+        yield server
+
+
+def run_benchmarks(browser, names, rounds, fake=False, latency=0.0):
+    port = free_port()
+
+    def page(name):
+        return f"http://localhost:{port}/html/{name}"
+
+    lib = SeleniumLibrary()
+    results = {}
+    with http_server(port), fake_webdriver(fake, latency) as server:
+        remote_url = server.url if server else False
+
+        def open_browser(url, alias=None, count=None):
+            if count is None:
+                return lib.open_browser(url, browser, alias, remote_url)
+            return lib.open_browsers(*[browser] * count, url=url, remote_url=remote_url)
+
+        open_browser(page("index.html"), alias="benchmark")
+        try:
+            for name in names:
+                function = BENCHMARKS[name]
+                function(lib, page, open_browser)
+                before = count_commands(server)
+                times = [function(lib, page, open_browser) for _ in range(rounds)]
+                commands = count_commands(server) - before if server else None
+                results[name] = summarize(times, commands)
+                print(f"{name:<20} {results[name]['median']:.4f} s")
+        finally:
+            lib.close_all_browsers()
+    return results
+
+
+def count_commands(server):
+    return sum(server.commands.values()) if server else 0
+
+
+def summarize(times, commands=None):
+    summary = {
+        "rounds": len(times),
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "max": max(times),
+    }
+    if commands is not None:
+        summary["commands"] = commands / len(times)
+    return summary
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path, browser, results, fake=False, latency=0.0):
+    data = {
+        "commit": get_commit(),
+        "time": datetime.now(timezone.utc).isoformat(),
+        "browser": browser,
+        "fake": {"latency": latency} if fake else None,
+        "python": platform.python_version(),
+        "robotframework": robot_version,
+        "selenium": selenium_version,
+        "results": results,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="UTF-8") as file:
+        json.dump(data, file, indent=2)
+    print(f"Results written to {path}")
+
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path, encoding="UTF-8") as file:
+        baseline = json.load(file)["results"]
+    regressions = 0
+    print(f"\nComparing to {baseline_path} with {threshold}% threshold:")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<20} no baseline")
+            continue
+        old, new = baseline[name]["median"], result["median"]
+        change = (new - old) / old * 100 if old else 0.0
+        regressed = change > threshold
+        regressions += regressed
+        status = "REGRESSION" if regressed else "ok"
+        print(f"{name:<20} {old:.4f} s -> {new:.4f} s ({change:+.1f}%) {status}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[2:]),
+    )
+    parser.add_argument(
+        "browser",
+        help="Any browser supported by the library, preferably headless "
+        "(e.g. `headlesschrome` or `headlessfirefox`).",
+    )
+    parser.add_argument(
+        "--fake",
+        action="store_true",
+        help="Use the fake WebDriver remote end instead of a real browser.",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Delay of each command in seconds when using `--fake`.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        "-b",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Benchmark to run. Can be given multiple times. By default, all "
+        "benchmarks are run, or all supported by the fake remote end with "
+        "`--fake`.",
+    )
+    parser.add_argument(
+        "--rounds", "-r", type=int, default=5, help="Rounds to run each benchmark."
+    )
+    parser.add_argument(
+        "--output", "-o", default=RESULTS_FILE, help="Where to write results."
+    )
+    parser.add_argument(
+        "--compare", "-c", help="Results of an earlier run to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        "-t",
+        type=float,
+        default=10.0,
+        help="Allowed slowdown of the median in percents when comparing.",
+    )
+    args = parser.parse_args()
+    names = args.benchmark or [
+        name for name in BENCHMARKS if not args.fake or name in FAKE_BENCHMARKS
+    ]
+    results = run_benchmarks(args.browser, names, args.rounds, args.fake, args.latency)
+    write_results(args.output, args.browser, results, args.fake, args.latency)
+    failures = compare(results, args.compare, args.threshold) if args.compare else 0
+    sys.exit(failures)
@@ -33,28 +33,40 @@ from SeleniumLibrary.errors import NoOpenBrowser, PluginError
 from SeleniumLibrary.keywords import (
     AlertKeywords,
     BrowserManagementKeywords,
+    BrowserPool,
+    CommandPipeline,
+    CommandStatistics,
+    CommandTrace,
     CookieKeywords,
     ElementKeywords,
     ExpectedConditionKeywords,
     FormElementKeywords,
     FrameKeywords,
     JavaScriptKeywords,
+    RetryMiddleware,
     RunOnFailureKeywords,
     ScreenshotKeywords,
     SelectElementKeywords,
+    SpeedMiddleware,
     TableElementKeywords,
     WaitingKeywords,
     WebDriverCache,
     WindowKeywords,
 )
+from SeleniumLibrary.keywords.frames import FrameCache
 from SeleniumLibrary.keywords.screenshot import BASE64, EMBED
-from SeleniumLibrary.locators import ElementFinder
+from SeleniumLibrary.keywords.tableelement import TableSnapshotCache
+from SeleniumLibrary.keywords.webdrivertools.browserpool import get_reset
+from SeleniumLibrary.locators import ElementFinder, WindowInfoCache
 from SeleniumLibrary.utils import (
     LibraryListener,
+    Polling,
     _convert_delay,
     _convert_timeout,
+    is_noney,
     is_truthy,
 )
+from SeleniumLibrary.utils.performance import PerformanceRecorder, resolve_output_path
 
 __version__ = "6.8.0"
 
@@ -221,6 +233,19 @@ class SeleniumLibrary(DynamicCore):
 
     Chaining locators in new in SeleniumLibrary 5.0
 
+    By default, each locator in the chain is resolved with a separate WebDriver
+    call. When ``chain_locators_in_browser`` is enabled in library `importing`,
+    chains that only use ``identifier``, ``id``, ``name``, ``xpath``,
+    ``link``, ``partial link``, ``css``, ``class`` and ``tag`` strategies are
+    resolved with a single JavaScript call in the browser, which saves a
+    round trip per chained locator, especially with remote browsers. Chains
+    that contain other strategies, custom locators or WebElements are always
+    resolved one locator at a time.
+
+    | `Library` | SeleniumLibrary | chain_locators_in_browser=True |
+
+    Resolving chains in the browser is new in SeleniumLibrary 6.9.
+
     == Using WebElements ==
 
     In addition to specifying a locator as a string, it is possible to use
@@ -230,6 +255,33 @@ class SeleniumLibrary(DynamicCore):
     | ${elem} =       | `Get WebElement` | id:example |
     | `Click Element` | ${elem}          |            |
 
+    == Element cache ==
+
+    By default, every keyword locates its element again, even if the previous
+    keyword used the same locator. When the element cache is enabled, the
+    element found with a locator is reused by later keywords using the same
+    locator. Before a cached element is used, it is checked to still be
+    attached to the page, and if it is not, the element is located again.
+
+    The cache is cleared when the page or the browsing context changes, for
+    example by `Go To`, `Go Back`, `Reload Page`, `Switch Window`,
+    `Select Frame`, `Unselect Frame` and `Switch Browser`. Keywords which
+    return more than one element, like `Get WebElements`, never use the cache.
+
+    Because a cached element is reused as long as it is attached to the page,
+    the cache should not be used when the page changes which element a
+    locator matches without replacing the old element, for example when
+    classes are toggled on existing elements.
+
+    The cache is disabled by default. It can be enabled with the
+    ``element_cache`` argument in library `importing` or with the
+    `Set Element Cache` keyword, and cleared with the `Clear Element Cache`
+    keyword.
+
+    | `Library` | SeleniumLibrary | element_cache=True |
+
+    The element cache is new in SeleniumLibrary 6.9.
+
     == Custom locators ==
 
     If more complex lookups are required than what is provided through the
@@ -275,6 +327,117 @@ class SeleniumLibrary(DynamicCore):
     sessions or profiles. Typically when the browser starts, it
     creates a single window which is shown to the user.
 
+    == Browser pool ==
+
+    Starting a browser often takes seconds. When the ``browser_pool``
+    argument is given in library `importing`, that many browsers are
+    started in advance in background threads for each different way of
+    calling `Open Browser`, meaning each combination of browser, options,
+    remote URL and other arguments. `Open Browser` then takes a browser
+    from the pool and a new one is started in the background to replace
+    it.
+
+    `Close Browser` and `Close All Browsers` do not quit browsers taken
+    from the pool if there is room for them in the pool. Instead, extra
+    windows are closed, cookies and storage of the current page are
+    cleared and ``about:blank`` is opened, and the browser is returned to
+    the pool. With Chromium based browsers cookies of all sites are
+    cleared. Other state, for example the browser history, is not reset.
+    The reset can be configured like when `reusing browsers`.
+    Browsers left in the pool are quit when the test run ends. Browsers
+    opened with `Create Webdriver` are never pooled.
+
+    `Get Browser Pool Statistics` tells how often browsers were taken
+    from the pool.
+
+    | `Library` | SeleniumLibrary | browser_pool=2 |
+
+    The browser pool is new in SeleniumLibrary 6.9.
+
+    == Reusing browsers ==
+
+    When suites open and close their own browsers, starting and quitting
+    browsers can take a considerable part of the execution time. When the
+    ``reuse_browsers`` argument is given a true value in library
+    `importing`, `Close Browser` and `Close All Browsers` do not quit
+    browsers opened with `Open Browser`. Instead, the browser is reset and
+    kept, and a later `Open Browser` call with the same arguments uses it
+    instead of starting a new browser. It can be used together with the
+    `browser pool`. Kept browsers are quit when the test run ends.
+
+    What is reset can be configured with the ``browser_reset`` argument
+    as steps separated with semicolons. The steps are always run in the
+    order below and by default all of them are run:
+    - ``windows``: Close all but the first window.
+    - ``storage``: Clear local and session storage of the current page.
+    - ``cookies``: Delete cookies of the current page. With Chromium based
+      browsers cookies of all sites are deleted.
+    - ``blank``: Open ``about:blank``.
+    The value ``NONE`` disables the reset.
+
+    | `Library` | SeleniumLibrary | reuse_browsers=True |                              |
+    | `Library` | SeleniumLibrary | reuse_browsers=True | browser_reset=windows;cookies |
+
+    Reusing browsers is new in SeleniumLibrary 6.9.
+
+    == Performance report ==
+
+    When the ``performance_report`` argument is given in library
+    `importing`, the library records for each keyword call how long the
+    keyword took, how much of that time was used by WebDriver commands,
+    how many commands were sent, how much time was used by commands finding
+    elements and how long the keyword slept while waiting. When the test run ends, a report
+    with statistics per test, per suite and for the whole run is written
+    to the given file. The report is a CSV file if the path ends with
+    ``.csv`` and a JSON file otherwise. A relative path is relative to the
+    output directory.
+
+    Each row of the report contains the ``scope`` (``test``, ``suite`` or
+    ``total``), the long ``name`` of the test or suite, the ``keyword``, the
+    number of ``calls``, the total ``duration`` with its 50th, 90th and 95th
+    percentile and maximum, and the total ``command_time``, ``commands``,
+    ``locator_time`` and ``wait_time``. Times are in seconds. Times of
+    keywords run by other keywords, for example, by plugins, are included
+    in both keywords.
+
+    | `Library` | SeleniumLibrary | performance_report=selenium-performance.csv |
+
+    The performance report is new in SeleniumLibrary 6.9.
+
+    == Command trace ==
+
+    When the ``command_trace`` argument is given in library `importing`,
+    every WebDriver command sent to browsers is written to the given file
+    as it is executed. The trace is newline-delimited JSON and it is
+    compressed with gzip if the path ends with ``.gz``. A relative path is
+    relative to the output directory. Each line contains the start
+    ``timestamp`` as seconds since the epoch, the ``duration`` in seconds,
+    the ``command`` name, the browser ``session`` id, the ``request`` and
+    ``response`` sizes in bytes, the running ``keyword``, the long names of
+    the running ``suite`` and ``test`` and, if the command failed, the
+    ``error``.
+
+    The ``selib trace`` command summarizes a trace by listing the slowest
+    commands and the commands and keywords using most time in total.
+
+    | `Library` | SeleniumLibrary | command_trace=commands.ndjson.gz |
+
+    The command trace is new in SeleniumLibrary 6.9.
+
+    == Command retries ==
+
+    When the ``command_retries`` argument is given in library `importing`,
+    WebDriver commands failing because of problems in the connection to the
+    driver, for example when a Selenium Grid node is restarting, are retried
+    that many times after waiting half a second. The connection may fail
+    also after the browser has received the command, so commands that change
+    the page, like clicks, may be executed twice. By default, commands are
+    not retried.
+
+    | `Library` | SeleniumLibrary | command_retries=2 |
+
+    Command retries are new in SeleniumLibrary 6.9.
+
     == Window ==
 
     Windows are the part of a browser that loads the web site and presents
@@ -326,6 +489,28 @@ class SeleniumLibrary(DynamicCore):
     https://robocon.io/, https://github.com/robotframework/'
     and 'https://github.com/.
 
+    == Window information cache ==
+
+    Keywords needing titles, names or URLs of all windows, like
+    `Get Window Titles` and `Switch Window` with a ``title``, ``name``,
+    ``url`` or default strategy, need to switch to every window to read them.
+    With Chromium based browsers, titles and URLs are read with one
+    DevTools command without switching windows, but names and ids still
+    require switching.
+
+    When the ``window_info_cache`` argument is given in library `importing`,
+    window information read by switching windows is reused for the given
+    time. Cached information is used only if the browser still has the same
+    windows, and it is cleared by `Go To`, `Go Back`, `Reload Page`,
+    `Close Window`, `Close Browser` and `Close All Browsers`. Other keywords,
+    for example, clicking links or `Execute Javascript`, can change titles
+    and URLs without clearing the cache, so the time should be short. The
+    cache is disabled by default.
+
+    | `Library` | SeleniumLibrary | window_info_cache=2 seconds |
+
+    The window information cache is new in SeleniumLibrary 6.9.
+
     = Browser and Driver options and service class =
 
     This section talks about how to configure either the browser or
@@ -491,6 +676,58 @@ class SeleniumLibrary(DynamicCore):
 
     See `time format` below for supported syntax.
 
+    == Event driven waits ==
+
+    By default, ``Wait Until ...`` keywords check their condition every
+    200 milliseconds. When ``event_driven_waits`` is enabled in library
+    `importing`, keywords that wait for elements or text, like
+    `Wait Until Page Contains Element`, `Wait Until Element Is Visible` and
+    `Wait Until Element Contains`, instead wait in the browser until the
+    DOM of the current page or frame changes and then check the condition
+    again. This makes the keywords return sooner and sends fewer commands
+    to the browser during long waits. Changes made while the condition is
+    being checked are noticed as well, and the condition is checked at most
+    every 50 milliseconds even if the DOM changes all the time.
+
+    The condition is checked at least once a second also when the DOM does
+    not change, so conditions changed by, for example, CSS animations still
+    work. If waiting in the browser fails, for example because the script
+    timeout is shorter than a second or the page is navigating, the keyword
+    falls back to checking the condition every 200 milliseconds. Waits for
+    the location and `Wait For Condition` always use polling.
+
+    | `Library` | SeleniumLibrary | event_driven_waits=True |
+
+    Event driven waits are new in SeleniumLibrary 6.9.
+
+    == Polling ==
+
+    ``Wait Until ...`` keywords check their condition every 200 milliseconds
+    and `Wait For Expected Condition` every 100 milliseconds by default. The
+    polling strategy can be changed for all these keywords with the
+    ``polling`` argument in library `importing` and for a single keyword
+    with its ``polling`` argument.
+
+    A polling strategy given as a `time format` value, for example
+    ``50 ms``, checks the condition with a fixed interval. The value
+    ``adaptive`` starts with short intervals, so that conditions which
+    become true quickly are noticed quickly, and makes the interval longer
+    after every check, so that long waits do not send a lot of commands to
+    the browser. The adaptive strategy can be configured with ``initial``,
+    ``maximum``, ``factor`` and ``jitter`` options, separated with
+    semicolons. Each interval is ``factor`` times the previous one, but
+    not longer than ``maximum``, and it is randomly changed by at most
+    ``jitter`` times its length so that parallel tests do not poll at the
+    same moment. Options that are not given use the ``adaptive`` values:
+    ``initial=20 ms;maximum=2 s;factor=1.5;jitter=0.1``. If ``maximum`` is
+    not given, it is never shorter than ``initial``.
+
+    | `Library`                          | SeleniumLibrary | polling=adaptive |
+    | `Wait Until Element Is Visible`    | id:result       | polling=50 ms    |
+    | `Wait Until Page Contains Element` | id:report       | 5 min | polling=initial=1 s;maximum=10 s |
+
+    The polling strategy is new in SeleniumLibrary 6.9.
+
     == Time format ==
 
     All timeouts and waits can be given as numbers considered seconds
@@ -605,6 +842,17 @@ class SeleniumLibrary(DynamicCore):
         page_load_timeout=timedelta(minutes=5),
         action_chain_delay=timedelta(seconds=0.25),
         language: str | None = None,
+        chain_locators_in_browser: bool = False,
+        element_cache: bool = False,
+        event_driven_waits: bool = False,
+        polling: str | None = None,
+        browser_pool: int = 0,
+        reuse_browsers: bool = False,
+        browser_reset: str | None = None,
+        performance_report: str | None = None,
+        command_trace: str | None = None,
+        window_info_cache=timedelta(seconds=0),
+        command_retries: int = 0,
     ):
         """SeleniumLibrary can be imported with several optional arguments.
 
@@ -629,12 +877,50 @@ class SeleniumLibrary(DynamicCore):
           Default value for `ActionChains` delay to wait in between actions.
         - ``language``:
           Defines language which is used to translate keyword names and documentation.
+        - ``chain_locators_in_browser``:
+          Resolves chained locators with a single JavaScript call. See
+          `Chaining locators` for details.
+        - ``element_cache``:
+          Reuses found elements when the same locator is used again. See
+          `Element cache` for details.
+        - ``event_driven_waits``:
+          Wakes up ``Wait Until ...`` keywords when the page changes instead
+          of polling. See `Event driven waits` for details.
+        - ``polling``:
+          Default polling strategy for ``Wait ...`` keywords. See `Polling`
+          for details.
+        - ``browser_pool``:
+          Number of browsers to start in advance for `Open Browser`. See
+          `Browser pool` for details.
+        - ``reuse_browsers``:
+          Reuses closed browsers when a browser is opened the same way
+          again. See `Reusing browsers` for details.
+        - ``browser_reset``:
+          What to reset when a pooled or reused browser is closed. See
+          `Reusing browsers` for details.
+        - ``performance_report``:
+          File where to write statistics about time used by keywords. See
+          `Performance report` for details.
+        - ``command_trace``:
+          File where to write all WebDriver commands. See `Command trace`
+          for details.
+        - ``window_info_cache``:
+          How long to reuse window titles, names and URLs. See
+          `Window information cache` for details.
+        - ``command_retries``:
+          How many times to retry WebDriver commands failing because of
+          connection problems. See `Command retries` for details.
         """
         self.timeout = _convert_timeout(timeout)
         self.implicit_wait = _convert_timeout(implicit_wait)
         self.action_chain_delay = _convert_delay(action_chain_delay)
         self.page_load_timeout = _convert_timeout(page_load_timeout)
         self.speed = 0.0
+        self._current_keyword = None
+        self.command_statistics = CommandStatistics(lambda: self._current_keyword)
+        self.command_pipeline = self._create_command_pipeline(command_retries)
+        self.event_driven_waits = event_driven_waits
+        self.polling = None if is_noney(polling) else Polling.parse(polling)
         self.run_on_failure_keyword = RunOnFailureKeywords.resolve_keyword(
             run_on_failure
         )
@@ -642,6 +928,11 @@ class SeleniumLibrary(DynamicCore):
         self.screenshot_root_directory = screenshot_root_directory
         self._resolve_screenshot_root_directory()
         self._element_finder = ElementFinder(self)
+        self._element_finder.chain_locators_in_browser = chain_locators_in_browser
+        self._element_finder.element_cache = element_cache
+        self._window_info_cache = WindowInfoCache(_convert_timeout(window_info_cache))
+        self._frame_cache = FrameCache()
+        self._table_snapshots = TableSnapshotCache()
         self._plugin_keywords = []
         libraries = [
             AlertKeywords(self),
@@ -659,7 +950,8 @@ class SeleniumLibrary(DynamicCore):
             WaitingKeywords(self),
             WindowKeywords(self),
         ]
-        self.ROBOT_LIBRARY_LISTENER = LibraryListener()
+        self.ROBOT_LIBRARY_LISTENER = self._listener = LibraryListener()
+        self._listener.scope_end_actions.append(self._table_snapshots.clear)
         self._running_keyword = None
         self.event_firing_webdriver = None
         if is_truthy(event_firing_webdriver):
@@ -670,15 +962,42 @@ class SeleniumLibrary(DynamicCore):
             self._plugins = plugin_libs
             libraries = libraries + plugin_libs
         self._drivers = WebDriverCache()
+        if browser_pool > 0 or reuse_browsers:
+            self._drivers.pool = BrowserPool(
+                browser_pool, get_reset(browser_reset), reuse_browsers
+            )
+            self._listener.close_actions.append(self._drivers.pool.close)
+        self.performance = None
+        if not is_noney(performance_report):
+            self.performance = PerformanceRecorder(
+                performance_report, lambda: self._listener.scope
+            )
+            self.command_pipeline.middlewares.append(self.performance)
+            self._listener.close_actions.append(self.performance.write)
+        if not is_noney(command_trace):
+            trace = CommandTrace(
+                resolve_output_path(command_trace),
+                lambda: self._current_keyword,
+                lambda: self._listener.scope,
+            )
+            self.command_pipeline.middlewares.append(trace)
+            self._listener.close_actions.append(trace.close)
         translation_file = self._get_translation(language)
         DynamicCore.__init__(self, libraries, translation_file)
 
     def run_keyword(self, name: str, args: tuple, kwargs: dict):
+        parent, self._current_keyword = self._current_keyword, name
+        if self.performance:
+            self.performance.start_keyword()
         try:
             return DynamicCore.run_keyword(self, name, args, kwargs)
         except Exception:
             self.failure_occurred()
             raise
+        finally:
+            self._current_keyword = parent
+            if self.performance:
+                self.performance.end_keyword(name)
 
     def get_keyword_tags(self, name: str) -> list:
         tags = list(DynamicCore.get_keyword_tags(self, name))
@@ -720,6 +1039,8 @@ class SeleniumLibrary(DynamicCore):
         :return: The index of the `WebDriver` instance.
         :rtype: int
         """
+        self._element_finder.clear_element_cache()
+        self.command_pipeline.install(driver)
         return self._drivers.register(driver, alias)
 
     def failure_occurred(self):
@@ -808,6 +1129,13 @@ class SeleniumLibrary(DynamicCore):
             libraries.append(plugin)
         return libraries
 
+    def _create_command_pipeline(self, retries: int) -> CommandPipeline:
+        middlewares = [SpeedMiddleware(), self.command_statistics]
+        if retries > 0:
+            # First, so that all other middlewares see every attempt.
+            middlewares.insert(0, RetryMiddleware(retries))
+        return CommandPipeline(middlewares)
+
     def _parse_listener(self, event_firing_webdriver):
         listener_module = self._string_to_modules(event_firing_webdriver)
         listener_count = len(listener_module)
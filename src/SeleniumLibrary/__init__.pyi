@@ -6,7 +6,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 class SeleniumLibrary:
-    def __init__(self, timeout = timedelta(seconds=5.0), implicit_wait = timedelta(seconds=0.0), run_on_failure = 'Capture Page Screenshot', screenshot_root_directory: Optional[Optional] = None, plugins: Optional[Optional] = None, event_firing_webdriver: Optional[Optional] = None, page_load_timeout = timedelta(seconds=300.0), action_chain_delay = timedelta(seconds=0.25), language: Optional[Optional] = None): ...
+    def __init__(self, timeout = timedelta(seconds=5.0), implicit_wait = timedelta(seconds=0.0), run_on_failure = 'Capture Page Screenshot', screenshot_root_directory: Optional[Optional] = None, plugins: Optional[Optional] = None, event_firing_webdriver: Optional[Optional] = None, page_load_timeout = timedelta(seconds=300.0), action_chain_delay = timedelta(seconds=0.25), language: Optional[Optional] = None, chain_locators_in_browser: bool = False, element_cache: bool = False, event_driven_waits: bool = False, polling: Optional[Optional] = None, browser_pool: int = 0, reuse_browsers: bool = False, browser_reset: Optional[Optional] = None, performance_report: Optional[Optional] = None, command_trace: Optional[Optional] = None, window_info_cache = timedelta(seconds=0.0), command_retries: int = 0): ...
     def add_cookie(self, name: str, value: str, path: Optional[Optional] = None, domain: Optional[Optional] = None, secure: Optional[Optional] = None, expiry: Optional[Optional] = None): ...
     def add_location_strategy(self, strategy_name: str, strategy_keyword: str, persist: bool = False): ...
     def alert_should_be_present(self, text: str = '', action: str = 'ACCEPT', timeout: Optional[Optional] = None): ...
@@ -14,10 +14,13 @@ class SeleniumLibrary:
     def assign_id_to_element(self, locator: Union, id: str): ...
     def capture_element_screenshot(self, locator: Union, filename: str = 'selenium-element-screenshot-{index}.png'): ...
     def capture_page_screenshot(self, filename: str = 'selenium-screenshot-{index}.png'): ...
+    def capture_table_snapshot(self, locator: Union): ...
     def checkbox_should_be_selected(self, locator: Union): ...
     def checkbox_should_not_be_selected(self, locator: Union): ...
     def choose_file(self, locator: Union, file_path: str): ...
+    def clear_element_cache(self): ...
     def clear_element_text(self, locator: Union): ...
+    def clear_table_snapshots(self, locator: Optional[Optional] = None): ...
     def click_button(self, locator: Union, modifier: Union = False): ...
     def click_element(self, locator: Union, modifier: Union = False, action_chain: bool = False): ...
     def click_element_at_coordinates(self, locator: Union, xoffset: int, yoffset: int): ...
@@ -47,11 +50,14 @@ class SeleniumLibrary:
     def element_text_should_not_be(self, locator: Union, not_expected: Optional, message: Optional[Optional] = None, ignore_case: bool = False): ...
     def execute_async_javascript(self, *code: Any): ...
     def execute_javascript(self, *code: Any): ...
+    def fill_form(self, fields: dict, javascript: bool = False, clear: bool = True): ...
     def frame_should_contain(self, locator: Union, text: str, loglevel: str = 'TRACE'): ...
     def get_action_chain_delay(self): ...
     def get_all_links(self): ...
     def get_browser_aliases(self): ...
     def get_browser_ids(self): ...
+    def get_browser_pool_statistics(self): ...
+    def get_command_statistics(self, reset: bool = False): ...
     def get_cookie(self, name: str): ...
     def get_cookies(self, as_dict: bool = False): ...
     def get_dom_attribute(self, locator: Union, attribute: str): ...
@@ -73,7 +79,8 @@ class SeleniumLibrary:
     def get_selenium_timeout(self): ...
     def get_session_id(self): ...
     def get_source(self): ...
-    def get_table_cell(self, locator: Union, row: int, column: int, loglevel: str = 'TRACE'): ...
+    def get_table_cell(self, locator: Union, row: int, column: Union, loglevel: str = 'TRACE'): ...
+    def get_table_data(self, locator: Union, expand_spans: bool = False): ...
     def get_text(self, locator: Union): ...
     def get_title(self): ...
     def get_value(self, locator: Union): ...
@@ -108,6 +115,7 @@ class SeleniumLibrary:
     def mouse_over(self, locator: Union): ...
     def mouse_up(self, locator: Union): ...
     def open_browser(self, url: Optional[Optional] = None, browser: str = 'firefox', alias: Optional[Optional] = None, remote_url: Union = False, desired_capabilities: Optional[Union] = None, ff_profile_dir: Optional[Union] = None, options: Optional[Any] = None, service_log_path: Optional[Optional] = None, executable_path: Optional[Optional] = None, service: Optional[Any] = None): ...
+    def open_browsers(self, *browsers: Union, url: Optional[Optional] = None, remote_url: Union = False, options: Optional[Any] = None): ...
     def open_context_menu(self, locator: Union): ...
     def page_should_contain(self, text: str, loglevel: str = 'TRACE'): ...
     def page_should_contain_button(self, locator: Union, message: Optional[Optional] = None, loglevel: str = 'TRACE'): ...
@@ -132,6 +140,7 @@ class SeleniumLibrary:
     def print_page_as_pdf(self, filename: str = 'selenium-page-{index}.pdf', background: Optional[Optional] = None, margin_bottom: Optional[Optional] = None, margin_left: Optional[Optional] = None, margin_right: Optional[Optional] = None, margin_top: Optional[Optional] = None, orientation: Optional[Optional] = None, page_height: Optional[Optional] = None, page_ranges: Optional[Optional] = None, page_width: Optional[Optional] = None, scale: Optional[Optional] = None, shrink_to_fit: Optional[Optional] = None): ...
     def radio_button_should_be_set_to(self, group_name: str, value: str): ...
     def radio_button_should_not_be_selected(self, group_name: str): ...
+    def refresh_table_snapshot(self, locator: Union): ...
     def register_keyword_to_run_on_failure(self, keyword: Optional): ...
     def reload_page(self): ...
     def remove_location_strategy(self, strategy_name: str): ...
@@ -145,6 +154,7 @@ class SeleniumLibrary:
     def select_radio_button(self, group_name: str, value: str): ...
     def set_action_chain_delay(self, value: timedelta): ...
     def set_browser_implicit_wait(self, value: timedelta): ...
+    def set_element_cache(self, enabled: bool): ...
     def set_focus_to_element(self, locator: Union): ...
     def set_screenshot_directory(self, path: Optional): ...
     def set_selenium_implicit_wait(self, value: timedelta): ...
@@ -157,8 +167,8 @@ class SeleniumLibrary:
     def submit_form(self, locator: Optional[Union] = None): ...
     def switch_browser(self, index_or_alias: str): ...
     def switch_window(self, locator: Union = MAIN, timeout: Optional[Optional] = None, browser: str = 'CURRENT'): ...
-    def table_cell_should_contain(self, locator: Union, row: int, column: int, expected: str, loglevel: str = 'TRACE'): ...
-    def table_column_should_contain(self, locator: Union, column: int, expected: str, loglevel: str = 'TRACE'): ...
+    def table_cell_should_contain(self, locator: Union, row: int, column: Union, expected: str, loglevel: str = 'TRACE'): ...
+    def table_column_should_contain(self, locator: Union, column: Union, expected: str, loglevel: str = 'TRACE'): ...
     def table_footer_should_contain(self, locator: Union, expected: str, loglevel: str = 'TRACE'): ...
     def table_header_should_contain(self, locator: Union, expected: str, loglevel: str = 'TRACE'): ...
     def table_row_should_contain(self, locator: Union, row: int, expected: str, loglevel: str = 'TRACE'): ...
@@ -174,21 +184,21 @@ class SeleniumLibrary:
     def unselect_from_list_by_index(self, locator: Union, *indexes: str): ...
     def unselect_from_list_by_label(self, locator: Union, *labels: str): ...
     def unselect_from_list_by_value(self, locator: Union, *values: str): ...
-    def wait_for_condition(self, condition: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_for_expected_condition(self, condition: string, *args, timeout: Optional = 10): ...
-    def wait_until_element_contains(self, locator: Union, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_until_element_does_not_contain(self, locator: Union, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_until_element_is_enabled(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_until_element_is_not_visible(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_until_element_is_visible(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_until_location_contains(self, expected: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None): ...
-    def wait_until_location_does_not_contain(self, location: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None): ...
-    def wait_until_location_is(self, expected: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None): ...
-    def wait_until_location_is_not(self, location: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None): ...
-    def wait_until_page_contains(self, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_until_page_contains_element(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None, limit: Optional[Optional] = None): ...
-    def wait_until_page_does_not_contain(self, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None): ...
-    def wait_until_page_does_not_contain_element(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None, limit: Optional[Optional] = None): ...
+    def wait_for_condition(self, condition: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_for_expected_condition(self, condition: string, *args, timeout: Optional = 10, polling: Optional[Optional] = None): ...
+    def wait_until_element_contains(self, locator: Union, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_element_does_not_contain(self, locator: Union, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_element_is_enabled(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_element_is_not_visible(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_element_is_visible(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_location_contains(self, expected: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_location_does_not_contain(self, location: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_location_is(self, expected: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_location_is_not(self, location: str, timeout: Optional[Optional] = None, message: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_page_contains(self, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_page_contains_element(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None, limit: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_page_does_not_contain(self, text: str, timeout: Optional[Optional] = None, error: Optional[Optional] = None, polling: Optional[Optional] = None): ...
+    def wait_until_page_does_not_contain_element(self, locator: Union, timeout: Optional[Optional] = None, error: Optional[Optional] = None, limit: Optional[Optional] = None, polling: Optional[Optional] = None): ...
     # methods from library.
     def add_library_components(self, library_components): ...
     def get_keyword_names(self): ...
@@ -22,7 +22,7 @@ from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
 from SeleniumLibrary.utils import is_noney
 
-from ..utils import _convert_timeout
+from ..utils import Polling, _convert_timeout
 from .context import ContextAware
 
 
@@ -80,6 +80,13 @@ class LibraryComponent(ContextAware):
             return self.ctx.timeout
         return _convert_timeout(timeout)
 
+    def get_polling(
+        self, polling: str | Polling | None = None, default: Polling | None = None
+    ) -> Polling:
+        if polling is not None:
+            return Polling.parse(polling)
+        return self.ctx.polling or default
+
     @property
     def log_dir(self):
         try:
@@ -20,6 +20,7 @@ from pathlib import Path
 import click
 
 from .get_versions import get_version
+from .trace import summarize_trace
 from .translation import compare_translation, get_library_translation
 
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
@@ -36,6 +37,9 @@ def cli():
     translation
        will generate template translation json file from library keywords.
 
+    trace
+       will summarize a WebDriver command trace file.
+
     See each command argument help for more details what (optional) arguments that command supports.
     """
     pass
@@ -100,5 +104,32 @@ def translation(
         click.echo(f"Translation file created in {filename.absolute()}")
 
 
+@cli.command()
+@click.argument(
+    "filename",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    required=True,
+)
+@click.option(
+    "--top",
+    help="How many commands and keywords to list.",
+    default=10,
+    type=click.IntRange(min=1),
+    show_default=True,
+)
+def trace(filename: Path, top: int = 10):
+    """Summarize a WebDriver command trace file.
+
+    The filename argument is a trace file written by the library when the
+    command_trace argument is used in the library import. Also gzip
+    compressed traces ending with .gz are supported.
+
+    The command will print the slowest commands, and the commands and
+    keywords that used the most time in WebDriver commands in total.
+    """
+    for line in summarize_trace(filename, top):
+        click.echo(line)
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,111 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import heapq
+import json
+from collections import defaultdict
+from pathlib import Path
+
+
+def _read_trace(filename: Path):
+    opener = gzip.open if filename.suffix.lower() == ".gz" else open
+    with opener(filename, "rt", encoding="UTF-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _format_table(heading: tuple, rows: list[tuple]) -> list[str]:
+    rows = [tuple(str(cell) for cell in row) for row in rows]
+    widths = [
+        max(len(row[index]) for row in [heading, *rows])
+        for index in range(len(heading))
+    ]
+    lines = [heading, tuple("-" * width for width in widths), *rows]
+    return [
+        "| "
+        + " | ".join(
+            cell.ljust(width) for cell, width in zip(line, widths, strict=True)
+        )
+        + " |"
+        for line in lines
+    ]
+
+
+def _totals_table(name: str, totals: dict, top: int) -> list[str]:
+    rows = heapq.nlargest(top, totals.items(), key=lambda item: item[1][1])
+    return _format_table(
+        (name, "Count", "Total (s)", "Average (s)"),
+        [
+            (key, count, f"{total:.3f}", f"{total / count:.3f}")
+            for key, (count, total) in rows
+        ],
+    )
+
+
+def summarize_trace(filename: Path, top: int = 10) -> list[str]:
+    """Summarizes a command trace written by the ``command_trace`` import argument.
+
+    Returns lines listing the slowest commands, and the commands and
+    keywords with the most time used by commands. The trace is read one
+    line at a time, so also large traces can be summarized.
+    """
+    if top < 1:
+        raise ValueError(f"Number of listed items must be at least 1, got {top}.")
+    slowest = []
+    commands = defaultdict(lambda: [0, 0.0])
+    keywords = defaultdict(lambda: [0, 0.0])
+    count = 0
+    for index, record in enumerate(_read_trace(filename)):
+        count += 1
+        duration = record["duration"]
+        item = (duration, index, record)
+        if len(slowest) < top:
+            heapq.heappush(slowest, item)
+        elif duration > slowest[0][0]:
+            heapq.heapreplace(slowest, item)
+        for totals, key in (
+            (commands, record["command"]),
+            (keywords, record["keyword"]),
+        ):
+            totals[key][0] += 1
+            totals[key][1] += duration
+    lines = [f"Trace contains {count} command{'' if count == 1 else 's'}."]
+    if not count:
+        return lines
+    lines.extend(["", "Slowest commands:"])
+    lines.extend(
+        _format_table(
+            ("Command", "Duration (s)", "Keyword", "Test"),
+            [
+                (
+                    record["command"],
+                    f"{duration:.3f}",
+                    record["keyword"],
+                    record["test"],
+                )
+                for duration, _, record in sorted(
+                    slowest, key=lambda item: (-item[0], item[1])
+                )
+            ],
+        )
+    )
+    lines.extend(["", "Commands with most time in total:"])
+    lines.extend(_totals_table("Command", commands, top))
+    lines.extend(["", "Keywords with most command time in total:"])
+    lines.extend(_totals_table("Keyword", keywords, top))
+    return lines
@@ -27,6 +27,12 @@ from .screenshot import ScreenshotKeywords  # noqa
 from .selectelement import SelectElementKeywords  # noqa
 from .tableelement import TableElementKeywords  # noqa
 from .waiting import WaitingKeywords  # noqa
+from .webdrivertools import BrowserPool  # noqa
+from .webdrivertools import CommandPipeline  # noqa
+from .webdrivertools import CommandStatistics  # noqa
+from .webdrivertools import CommandTrace  # noqa
+from .webdrivertools import RetryMiddleware  # noqa
+from .webdrivertools import SpeedMiddleware  # noqa
 from .webdrivertools import WebDriverCache  # noqa
 from .webdrivertools import WebDriverCreator  # noqa
 from .window import WindowKeywords  # noqa
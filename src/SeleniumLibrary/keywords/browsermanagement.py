@@ -14,16 +14,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import time
-import types
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from functools import partial
 from typing import Any
 
+from robot.utils import printable_name
 from selenium import webdriver
 from selenium.webdriver import FirefoxProfile
 from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
 
 from SeleniumLibrary.base import LibraryComponent, keyword
+from SeleniumLibrary.keywords.frames import clear_frame_cache
+from SeleniumLibrary.keywords.tableelement import clear_table_snapshot_cache
 from SeleniumLibrary.locators import WindowManager
 from SeleniumLibrary.utils import (
     _convert_delay,
@@ -50,8 +55,18 @@ class BrowserManagementKeywords(LibraryComponent):
 
         This keyword should be used in test or suite teardown to make sure
         all browsers are closed.
+
+        Browsers are closed in parallel. If closing a browser does not
+        finish in one minute, its driver process is killed. If closing
+        any browser fails, the error is logged and, after all browsers
+        have been handled, the error of the last failing browser is
+        raised. Parallel closing is new in SeleniumLibrary 6.9.
         """
         self.debug("Closing all browsers.")
+        self.element_finder.clear_element_cache()
+        self._window_manager.clear_cache()
+        clear_frame_cache(self.ctx)
+        clear_table_snapshot_cache(self.ctx)
         self.drivers.close_all()
 
     @keyword
@@ -59,6 +74,10 @@ class BrowserManagementKeywords(LibraryComponent):
         """Closes the current browser."""
         if self.drivers.current:
             self.debug(f"Closing browser with session id {self.driver.session_id}.")
+            self.element_finder.clear_element_cache()
+            self._window_manager.clear_cache()
+            clear_frame_cache(self.ctx)
+            clear_table_snapshot_cache(self.ctx)
             self.drivers.close()
 
     @keyword
@@ -284,6 +303,133 @@ class BrowserManagementKeywords(LibraryComponent):
         self.debug(f"Opened browser with session id {driver.session_id}.")
         return index
 
+    @keyword
+    def open_browsers(
+        self,
+        *browsers: str | dict,
+        url: str | None = None,
+        remote_url: bool | str = False,
+        options: Any = None,
+    ) -> list[str]:
+        """Opens several browsers at the same time.
+
+        Each item in ``browsers`` is either a browser name like ``chrome``
+        or a dictionary containing arguments accepted by `Open Browser`:
+        ``url``, ``browser``, ``alias``, ``remote_url``, ``ff_profile_dir``,
+        ``options`` and ``service``. The ``url``, ``remote_url`` and
+        ``options`` arguments of this keyword are used with browsers that
+        do not specify them.
+
+        Browsers are started and opened to their url in parallel, but they
+        are registered in the given order. Indexes are thus the same as
+        when using `Open Browser` multiple times and the last browser
+        becomes the current browser. If an alias is already in use, the
+        existing browser is used like with `Open Browser`. Time used to
+        start each browser is logged.
+
+        If starting any browser fails, browsers started by this keyword
+        are closed and the error of the first failing browser is raised.
+
+        Returns indexes of the browsers in the given order.
+
+        Example:
+        | &{bob} = | `Create Dictionary` | browser=firefox | alias=Bob |
+        | @{indexes} = | Open Browsers | ${bob} | chrome | url=http://example.com |
+        | `Switch Browser` | Bob |
+
+        New in SeleniumLibrary 6.9.
+        """
+        specs = self._get_browser_specs(browsers, url, remote_url, options)
+        existing = [self.drivers.get_index(spec["alias"]) for spec in specs]
+        new = [spec for spec, index in zip(specs, existing, strict=True) if not index]
+        started = iter(self._start_browsers(new))
+        indexes = []
+        for spec, index in zip(specs, existing, strict=True):
+            if index:
+                indexes.append(
+                    self.open_browser(spec["url"], spec["browser"], spec["alias"])
+                )
+                continue
+            driver, elapsed = next(started)
+            indexes.append(self.ctx.register_driver(driver, spec["alias"]))
+            self.info(
+                f"Opened browser '{spec['browser']}' with session id "
+                f"{driver.session_id} in {secs_to_timestr(elapsed)}."
+            )
+        return indexes
+
+    def _get_browser_specs(self, browsers, url, remote_url, options):
+        specs = []
+        for item in browsers:
+            spec = {
+                "url": url,
+                "browser": "firefox",
+                "alias": None,
+                "remote_url": remote_url,
+                "ff_profile_dir": None,
+                "options": options,
+                "service": None,
+            }
+            arguments = {"browser": item} if isinstance(item, str) else item
+            invalid = [name for name in arguments if name not in spec]
+            if invalid:
+                raise ValueError(
+                    f"Invalid browser argument '{invalid[0]}'. Valid arguments "
+                    f"are {', '.join(spec)}."
+                )
+            spec.update(arguments)
+            specs.append(spec)
+        aliases = [spec["alias"] for spec in specs if spec["alias"]]
+        for alias in aliases:
+            if aliases.count(alias) > 1:
+                raise ValueError(f"Alias '{alias}' is used more than once.")
+        return specs
+
+    def _start_browsers(self, specs):
+        if not specs:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=len(specs), thread_name_prefix="SeleniumLibrary-open"
+        ) as executor:
+            futures = [executor.submit(self._start_browser, spec) for spec in specs]
+        started, errors = [], []
+        for future in futures:
+            if future.exception():
+                errors.append(future.exception())
+                continue
+            driver, elapsed, error = future.result()
+            started.append((driver, elapsed))
+            if error:
+                errors.append(error)
+        if errors:
+            # Errors in closing are only logged, so that all browsers are
+            # closed and the original error is raised.
+            for driver, _ in started:
+                self.drivers._quit(driver, None)
+            raise errors[0]
+        return started
+
+    def _start_browser(self, spec):
+        # Runs in a worker thread, where messages cannot be logged. An error
+        # in opening the url is returned, so that the browser is closed in
+        # the main thread.
+        start = time.perf_counter()
+        driver = self._make_driver(
+            spec["browser"],
+            profile_dir=spec["ff_profile_dir"],
+            remote=spec["remote_url"],
+            options=spec["options"],
+            service=spec["service"],
+        )
+        driver = self._wrap_event_firing_webdriver(driver)
+        error = None
+        if spec["url"]:
+            try:
+                driver.get(spec["url"])
+            except Exception as exception:
+                error = exception
+        return driver, time.perf_counter() - start, error
+
     @keyword
     def create_webdriver(
         self,
@@ -374,6 +520,8 @@ class BrowserManagementKeywords(LibraryComponent):
         | # Do something ... |                |                   |
         | `Switch Browser`   | ${index}       |                   |
         """
+        self.element_finder.clear_element_cache()
+        clear_table_snapshot_cache(self.ctx)
         try:
             self.drivers.switch(index_or_alias)
         except RuntimeError as original_exception:
@@ -422,6 +570,60 @@ class BrowserManagementKeywords(LibraryComponent):
         """
         return self.drivers.active_aliases
 
+    @keyword
+    def get_browser_pool_statistics(self) -> dict:
+        """Returns statistics of the `browser pool` as a dictionary.
+
+        The dictionary contains the following items:
+        - ``size``: Number of browsers kept ready for each way of opening
+          browsers. ``0`` means that the pool is not enabled.
+        - ``idle``: Number of ready or starting browsers in the pool.
+        - ``in_use``: Number of open browsers taken from the pool.
+        - ``hits``: How many times `Open Browser` got a browser from the pool.
+        - ``misses``: How many times `Open Browser` had to start a browser.
+
+        Example:
+        | &{stats} = | `Get Browser Pool Statistics` |
+        | `Log`      | Pool hits: ${stats.hits}      |
+
+        New in SeleniumLibrary 6.9.
+        """
+        if self.drivers.pool is None:
+            return {"size": 0, "idle": 0, "in_use": 0, "hits": 0, "misses": 0}
+        return self.drivers.pool.statistics._asdict()
+
+    @keyword
+    def get_command_statistics(self, reset: bool = False) -> dict:
+        """Returns how many WebDriver commands each keyword has executed.
+
+        The returned dictionary has keyword names as keys. Values are
+        dictionaries containing the number of ``commands`` the keyword has
+        sent to browsers and the ``time`` in seconds used for executing
+        them, excluding the `Selenium speed`. Keywords are ordered by the
+        time, the slowest first. Commands executed outside keywords, for
+        example, by plugins, are reported under ``${None}``.
+
+        Statistics are collected from all browsers since the library was
+        imported or since the statistics were reset. If ``reset`` is
+        true, statistics are reset after they are returned.
+
+        Example:
+        | &{stats} = | `Get Command Statistics` |
+        | `Log`      | Click Element sent ${stats}[Click Element][commands] commands |
+
+        New in SeleniumLibrary 6.9.
+        """
+        statistics = self.ctx.command_statistics.statistics
+        if reset:
+            self.ctx.command_statistics.reset()
+        ordered = sorted(statistics.items(), key=lambda item: -item[1].time)
+        return {
+            printable_name(keyword, code_style=True)
+            if keyword
+            else None: stat._asdict()
+            for keyword, stat in ordered
+        }
+
     @keyword
     def get_session_id(self) -> str:
         """Returns the currently active browser session id.
@@ -529,17 +731,29 @@ class BrowserManagementKeywords(LibraryComponent):
     @keyword
     def go_back(self):
         """Simulates the user clicking the back button on their browser."""
+        self.element_finder.clear_element_cache()
+        self._window_manager.clear_cache()
+        clear_frame_cache(self.ctx)
+        clear_table_snapshot_cache(self.ctx)
         self.driver.back()
 
     @keyword
     def go_to(self, url):
         """Navigates the current browser window to the provided ``url``."""
         self.info(f"Opening url '{url}'")
+        self.element_finder.clear_element_cache()
+        self._window_manager.clear_cache()
+        clear_frame_cache(self.ctx)
+        clear_table_snapshot_cache(self.ctx)
         self.driver.get(url)
 
     @keyword
     def reload_page(self):
         """Simulates user reloading page."""
+        self.element_finder.clear_element_cache()
+        self._window_manager.clear_cache()
+        clear_frame_cache(self.ctx)
+        clear_table_snapshot_cache(self.ctx)
         self.driver.refresh()
 
     @keyword
@@ -602,7 +816,7 @@ class BrowserManagementKeywords(LibraryComponent):
         old_speed = self.get_selenium_speed()
         self.ctx.speed = _convert_timeout(value)
         for driver in self.drivers.active_drivers:
-            self._monkey_patch_speed(driver)
+            self._set_speed(driver)
         return old_speed
 
     @keyword
@@ -722,7 +936,8 @@ class BrowserManagementKeywords(LibraryComponent):
         executable_path=None,
         service=None,
     ):
-        driver = self._webdriver_creator.create_driver(
+        create = partial(
+            self._webdriver_creator.create_driver,
             browser=browser,
             desired_capabilities=desired_capabilities,
             remote_url=remote,
@@ -732,22 +947,58 @@ class BrowserManagementKeywords(LibraryComponent):
             executable_path=executable_path,
             service=service,
         )
+        pool = self.drivers.pool
+        if pool is None:
+            driver = create()
+        else:
+            driver = pool.acquire(self._get_pool_key(**create.keywords), create)
         driver.set_script_timeout(self.ctx.timeout)
         driver.implicitly_wait(self.ctx.implicit_wait)
         driver.set_page_load_timeout(self.ctx.page_load_timeout)
-        if self.ctx.speed:
-            self._monkey_patch_speed(driver)
+        self._set_speed(driver)
         return driver
 
-    def _monkey_patch_speed(self, driver):
-        def execute(self, driver_command, params=None):
-            result = self._base_execute(driver_command, params)
-            speed = self._speed if hasattr(self, "_speed") else 0.0
-            if speed > 0:
-                time.sleep(speed)
-            return result
-
-        if not hasattr(driver, "_base_execute"):
-            driver._base_execute = driver.execute
-            driver.execute = types.MethodType(execute, driver)
+    def _get_pool_key(
+        self,
+        browser,
+        desired_capabilities,
+        remote_url,
+        profile_dir,
+        options,
+        service_log_path,
+        executable_path,
+        service,
+    ):
+        # Browsers created with equal arguments are interchangeable. Options
+        # and services given as objects are compared by their content,
+        # because their default representation contains the object id.
+        if hasattr(options, "to_capabilities"):
+            options = options.to_capabilities()
+        if service is not None and not isinstance(service, str):
+            service = (type(service).__name__, getattr(service, "path", None))
+        return tuple(
+            _pool_key_value(value)
+            for value in (
+                browser.lower().replace(" ", ""),
+                desired_capabilities,
+                remote_url,
+                profile_dir,
+                options,
+                service_log_path,
+                executable_path,
+                service,
+            )
+        )
+
+    def _set_speed(self, driver):
+        # The speed is waited by SpeedMiddleware in the command pipeline.
+        self.ctx.command_pipeline.install(driver)
         driver._speed = self.ctx.speed
+
+
+def _pool_key_value(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return repr(value)
@@ -17,6 +17,7 @@
 from typing import NamedTuple
 
 from robot.utils import is_truthy, plural_or_not
+from selenium.common.exceptions import JavascriptException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
@@ -26,6 +27,45 @@ from SeleniumLibrary.errors import ElementNotFound
 from SeleniumLibrary.utils import is_noney
 from SeleniumLibrary.utils.types import Locator, type_converter
 
+# Searches text from the current document and its frames with one call.
+# Matches like XPath `//*[contains(., text)]` used by `is_text_present`.
+# Frames are identified with their index among `//frame|//iframe` elements
+# of the parent document and with a locator usable in a frame path. Frames
+# whose content cannot be accessed, typically because they have a different
+# origin, are returned so that they can be searched by switching to them.
+PAGE_TEXT_SCRIPT = """
+var text = arguments[0];
+var inaccessible = [];
+function slLabel(frame, index) {
+    return frame.id || frame.name || "xpath:(//frame|//iframe)[" + (index + 1) + "]";
+}
+function slSearch(win, path, labels) {
+    var root;
+    try {
+        root = win.document.documentElement;
+    } catch (error) {
+        inaccessible.push({path: path, labels: labels});
+        return null;
+    }
+    if (root && root.textContent.indexOf(text) !== -1) {
+        return {path: path, labels: labels};
+    }
+    var frames = win.document.querySelectorAll("frame, iframe");
+    for (var i = 0; i < frames.length; i++) {
+        if (frames[i].contentWindow) {
+            var found = slSearch(frames[i].contentWindow, path.concat([i]),
+                                 labels.concat([slLabel(frames[i], i)]));
+            if (found) {
+                return found;
+            }
+        }
+    }
+    return null;
+}
+var found = slSearch(window, [], []);
+return {found: found, inaccessible: found ? [] : inaccessible};
+"""
+
 
 class ElementKeywords(LibraryComponent):
     @keyword(name="Get WebElement")
@@ -138,13 +178,23 @@ class ElementKeywords(LibraryComponent):
         to the fact that is searches for the ``text`` in all frames. To locate
         an element in an iframe after calling `Page Should Contian` one needs
         to (re)select the frame.
+
+        The text is searched from the main document and from all frames in
+        it, including frames inside other frames, and the frame where the
+        text was found is logged. Searching frames inside other frames is
+        new in SeleniumLibrary 6.9. Earlier only frames directly in the
+        main document were searched.
         """
-        if not self._page_contains(text):
+        frame = self._find_page_text(text)
+        if frame is None:
             self.ctx.log_source(loglevel)
             raise AssertionError(
                 f"Page should have contained text '{text}' but did not."
             )
-        self.info(f"Current page contains text '{text}'.")
+        if frame:
+            self.info(f"Current page contains text '{text}' in frame '{frame}'.")
+        else:
+            self.info(f"Current page contains text '{text}'.")
 
     @keyword
     def page_should_contain_element(
@@ -200,8 +250,14 @@ class ElementKeywords(LibraryComponent):
 
         See `Page Should Contain` for an explanation about the ``loglevel``
         argument.
+
+        The text must not be in the main document or in any frame in it,
+        including frames inside other frames. Searching frames inside other
+        frames is new in SeleniumLibrary 6.9. Earlier only frames directly
+        in the main document were searched, so this keyword may now fail
+        with pages where text is only in nested frames.
         """
-        if self._page_contains(text):
+        if self._find_page_text(text) is not None:
             self.ctx.log_source(loglevel)
             raise AssertionError(f"Page should not have contained text '{text}'.")
         self.info(f"Current page does not contain text '{text}'.")
@@ -1150,6 +1206,9 @@ return !element.dispatchEvent(evt);
         current scope by default. Setting ``persist`` to a true value (see
         `Boolean arguments`) will cause the location strategy to stay
         registered throughout the life of the test.
+
+        The name ``frame`` is reserved for frame paths used by
+        `Select Frame` and cannot be used as a strategy name.
         """
         self.element_finder.register(strategy_name, strategy_keyword, persist)
 
@@ -1162,6 +1221,39 @@ return !element.dispatchEvent(evt);
         """
         self.element_finder.unregister(strategy_name)
 
+    @keyword
+    def set_element_cache(self, enabled: bool) -> bool:
+        """Enables or disables the element cache and returns the previous value.
+
+        See `Element cache` for details about the cache. Disabling the
+        cache also clears it.
+
+        Example:
+        | ${previous} =              | `Set Element Cache` | True |
+        | `Input Text`               | id:username         | demo |
+        | `Textfield Value Should Be` | id:username        | demo |
+        | `Set Element Cache`        | ${previous}         |      |
+
+        New in SeleniumLibrary 6.9.
+        """
+        previous = self.element_finder.element_cache
+        self.element_finder.element_cache = enabled
+        if not enabled:
+            self.element_finder.clear_element_cache()
+        return previous
+
+    @keyword
+    def clear_element_cache(self):
+        """Clears the element cache.
+
+        Needed when the page has changed so that cached elements are still
+        attached to the page but no longer are the elements their locators
+        should match. See `Element cache` for details.
+
+        New in SeleniumLibrary 6.9.
+        """
+        self.element_finder.clear_element_cache()
+
     def _map_ascii_key_code_to_key(self, key_code):
         key_map = {
             0: Keys.NULL,
@@ -1195,7 +1287,51 @@ return !element.dispatchEvent(evt);
             self.debug(message)
             raise ValueError(message) from original_exception
 
+    def _find_page_text(self, text: str) -> str | None:
+        """Returns the frame path where ``text`` is found or ``None``.
+
+        The path is empty if the text is found from the main document and
+        otherwise contains frames separated with `` >> ``.
+        """
+        pending = [([], [])]
+        path = []
+        try:
+            while pending:
+                path, labels = pending.pop(0)
+                self._switch_to_frame_path(path)
+                try:
+                    result = self.driver.execute_script(PAGE_TEXT_SCRIPT, str(text))
+                except JavascriptException as error:
+                    self.debug(f"Searching text with JavaScript failed: {error}")
+                    result = None
+                if not isinstance(result, dict):
+                    path = []
+                    return "" if self._page_contains(text) else None
+                if result["found"] is not None:
+                    return " >> ".join(labels + result["found"]["labels"])
+                inaccessible = result["inaccessible"]
+                if inaccessible:
+                    self.debug(f"Searching {len(inaccessible)} frames by switching.")
+                pending.extend(
+                    (path + frame["path"], labels + frame["labels"])
+                    for frame in inaccessible
+                )
+            return None
+        finally:
+            if path:
+                self.element_finder.clear_element_cache()
+                self.driver.switch_to.default_content()
+
+    def _switch_to_frame_path(self, path: list[int]):
+        self.element_finder.clear_element_cache()
+        self.driver.switch_to.default_content()
+        for index in path:
+            frames = self.find_elements("xpath://frame|//iframe")
+            self.element_finder.clear_element_cache()
+            self.driver.switch_to.frame(frames[index])
+
     def _page_contains(self, text):
+        self.element_finder.clear_element_cache()
         self.driver.switch_to.default_content()
 
         if self.is_text_present(text):
@@ -1204,8 +1340,10 @@ return !element.dispatchEvent(evt);
         subframes = self.find_elements("xpath://frame|//iframe")
         self.debug(f"Current frame has {len(subframes)} subframes.")
         for frame in subframes:
+            self.element_finder.clear_element_cache()
             self.driver.switch_to.frame(frame)
             found_text = self.is_text_present(text)
+            self.element_finder.clear_element_cache()
             self.driver.switch_to.default_content()
             if found_text:
                 return True
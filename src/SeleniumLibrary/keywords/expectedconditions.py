@@ -11,17 +11,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
 
 from SeleniumLibrary.base import LibraryComponent, keyword
 from SeleniumLibrary.errors import UnkownExpectedCondition
+from SeleniumLibrary.utils import Polling
+from SeleniumLibrary.utils.performance import sleep
+
+DEFAULT_POLLING = Polling.fixed(0.1)
 
 
 class ExpectedConditionKeywords(LibraryComponent):
     @keyword
     def wait_for_expected_condition(
-        self, condition: str, *args, timeout: float | None = 10
+        self,
+        condition: str,
+        *args,
+        timeout: float | None = 10,
+        polling: str | None = None,
     ):
         """Waits until ``condition`` is true or ``timeout`` expires.
 
@@ -47,20 +57,46 @@ class ExpectedConditionKeywords(LibraryComponent):
         Example of expected condition expecting locator:
         | ${byElem}= |  Evaluate  ("id","added_btn")
         | `Wait For Expected Condition` | Presence Of Element Located | ${byElem}
+
+        The condition is checked every 100 milliseconds by default.
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
 
         condition = self._parse_condition(condition)
-        wait = WebDriverWait(self.driver, timeout, 0.1)
+        polling = self.get_polling(polling, DEFAULT_POLLING)
         try:
             condition_func = getattr(EC, condition)
         except AttributeError as original_exception:
             raise UnkownExpectedCondition(
                 f"{condition} is an unknown expected condition"
             ) from original_exception
-        return wait.until(
+        return self._wait_until(
             condition_func(*args),
-            message=f"Expected Condition not met within set timeout of {timeout}s",
+            timeout,
+            polling,
+            f"Expected Condition not met within set timeout of {timeout}s",
         )
 
+    def _wait_until(self, method, timeout, polling: Polling, message):
+        # Same as WebDriverWait.until, but the polling interval can change.
+        screen = None
+        stacktrace = None
+        end_time = time.monotonic() + timeout
+        intervals = polling.intervals()
+        while True:
+            try:
+                value = method(self.driver)
+                if value:
+                    return value
+            except NoSuchElementException as error:
+                screen = getattr(error, "screen", None)
+                stacktrace = getattr(error, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            sleep(min(next(intervals), remaining))
+        raise TimeoutException(message, screen, stacktrace)
+
     def _parse_condition(self, condition: str):
         return condition.replace(" ", "_").lower()
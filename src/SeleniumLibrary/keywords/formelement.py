@@ -15,13 +15,103 @@
 # limitations under the License.
 
 import os
+from typing import Any
 
 from robot.libraries.BuiltIn import BuiltIn
+from selenium.common.exceptions import JavascriptException, WebDriverException
+from selenium.webdriver.support.ui import Select
 
 from SeleniumLibrary.base import LibraryComponent, keyword
 from SeleniumLibrary.errors import ElementNotFound
+from SeleniumLibrary.utils import is_truthy, plural_or_not
 from SeleniumLibrary.utils.types import Locator
 
+# Returns the kind of each form field, whether a selection list is
+# multi-selection and whether a checkbox or radio button is checked.
+FORM_FIELDS_SCRIPT = """
+var unsupported = ["button", "image", "reset", "submit"];
+return arguments[0].map(function (element) {
+    var tag = element.tagName.toLowerCase();
+    var type = (element.getAttribute("type") || "text").toLowerCase();
+    if (tag === "select") {
+        return ["select", element.multiple, false];
+    }
+    if (tag === "textarea") {
+        return ["text", false, false];
+    }
+    if (tag !== "input" || unsupported.indexOf(type) !== -1) {
+        return [null, false, false];
+    }
+    if (["checkbox", "radio", "file"].indexOf(type) !== -1) {
+        return [type, false, element.checked];
+    }
+    return ["text", false, false];
+});
+"""
+
+# Sets values of form fields and fires the same input and change events
+# as typing and clicking do. Text is set using the setter of the element
+# prototype so that frameworks tracking the value property notice the
+# change. Returns an error message or null for each field.
+FILL_FORM_SCRIPT = """
+var elements = arguments[0], kinds = arguments[1], values = arguments[2];
+var clear = arguments[3];
+function slFire(element) {
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+}
+function slSelect(element, value) {
+    var wanted = Array.isArray(value) ? value : [value];
+    var options = Array.prototype.slice.call(element.options);
+    var available = options.map(function (option) { return option.value; });
+    for (var i = 0; i < wanted.length; i++) {
+        if (available.indexOf(wanted[i]) === -1) {
+            return "Cannot locate option with value: " + wanted[i];
+        }
+    }
+    if (element.multiple) {
+        options.forEach(function (option) {
+            option.selected = wanted.indexOf(option.value) !== -1;
+        });
+    } else {
+        element.value = wanted[wanted.length - 1];
+    }
+    slFire(element);
+    return null;
+}
+function slFill(element, kind, value) {
+    if (element.disabled) {
+        return "Element is disabled.";
+    }
+    if (kind === "select") {
+        return slSelect(element, value);
+    }
+    if (kind === "checkbox" || kind === "radio") {
+        if (kind === "radio" && element.checked && !value) {
+            return "Radio button cannot be unselected.";
+        }
+        if (element.checked !== value) {
+            element.click();
+        }
+        return null;
+    }
+    if (element.readOnly) {
+        return "Element is read-only.";
+    }
+    var setter = Object.getOwnPropertyDescriptor(
+        Object.getPrototypeOf(element), "value"
+    ).set;
+    setter.call(element, clear ? value : element.value + value);
+    slFire(element);
+    return null;
+}
+var errors = [];
+for (var i = 0; i < elements.length; i++) {
+    errors.push(slFill(elements[i], kinds[i], values[i]));
+}
+return errors;
+"""
+
 
 class FormElementKeywords(LibraryComponent):
     @keyword
@@ -291,6 +381,180 @@ class FormElementKeywords(LibraryComponent):
         self.info(f"Typing text '{text}' into text field '{locator}'.")
         self._input_text_into_text_field(locator, text, clear)
 
+    @keyword
+    def fill_form(
+        self, fields: dict[str, Any], javascript: bool = False, clear: bool = True
+    ) -> list[dict]:
+        """Sets values of many form fields at once.
+
+        ``fields`` is a dictionary mapping field locators to values. See
+        the `Locating elements` section for details about the locator
+        syntax. How a value is used depends on the field:
+
+        | = Field =               | = Value =                                  |
+        | text field or text area | Text to type.                              |
+        | checkbox                | Selected if true, unselected if false. See `Boolean arguments`. |
+        | radio button            | Selected if true. A selected radio button cannot be unselected. |
+        | selection list          | Value, or list of values, to select. Other options are unselected. |
+        | file input              | Path of the file to choose.                |
+
+        All fields are found first and their types are read with one
+        JavaScript call. By default, values are then set like with
+        `Input Text`, `Select Checkbox`, `Select Radio Button` and
+        `Select From List By Value`, so that the browser gets real key
+        presses and clicks. If ``javascript`` is given a true value, values
+        of all fields are set with one JavaScript call that fires ``input``
+        and ``change`` events like typing and clicking do. That is
+        considerably faster, but individual key presses are not emulated.
+        Files are always chosen like with `Choose File`.
+
+        When ``clear`` is true, text fields are cleared before typing.
+
+        Filling continues even if some fields fail. The keyword returns
+        a list of dictionaries with ``locator``, ``type``, ``status``
+        (``PASS`` or ``FAIL``) and ``message`` items, one per field, and
+        fails after all fields have been handled if any of them failed.
+        Values are not logged, so the keyword can be used with passwords.
+
+        Examples:
+        | &{fields} =  | `Create Dictionary` | id:username=demo | id:password=${PASSWORD} | id:remember=True |
+        | `Fill Form`  | ${fields}           |                  |                         |                  |
+        | ${results} = | `Fill Form`         | ${fields}        | javascript=True         |                  |
+
+        New in SeleniumLibrary 6.9.
+        """
+        results = {
+            locator: {
+                "locator": str(locator),
+                "type": None,
+                "status": "FAIL",
+                "message": "",
+            }
+            for locator in fields
+        }
+        elements = {}
+        for locator in fields:
+            try:
+                elements[locator] = self.find_element(locator)
+            except ElementNotFound as error:
+                results[locator]["message"] = str(error)
+        kinds = self._get_field_kinds(list(elements.values()))
+        native, scripted = [], []
+        for (locator, element), (kind, multiple, checked) in zip(
+            elements.items(), kinds, strict=True
+        ):
+            results[locator]["type"] = kind
+            if kind is None:
+                results[locator]["message"] = "Element is not a supported form field."
+                continue
+            value = self._get_field_value(kind, fields[locator])
+            field = (locator, element, kind, multiple, checked, value)
+            if javascript and kind != "file":
+                scripted.append(field)
+            else:
+                native.append(field)
+        for locator, *field in native:
+            results[locator]["message"] = self._fill_field(*field, clear)
+        for (locator, *_), error in zip(
+            scripted, self._fill_fields_with_javascript(scripted, clear), strict=True
+        ):
+            results[locator]["message"] = error or ""
+        self._report_filled_fields(list(results.values()))
+        return list(results.values())
+
+    def _report_filled_fields(self, results):
+        for result in results:
+            if result["type"] and not result["message"]:
+                result["status"] = "PASS"
+            self.info(
+                f"{result['status']}: {result['locator']} ({result['type']}) "
+                f"{result['message']}".rstrip()
+            )
+        failed = [result for result in results if result["status"] == "FAIL"]
+        if failed:
+            details = "\n".join(
+                f"{result['locator']}: {result['message']}" for result in failed
+            )
+            raise AssertionError(
+                f"Filling {len(failed)} form field{plural_or_not(failed)} "
+                f"failed:\n{details}"
+            )
+
+    def _get_field_kinds(self, elements):
+        if not elements:
+            return []
+        try:
+            kinds = self.driver.execute_script(FORM_FIELDS_SCRIPT, elements)
+        except JavascriptException as error:
+            self.debug(f"Reading form fields with JavaScript failed: {error}")
+            kinds = None
+        if isinstance(kinds, list):
+            return [tuple(kind) for kind in kinds]
+        return [self._get_field_kind(element) for element in elements]
+
+    def _get_field_kind(self, element):
+        tag = element.tag_name.lower()
+        if tag == "select":
+            return "select", Select(element).is_multiple, False
+        if tag == "textarea":
+            return "text", False, False
+        kind = (element.get_attribute("type") or "text").lower()
+        if tag != "input" or kind in ("button", "image", "reset", "submit"):
+            return None, False, False
+        if kind in ("checkbox", "radio", "file"):
+            return kind, False, element.is_selected()
+        return "text", False, False
+
+    def _get_field_value(self, kind, value):
+        if kind in ("checkbox", "radio"):
+            return is_truthy(value)
+        if kind == "select" and isinstance(value, (list, tuple)):
+            return [str(item) for item in value]
+        return str(value)
+
+    def _fill_field(self, element, kind, multiple, checked, value, clear):
+        # Returns an error message or an empty string on success.
+        try:
+            if kind == "text":
+                if clear:
+                    element.clear()
+                element.send_keys(value)
+            elif kind == "file":
+                # Like in `Choose File`, lets the file detector upload the
+                # file to a remote browser.
+                self.ctx._running_keyword = "choose_file"
+                try:
+                    element.send_keys(value)
+                finally:
+                    self.ctx._running_keyword = None
+            elif kind == "select":
+                select = Select(element)
+                if multiple:
+                    select.deselect_all()
+                for item in value if isinstance(value, list) else [value]:
+                    select.select_by_value(item)
+            elif kind == "radio" and checked and not value:
+                return "Radio button cannot be unselected."
+            elif checked != value:
+                element.click()
+        except (WebDriverException, NotImplementedError) as error:
+            return str(error).strip() or type(error).__name__
+        return ""
+
+    def _fill_fields_with_javascript(self, fields, clear):
+        if not fields:
+            return []
+        _, elements, kinds, _, _, values = zip(*fields, strict=True)
+        try:
+            errors = self.driver.execute_script(
+                FILL_FORM_SCRIPT, list(elements), list(kinds), list(values), clear
+            )
+        except JavascriptException as error:
+            return [f"Setting value with JavaScript failed: {error.msg}"] * len(fields)
+        if not isinstance(errors, list) or len(errors) != len(fields):
+            return ["Setting value with JavaScript failed."] * len(fields)
+        return errors
+
     @keyword
     def page_should_contain_textfield(
         self,
@@ -14,9 +14,66 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.remote.webelement import WebElement
+
 from SeleniumLibrary.base import LibraryComponent, keyword
+from SeleniumLibrary.keywords.tableelement import clear_table_snapshot_cache
 from SeleniumLibrary.utils.types import Locator
 
+FRAME_PATH_PREFIX = "frame:"
+FRAME_PATH_SEPARATOR = ">>"
+
+
+class FrameCache:
+    def __init__(self):
+        """Frame elements found when selecting frames using frame paths.
+
+        Elements are stored for each browser by the frame path leading to
+        them, so that selecting the same frames again does not need to
+        locate them. The cache is cleared when the page or the window
+        changes, and a frame whose element has become stale is located
+        again.
+        """
+        self._frames: dict[tuple, WebElement] = {}
+
+    def get(self, driver, path: tuple[str, ...]) -> WebElement | None:
+        return self._frames.get((driver, path))
+
+    def set(self, driver, path: tuple[str, ...], element: WebElement):
+        self._frames[(driver, path)] = element
+
+    def discard(self, driver, path: tuple[str, ...]):
+        """Removes the frame and frames inside it."""
+        for key in list(self._frames):
+            if key[0] is driver and key[1][: len(path)] == path:
+                del self._frames[key]
+
+    def clear(self):
+        self._frames.clear()
+
+
+def clear_frame_cache(ctx):
+    cache = getattr(ctx, "_frame_cache", None)
+    if isinstance(cache, FrameCache):
+        cache.clear()
+
+
+def is_frame_path(locator: Locator) -> bool:
+    return isinstance(locator, str) and locator.startswith(FRAME_PATH_PREFIX)
+
+
+def parse_frame_path(locator: str) -> tuple[str, ...]:
+    path = locator[len(FRAME_PATH_PREFIX) :].split(FRAME_PATH_SEPARATOR)
+    path = tuple(frame.strip() for frame in path)
+    if not all(path):
+        raise ValueError(f"Invalid frame path '{locator}'.")
+    return path
+
 
 class FrameKeywords(LibraryComponent):
     @keyword
@@ -34,17 +91,73 @@ class FrameKeywords(LibraryComponent):
         | `Click Link`     | example   | # Click link 'example' in the selected frame |
         | `Unselect Frame` |           | # Back to main frame.                        |
         | `Select Frame`   | //iframe[@name='xxx'] | # Select frame using xpath       |
+
+        Frames inside frames can be selected with one call by using a frame
+        path like ``frame:outer >> inner >> widget``. Frames in the path are
+        separated with ``>>`` and each of them is located with a locator
+        inside the previous frame. Frame paths always start from the main
+        frame, regardless of the currently selected frame. Frame paths
+        logged by `Page Should Contain` can be used as is. Because of frame
+        paths, ``frame`` cannot be used as a custom location strategy name.
+
+        Frame elements found using frame paths are cached, so selecting the
+        same frames again does not need to locate them. The cache is cleared
+        when the page or the window changes, for example, by `Go To`,
+        `Reload Page` or `Switch Window`, and a frame is located again if
+        its cached element is no longer valid. Frame paths are new in
+        SeleniumLibrary 6.9.
+
+        | `Select Frame`   | frame:portal >> app >> widget | # Select frame inside two other frames |
         """
         self.info(f"Selecting frame '{locator}'.")
+        clear_table_snapshot_cache(self.ctx)
+        if is_frame_path(locator):
+            self._select_frame_path(parse_frame_path(locator))
+            return
         element = self.find_element(locator)
+        self.element_finder.clear_element_cache()
         self.driver.switch_to.frame(element)
 
+    @property
+    def frame_cache(self) -> FrameCache | None:
+        cache = getattr(self.ctx, "_frame_cache", None)
+        return cache if isinstance(cache, FrameCache) else None
+
+    def _select_frame_path(self, path: tuple[str, ...]):
+        self.element_finder.clear_element_cache()
+        self.driver.switch_to.default_content()
+        cache = self.frame_cache or FrameCache()
+        for depth in range(1, len(path) + 1):
+            if not self._select_cached_frame(cache, path[:depth]):
+                element = self.find_element(path[depth - 1])
+                self.driver.switch_to.frame(element)
+                cache.set(self.driver, path[:depth], element)
+            self.element_finder.clear_element_cache()
+
+    def _select_cached_frame(self, cache: FrameCache, path: tuple[str, ...]):
+        element = cache.get(self.driver, path)
+        if element is None:
+            return False
+        try:
+            self.driver.switch_to.frame(element)
+        except (
+            NoSuchElementException,
+            NoSuchFrameException,
+            StaleElementReferenceException,
+        ):
+            self.debug(f"Cached frame '{path[-1]}' is not valid anymore.")
+            cache.discard(self.driver, path)
+            return False
+        return True
+
     @keyword
     def unselect_frame(self):
         """Sets the main frame as the current frame.
 
         In practice cancels the previous `Select Frame` call.
         """
+        self.element_finder.clear_element_cache()
+        clear_table_snapshot_cache(self.ctx)
         self.driver.switch_to.default_content()
 
     @keyword
@@ -85,7 +198,8 @@ class FrameKeywords(LibraryComponent):
         """Verifies that frame identified by ``locator`` contains ``text``.
 
         See the `Locating elements` section for details about the locator
-        syntax.
+        syntax. Frames inside frames can be used with frame paths like
+        ``frame:outer >> inner`` explained in `Select Frame`.
 
         See `Page Should Contain` for an explanation about the ``loglevel``
         argument.
@@ -98,9 +212,15 @@ class FrameKeywords(LibraryComponent):
         self.info(f"Frame '{locator}' contains text '{text}'.")
 
     def _frame_contains(self, locator: Locator, text: str):
-        element = self.find_element(locator)
-        self.driver.switch_to.frame(element)
+        if is_frame_path(locator):
+            self._select_frame_path(parse_frame_path(locator))
+        else:
+            element = self.find_element(locator)
+            self.element_finder.clear_element_cache()
+            self.driver.switch_to.frame(element)
         self.info(f"Searching for text from frame '{locator}'.")
         found = self.is_text_present(text)
+        self.element_finder.clear_element_cache()
+        clear_table_snapshot_cache(self.ctx)
         self.driver.switch_to.default_content()
         return found
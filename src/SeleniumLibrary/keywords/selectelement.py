@@ -14,12 +14,86 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import NamedTuple
+
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
 from selenium.webdriver.support.ui import Select
 
 from SeleniumLibrary.base import LibraryComponent, keyword
 from SeleniumLibrary.utils import is_truthy, plural_or_not
 from SeleniumLibrary.utils.types import Locator
 
+# Reads all options of a select list with one call. `option.text` has
+# whitespace collapsed like WebElement.text has for options.
+SELECT_OPTIONS_SCRIPT = """
+return Array.prototype.map.call(arguments[0].options, function (option) {
+    return [option.text, option.value, option.index, option.selected];
+});
+"""
+
+# Selects or unselects options of a multi-selection list with one call.
+# All options are validated before anything is changed and `input` and
+# `change` events are fired once after all changes. Matching and errors
+# follow Selenium's Select helper.
+SELECT_BATCH_SCRIPT = """
+var select = arguments[0], by = arguments[1], items = arguments[2];
+var selected = arguments[3];
+var options = Array.prototype.slice.call(select.options);
+function slVisible(option) {
+    var style = window.getComputedStyle(option);
+    return style.visibility !== "hidden" && style.display !== "none"
+        && style.opacity !== "0";
+}
+function slMatch(option, item) {
+    if (by === "index") {
+        return option.index === item;
+    }
+    if (by === "value") {
+        return option.value === item;
+    }
+    return option.text === item;
+}
+var targets = by === "all" ? options : [];
+for (var i = 0; by !== "all" && i < items.length; i++) {
+    var item = items[i];
+    var matches = options.filter(function (option) {
+        return slMatch(option, item);
+    });
+    if (!matches.length) {
+        return {error: "missing", item: item};
+    }
+    for (var j = 0; by === "label" && j < matches.length; j++) {
+        if (!slVisible(matches[j])) {
+            return {error: "invisible", item: item};
+        }
+    }
+    targets = targets.concat(matches);
+}
+var changed = targets.filter(function (option) {
+    return option.selected !== selected;
+});
+for (var k = 0; selected && k < changed.length; k++) {
+    if (changed[k].disabled) {
+        return {error: "disabled", item: changed[k].index};
+    }
+}
+changed.forEach(function (option) {
+    option.selected = selected;
+});
+if (changed.length) {
+    select.dispatchEvent(new Event("input", {bubbles: true}));
+    select.dispatchEvent(new Event("change", {bubbles: true}));
+}
+return {changed: changed.length};
+"""
+
+
+class SelectOption(NamedTuple):
+    label: str
+    value: str
+    index: int
+    selected: bool
+
 
 class SelectElementKeywords(LibraryComponent):
     @keyword
@@ -54,8 +128,7 @@ class SelectElementKeywords(LibraryComponent):
         See the `Locating elements` section for details about the locator
         syntax.
         """
-        select = self._get_select_list(locator)
-        return select.first_selected_option.text
+        return self._get_first_selected_option(locator).label
 
     @keyword
     def get_selected_list_labels(self, locator: Locator) -> list[str]:
@@ -80,8 +153,7 @@ class SelectElementKeywords(LibraryComponent):
         See the `Locating elements` section for details about the locator
         syntax.
         """
-        select = self._get_select_list(locator)
-        return select.first_selected_option.get_attribute("value")
+        return self._get_first_selected_option(locator).value
 
     @keyword
     def get_selected_list_values(self, locator: Locator) -> list[str]:
@@ -200,8 +272,9 @@ class SelectElementKeywords(LibraryComponent):
             raise RuntimeError(
                 "'Select All From List' works only with multi-selection lists."
             )
-        for index in range(len(select.options)):
-            select.select_by_index(index)
+        if not self._select_in_browser(select, "all", [], True):
+            for index in range(len(select.options)):
+                select.select_by_index(index)
 
     @keyword
     def select_from_list_by_index(self, locator: Locator, *indexes: str):
@@ -212,7 +285,9 @@ class SelectElementKeywords(LibraryComponent):
         If more than one option is given for a single-selection list,
         the last value will be selected. With multi-selection lists all
         specified options are selected, but possible old selections are
-        not cleared.
+        not cleared. Multiple options of a multi-selection list are
+        selected with one JavaScript call that fires ``input`` and
+        ``change`` events once, not by clicking options one by one.
 
         See the `Locating elements` section for details about the locator
         syntax.
@@ -224,9 +299,11 @@ class SelectElementKeywords(LibraryComponent):
             f"Selecting options from selection list '{locator}' "
             f"by index{plural} {', '.join(indexes)}."
         )
+        indexes = [int(index) for index in indexes]
         select = self._get_select_list(locator)
-        for index in indexes:
-            select.select_by_index(int(index))
+        if not self._select_many(select, "index", indexes):
+            for index in indexes:
+                select.select_by_index(index)
 
     @keyword
     def select_from_list_by_value(self, locator: Locator, *values: str):
@@ -235,7 +312,9 @@ class SelectElementKeywords(LibraryComponent):
         If more than one option is given for a single-selection list,
         the last value will be selected. With multi-selection lists all
         specified options are selected, but possible old selections are
-        not cleared.
+        not cleared. Multiple options of a multi-selection list are
+        selected with one JavaScript call that fires ``input`` and
+        ``change`` events once, not by clicking options one by one.
 
         See the `Locating elements` section for details about the locator
         syntax.
@@ -247,8 +326,9 @@ class SelectElementKeywords(LibraryComponent):
             f"value{plural_or_not(values)} {', '.join(values)}."
         )
         select = self._get_select_list(locator)
-        for value in values:
-            select.select_by_value(value)
+        if not self._select_many(select, "value", values):
+            for value in values:
+                select.select_by_value(value)
 
     @keyword
     def select_from_list_by_label(self, locator: Locator, *labels: str):
@@ -257,7 +337,9 @@ class SelectElementKeywords(LibraryComponent):
         If more than one option is given for a single-selection list,
         the last value will be selected. With multi-selection lists all
         specified options are selected, but possible old selections are
-        not cleared.
+        not cleared. Multiple options of a multi-selection list are
+        selected with one JavaScript call that fires ``input`` and
+        ``change`` events once, not by clicking options one by one.
 
         See the `Locating elements` section for details about the locator
         syntax.
@@ -269,8 +351,9 @@ class SelectElementKeywords(LibraryComponent):
             f"by label{plural_or_not(labels)} {', '.join(labels)}."
         )
         select = self._get_select_list(locator)
-        for label in labels:
-            select.select_by_visible_text(label)
+        if not self._select_many(select, "label", labels):
+            for label in labels:
+                select.select_by_visible_text(label)
 
     @keyword
     def unselect_all_from_list(self, locator: Locator):
@@ -287,7 +370,8 @@ class SelectElementKeywords(LibraryComponent):
             raise RuntimeError(
                 "Un-selecting options works only with multi-selection lists."
             )
-        select.deselect_all()
+        if not self._select_in_browser(select, "all", [], False):
+            select.deselect_all()
 
     @keyword
     def unselect_from_list_by_index(self, locator: Locator, *indexes: str):
@@ -295,6 +379,8 @@ class SelectElementKeywords(LibraryComponent):
 
         Indexes of list options start from 0. This keyword works only with
         multi-selection lists.
+        Multiple options are unselected with one JavaScript call like
+        with `Select From List By Value`.
 
         See the `Locating elements` section for details about the locator
         syntax.
@@ -306,19 +392,23 @@ class SelectElementKeywords(LibraryComponent):
             f"Un-selecting options from selection list '{locator}' by index{plurar} "
             f"{', '.join(indexes)}."
         )
+        indexes = [int(index) for index in indexes]
         select = self._get_select_list(locator)
         if not select.is_multiple:
             raise RuntimeError(
                 "Un-selecting options works only with multi-selection lists."
             )
-        for index in indexes:
-            select.deselect_by_index(int(index))
+        if not self._select_many(select, "index", indexes, selected=False):
+            for index in indexes:
+                select.deselect_by_index(index)
 
     @keyword
     def unselect_from_list_by_value(self, locator: Locator, *values: str):
         """Unselects options from selection list ``locator`` by ``values``.
 
         This keyword works only with multi-selection lists.
+        Multiple options are unselected with one JavaScript call like
+        with `Select From List By Value`.
 
         See the `Locating elements` section for details about the locator
         syntax.
@@ -334,14 +424,17 @@ class SelectElementKeywords(LibraryComponent):
             raise RuntimeError(
                 "Un-selecting options works only with multi-selection lists."
             )
-        for value in values:
-            select.deselect_by_value(value)
+        if not self._select_many(select, "value", values, selected=False):
+            for value in values:
+                select.deselect_by_value(value)
 
     @keyword
     def unselect_from_list_by_label(self, locator: Locator, *labels: str):
         """Unselects options from selection list ``locator`` by ``labels``.
 
         This keyword works only with multi-selection lists.
+        Multiple options are unselected with one JavaScript call like
+        with `Select From List By Value`.
 
         See the `Locating elements` section for details about the locator
         syntax.
@@ -357,21 +450,89 @@ class SelectElementKeywords(LibraryComponent):
             raise RuntimeError(
                 "Un-selecting options works only with multi-selection lists."
             )
-        for label in labels:
-            select.deselect_by_visible_text(label)
+        if not self._select_many(select, "label", labels, selected=False):
+            for label in labels:
+                select.deselect_by_visible_text(label)
 
     def _get_select_list(self, locator: Locator):
         el = self.find_element(locator, tag="list")
         return Select(el)
 
-    def _get_options(self, locator: Locator):
-        return self._get_select_list(locator).options
-
-    def _get_selected_options(self, locator: Locator):
-        return self._get_select_list(locator).all_selected_options
+    def _select_many(self, select: Select, by: str, items, selected=True) -> bool:
+        # Selecting one option, or options of a single-selection list, is
+        # done by clicking like a user would do.
+        if not select.is_multiple or len(items) < 2:
+            return False
+        return self._select_in_browser(select, by, items, selected)
+
+    def _select_in_browser(self, select: Select, by: str, items, selected) -> bool:
+        # Returns False when options cannot be selected with JavaScript
+        # and they must be selected one by one instead.
+        try:
+            result = self.driver.execute_script(
+                SELECT_BATCH_SCRIPT, select._el, by, list(items), selected
+            )
+        except JavascriptException as error:
+            self.debug(f"Selecting options with JavaScript failed: {error}")
+            return False
+        if not isinstance(result, dict):
+            return False
+        error, item = result.get("error"), result.get("item")
+        if error == "disabled":
+            raise NotImplementedError("You may not select a disabled option")
+        if error == "invisible":
+            raise NoSuchElementException(f"Invisible option with text: {item}")
+        if error == "missing":
+            if by == "index":
+                message = f"Could not locate element with index {item}"
+            elif by == "value" and selected:
+                message = f"Cannot locate option with value: {item}"
+            elif by == "value":
+                message = f"Could not locate element with value: {item}"
+            else:
+                message = f"Could not locate element with visible text: {item}"
+            raise NoSuchElementException(message)
+        self.debug(f"Changed selection of {result.get('changed')} option(s).")
+        return True
+
+    def _get_options(self, locator: Locator) -> list[SelectOption]:
+        element = self.find_element(locator, tag="list")
+        options = self._read_options(element)
+        if options is None:
+            options = [
+                SelectOption(
+                    option.text,
+                    option.get_attribute("value"),
+                    index,
+                    option.is_selected(),
+                )
+                for index, option in enumerate(Select(element).options)
+            ]
+        return options
+
+    def _read_options(self, element) -> list[SelectOption] | None:
+        # Returns None when options cannot be read with JavaScript and
+        # they must be read one by one instead.
+        try:
+            result = self.driver.execute_script(SELECT_OPTIONS_SCRIPT, element)
+        except JavascriptException as error:
+            self.debug(f"Reading options with JavaScript failed: {error}")
+            return None
+        if not isinstance(result, list):
+            return None
+        return [SelectOption(*option) for option in result]
+
+    def _get_selected_options(self, locator: Locator) -> list[SelectOption]:
+        return [option for option in self._get_options(locator) if option.selected]
+
+    def _get_first_selected_option(self, locator: Locator) -> SelectOption:
+        options = self._get_selected_options(locator)
+        if not options:
+            raise NoSuchElementException("No options are selected")
+        return options[0]
 
     def _get_labels(self, options):
-        return [opt.text for opt in options]
+        return [opt.label for opt in options]
 
     def _get_values(self, options):
-        return [opt.get_attribute("value") for opt in options]
+        return [opt.value for opt in options]
@@ -0,0 +1,261 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import NamedTuple
+
+# Serializes a table, including rows of nested tables, with one call.
+# Texts are normalized to look like WebElement.text: cells on the same
+# line are separated with a space instead of a tab, lines are trimmed and
+# elements that are not rendered have no text.
+TABLE_DATA_SCRIPT = """
+var table = arguments[0];
+function slTagName(element) {
+    return element.tagName.toLowerCase();
+}
+function slText(element) {
+    if (!element.getClientRects().length) {
+        return "";
+    }
+    return (element.innerText || "")
+        .replace(/\\u00a0/g, " ")
+        .split("\\n")
+        .map(function (line) { return line.replace(/\\t/g, " ").trim(); })
+        .filter(function (line) { return line.length > 0; })
+        .join("\\n");
+}
+function slChildren(element, tags) {
+    return Array.prototype.filter.call(element.children, function (child) {
+        return tags.indexOf(slTagName(child)) !== -1;
+    });
+}
+var caption = slChildren(table, ["caption"]);
+var rows = Array.prototype.map.call(table.querySelectorAll("tr"), function (row) {
+    var parent = row.parentElement;
+    var siblings = slChildren(parent, ["tr"]);
+    var footer = row.closest("tfoot");
+    var nested = row.closest("table") !== table;
+    var section = null;
+    if (!nested && parent.parentElement === table) {
+        section = slTagName(parent);
+    }
+    return {
+        text: slText(row),
+        section: section,
+        nested: nested,
+        position: siblings.indexOf(row) + 1,
+        siblings: siblings.length,
+        footer: footer !== null && table.contains(footer),
+        cells: slChildren(row, ["th", "td"]).map(function (cell) {
+            return [slText(cell), slTagName(cell) === "th", cell.colSpan || 1,
+                    cell.rowSpan || 1];
+        })
+    };
+});
+return {caption: caption.length ? slText(caption[0]) : null, rows: rows};
+"""
+
+SECTIONS = ("thead", "tbody", "tfoot")
+
+
+class TableCell(NamedTuple):
+    text: str
+    header: bool
+    colspan: int = 1
+    rowspan: int = 1
+
+
+class TableRow(NamedTuple):
+    text: str
+    cells: tuple[TableCell, ...]
+    section: str | None = "tbody"
+    nested: bool = False
+    position: int = 1
+    siblings: int = 1
+    footer: bool = False
+
+
+class TableData(NamedTuple):
+    rows: tuple[TableRow, ...]
+    caption: str | None = None
+
+    @classmethod
+    def from_script_result(cls, result) -> "TableData | None":
+        if not isinstance(result, dict) or not isinstance(result.get("rows"), list):
+            return None
+        rows = tuple(
+            TableRow(
+                text=row["text"],
+                cells=tuple(TableCell(*cell) for cell in row["cells"]),
+                section=row["section"],
+                nested=row["nested"],
+                position=row["position"],
+                siblings=row["siblings"],
+                footer=row["footer"],
+            )
+            for row in result["rows"]
+        )
+        return cls(rows, result.get("caption"))
+
+    @property
+    def section_rows(self) -> list[TableRow]:
+        """Rows of ``thead``, ``tbody`` and ``tfoot``, in rendering order."""
+        rows = [row for row in self.rows if not row.nested and row.section]
+        return sorted(rows, key=lambda row: SECTIONS.index(row.section))
+
+    def to_list(self, expand_spans: bool = False) -> list[list[str]]:
+        rows = self.section_rows
+        if not expand_spans:
+            return [[cell.text for cell in row.cells] for row in rows]
+        grid: list[dict[int, str]] = [{} for _ in rows]
+        for row_index, row in enumerate(rows):
+            column = 0
+            for cell in row.cells:
+                while column in grid[row_index]:
+                    column += 1
+                for spanned_row in grid[row_index : row_index + cell.rowspan]:
+                    for offset in range(cell.colspan):
+                        spanned_row[column + offset] = cell.text
+                column += cell.colspan
+        return [[row[index] for index in sorted(row)] for row in grid]
+
+    def header_columns(self) -> dict[str, int]:
+        """Maps texts of the first header row to column indexes."""
+        for row in self.section_rows:
+            if row.cells and all(cell.header for cell in row.cells):
+                columns = {}
+                for index, cell in enumerate(row.cells, start=1):
+                    columns.setdefault(cell.text, index)
+                return columns
+        return {}
+
+    def row_contains(self, row: int, expected: str) -> bool:
+        return _contains(self.row_texts(row), expected)
+
+    def column_contains(self, column: int, expected: str) -> bool:
+        return _contains(self.column_texts(column), expected)
+
+    def header_contains(self, expected: str) -> bool:
+        return _contains(self.header_texts(), expected)
+
+    def footer_contains(self, expected: str) -> bool:
+        return _contains(self.footer_texts(), expected)
+
+    def contains(self, expected: str) -> bool:
+        return _contains(self.texts(), expected)
+
+    def row_texts(self, row: int) -> Iterator[str]:
+        # Same rows as XPath `//tr[position]` relative to the table.
+        for table_row in self.rows:
+            position = row if row > 0 else table_row.siblings + row + 1
+            if table_row.position == position:
+                yield table_row.text
+
+    def column_texts(self, column: int) -> Iterator[str]:
+        for row in self.rows:
+            if abs(column) <= len(row.cells):
+                yield row.cells[column - 1 if column > 0 else column].text
+
+    def header_texts(self) -> Iterator[str]:
+        for row in self.rows:
+            yield from (cell.text for cell in row.cells if cell.header)
+
+    def footer_texts(self) -> Iterator[str]:
+        for row in self.rows:
+            if row.footer:
+                yield from (cell.text for cell in row.cells if not cell.header)
+
+    def texts(self) -> Iterator[str]:
+        if self.caption:
+            yield self.caption
+        for row in self.rows:
+            yield row.text
+            yield from (cell.text for cell in row.cells)
+
+
+class TableSnapshot:
+    def __init__(self, data: TableData):
+        """Table data indexed for repeated queries.
+
+        Texts of rows and cells are indexed so that finding where a text
+        occurs requires looking at each distinct text once, not at every
+        row and cell.
+
+        :param data: Table data read from the browser.
+        :type data: TableData
+        """
+        self.data = data
+        self.section_rows = data.section_rows
+        self._header_columns = data.header_columns()
+        self._row_index = defaultdict(list)
+        self._cell_index = defaultdict(list)
+        for row_index, row in enumerate(data.rows):
+            self._row_index[row.text].append(row_index)
+            for cell_index, cell in enumerate(row.cells):
+                self._cell_index[cell.text].append((row_index, cell_index))
+
+    def to_list(self, expand_spans: bool = False) -> list[list[str]]:
+        return self.data.to_list(expand_spans)
+
+    def header_columns(self) -> dict[str, int]:
+        return self._header_columns
+
+    def row_contains(self, row: int, expected: str) -> bool:
+        rows = self.data.rows
+        return any(
+            rows[index].position == (row if row > 0 else rows[index].siblings + row + 1)
+            for index in self._matches(self._row_index, expected)
+        )
+
+    def column_contains(self, column: int, expected: str) -> bool:
+        for row_index, cell_index in self._matches(self._cell_index, expected):
+            cells = self.data.rows[row_index].cells
+            if cell_index == (column - 1 if column > 0 else len(cells) + column):
+                return True
+        return False
+
+    def header_contains(self, expected: str) -> bool:
+        return any(
+            self.data.rows[row_index].cells[cell_index].header
+            for row_index, cell_index in self._matches(self._cell_index, expected)
+        )
+
+    def footer_contains(self, expected: str) -> bool:
+        for row_index, cell_index in self._matches(self._cell_index, expected):
+            row = self.data.rows[row_index]
+            if row.footer and not row.cells[cell_index].header:
+                return True
+        return False
+
+    def contains(self, expected: str) -> bool:
+        if _contains([self.data.caption], expected):
+            return True
+        return any(self._matches(self._row_index, expected)) or any(
+            self._matches(self._cell_index, expected)
+        )
+
+    def _matches(self, index: dict, expected: str) -> Iterator:
+        # Exact matches are found directly, partial ones by checking
+        # each distinct text once.
+        if expected and expected in index:
+            yield from index[expected]
+        for text, positions in index.items():
+            if text and text != expected and expected in text:
+                yield from positions
+
+
+def _contains(texts, expected: str) -> bool:
+    return any(text and expected in text for text in texts)
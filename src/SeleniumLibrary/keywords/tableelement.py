@@ -14,19 +14,176 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from selenium.common.exceptions import JavascriptException
 from selenium.webdriver.common.by import By
 
 from SeleniumLibrary.base import LibraryComponent, keyword
 from SeleniumLibrary.utils.types import Locator
 
+from .tabledata import TABLE_DATA_SCRIPT, TableData, TableSnapshot
+
+
+class TableSnapshotCache:
+    def __init__(self):
+        """Table snapshots captured with `Capture Table Snapshot`.
+
+        Snapshots are stored for each browser by the table locator. The
+        cache is cleared when the page, the window, the frame or the
+        browser changes and at the end of each test and suite.
+        """
+        self._snapshots: dict[tuple, TableSnapshot] = {}
+
+    def get(self, driver, locator: Locator) -> TableSnapshot | None:
+        return self._snapshots.get((driver, str(locator)))
+
+    def set(self, driver, locator: Locator, snapshot: TableSnapshot):
+        self._snapshots[(driver, str(locator))] = snapshot
+
+    def discard(self, driver, locator: Locator):
+        self._snapshots.pop((driver, str(locator)), None)
+
+    def clear(self):
+        self._snapshots.clear()
+
+
+def clear_table_snapshot_cache(ctx):
+    cache = getattr(ctx, "_table_snapshots", None)
+    if isinstance(cache, TableSnapshotCache):
+        cache.clear()
+
 
 class TableElementKeywords(LibraryComponent):
+    @property
+    def table_snapshots(self) -> TableSnapshotCache:
+        cache = getattr(self.ctx, "_table_snapshots", None)
+        if not isinstance(cache, TableSnapshotCache):
+            cache = self.ctx._table_snapshots = TableSnapshotCache()
+        return cache
+
+    @keyword
+    def capture_table_snapshot(self, locator: Locator):
+        """Reads the table once for the following table keywords.
+
+        The table is located using the ``locator`` argument. See the
+        `Locating elements` section for details about the locator syntax.
+
+        After the snapshot is captured, `Get Table Data`, `Get Table Cell`
+        and the ``Table ... Should Contain`` keywords called with the same
+        ``locator`` use the snapshot and do not access the browser at all.
+        Texts in the snapshot are indexed, so even a large number of
+        assertions against a large table is fast.
+
+        The snapshot is not updated automatically when the table changes.
+        Use `Refresh Table Snapshot` to read the table again and
+        `Clear Table Snapshots` to go back to reading the table from the
+        browser. Snapshots belong to the current browser and they are
+        removed automatically when the page, the window, the frame or the
+        browser changes, for example, by `Go To`, `Reload Page`,
+        `Select Frame` or `Switch Browser`, and at the end of each test
+        and suite. Keywords using a snapshot log that they do so.
+
+        Example:
+        | `Capture Table Snapshot`      | id:report | |                 |
+        | `Table Cell Should Contain`   | id:report | 2 | 3 | 42        |
+        | `Table Column Should Contain` | id:report | Name | Alice      |
+        | `Refresh Table Snapshot`      | id:report | |                 |
+
+        New in SeleniumLibrary 6.9.
+        """
+        data = self._get_table_data(locator)
+        if data is None:
+            raise RuntimeError(f"Could not read data of table '{locator}'.")
+        self.table_snapshots.set(self.driver, locator, TableSnapshot(data))
+
+    @keyword
+    def refresh_table_snapshot(self, locator: Locator):
+        """Reads the table of an existing snapshot again.
+
+        Fails if there is no snapshot for ``locator``. See
+        `Capture Table Snapshot` for details.
+
+        New in SeleniumLibrary 6.9.
+        """
+        if self.table_snapshots.get(self.driver, locator) is None:
+            raise ValueError(f"Table '{locator}' has no snapshot.")
+        self.capture_table_snapshot(locator)
+
+    @keyword
+    def clear_table_snapshots(self, locator: Locator | None = None):
+        """Removes the snapshot of ``locator`` or, by default, all snapshots.
+
+        With ``locator``, only the snapshot of the current browser is removed.
+
+        Table keywords read removed tables from the browser again. See
+        `Capture Table Snapshot` for details.
+
+        New in SeleniumLibrary 6.9.
+        """
+        if locator is None:
+            self.table_snapshots.clear()
+        else:
+            self.table_snapshots.discard(self.driver, locator)
+
+    @keyword
+    def get_table_data(
+        self, locator: Locator, expand_spans: bool = False
+    ) -> list[list[str]]:
+        """Returns texts of all table cells as a list of rows.
+
+        The table is located using the ``locator`` argument. See the
+        `Locating elements` section for details about the locator syntax.
+
+        Rows are returned in the same order as `Get Table Cell` counts them:
+        header rows first, then body rows and last footer rows. Each row is
+        a list of texts of its ``<th>`` and ``<td>`` cells. Rows of nested
+        tables are not included.
+
+        By default, a cell that spans multiple rows or columns is included
+        only once, in the row and position where it starts. If
+        ``expand_spans`` is given a true value (see `Boolean arguments`),
+        its text is repeated in every row and column it covers, so that
+        every row has the same number of columns in a rectangular table.
+
+        The whole table is read with one JavaScript call, so this keyword
+        is considerably faster than getting cells one by one with large
+        tables.
+
+        Example:
+        | ${data} =       | `Get Table Data` | id:report  |
+        | Should Be Equal | ${data}[0][1]    | Name       |
+        | ${data} =       | `Get Table Data` | id:report  | expand_spans=True |
+
+        New in SeleniumLibrary 6.9.
+        """
+        data = self._get_table(locator, tag="table")
+        if data is None:
+            raise RuntimeError(f"Could not read data of table '{locator}'.")
+        return data.to_list(expand_spans)
+
+    def _get_table(self, locator, tag=None) -> TableData | TableSnapshot | None:
+        snapshot = self.table_snapshots.get(self.driver, locator)
+        if snapshot is not None:
+            self.info(f"Using snapshot of table '{locator}'.")
+            return snapshot
+        return self._get_table_data(locator, tag)
+
+    def _get_table_data(self, locator, tag=None) -> TableData | None:
+        # Returns None when the table cannot be read with JavaScript and
+        # keywords should use WebDriver calls instead.
+        table = self.find_element(locator, tag=tag)
+        try:
+            result = self.driver.execute_script(TABLE_DATA_SCRIPT, table)
+        except JavascriptException as error:
+            self.debug(f"Reading table with JavaScript failed: {error}")
+            return None
+        return TableData.from_script_result(result)
+
     @keyword
     def get_table_cell(
         self,
         locator: Locator,
         row: int,
-        column: int,
+        column: int | str,
         loglevel: str = "TRACE",
     ) -> str:
         """Returns contents of a table cell.
@@ -39,6 +196,9 @@ class TableElementKeywords(LibraryComponent):
         rows are included in the count. It is possible to refer to rows
         and columns from the end by using negative indexes so that -1
         is the last row/column, -2 is the second last, and so on.
+        ``column`` can also be the text of a cell in the first header row,
+        for example ``Name``. In that case the table must be readable with
+        JavaScript.
 
         All ``<th>`` and ``<td>`` elements anywhere in the table are
         considered to be cells.
@@ -52,11 +212,37 @@ class TableElementKeywords(LibraryComponent):
                 f"got row {row} and column {column}."
             )
         try:
-            cell = self._get_cell(locator, row, column)
+            return self._get_cell_text(locator, row, column)
         except AssertionError:
             self.log_source(loglevel)
             raise
-        return cell.text
+
+    def _get_cell_text(self, locator, row, column):
+        data = self._get_table(locator, tag="table")
+        column = self._resolve_column(data, locator, column)
+        if data is None:
+            return self._get_cell(locator, row, column).text
+        rows = data.section_rows
+        if len(rows) < abs(row):
+            raise AssertionError(
+                f"Table '{locator}' should have had at least {abs(row)} "
+                f"rows but had only {len(rows)}."
+            )
+        cells = rows[row - 1 if row > 0 else row].cells
+        if len(cells) < abs(column):
+            raise AssertionError(
+                f"Table '{locator}' row {row} should have had at "
+                f"least {abs(column)} columns but had only {len(cells)}."
+            )
+        return cells[column - 1 if column > 0 else column].text
+
+    def _resolve_column(self, data, locator, column):
+        if isinstance(column, int):
+            return column
+        columns = data.header_columns() if data is not None else {}
+        if column not in columns:
+            raise ValueError(f"Table '{locator}' has no column '{column}'.")
+        return columns[column]
 
     def _get_cell(self, locator, row, column):
         rows = self._get_rows(locator, row)
@@ -90,7 +276,7 @@ class TableElementKeywords(LibraryComponent):
         self,
         locator: Locator,
         row: int,
-        column: int,
+        column: int | str,
         expected: str,
         loglevel: str = "TRACE",
     ):
@@ -112,7 +298,7 @@ class TableElementKeywords(LibraryComponent):
     def table_column_should_contain(
         self,
         locator: Locator,
-        column: int,
+        column: int | str,
         expected: str,
         loglevel: str = "TRACE",
     ):
@@ -124,7 +310,8 @@ class TableElementKeywords(LibraryComponent):
 
         Column indexes start from 1. It is possible to refer to columns
         from the end by using negative indexes so that -1 is the last column,
-        -2 is the second last, and so on.
+        -2 is the second last, and so on. ``column`` can also be the text
+        of a cell in the first header row, for example ``Name``.
 
         If a table contains cells that span multiple columns, those merged
         cells count as a single column.
@@ -132,8 +319,15 @@ class TableElementKeywords(LibraryComponent):
         See `Page Should Contain Element` for an explanation about the
         ``loglevel`` argument.
         """
-        element = self._find_by_column(locator, column, expected)
-        if element is None:
+        if isinstance(column, int):
+            self._index_to_position(column)
+        data = self._get_table(locator)
+        column = self._resolve_column(data, locator, column)
+        if data is not None:
+            found = data.column_contains(column, expected)
+        else:
+            found = self._find_by_column(locator, column, expected) is not None
+        if not found:
             self.ctx.log_source(loglevel)
             raise AssertionError(
                 f"Table '{locator}' column {column} did not contain text '{expected}'."
@@ -157,8 +351,12 @@ class TableElementKeywords(LibraryComponent):
         See `Page Should Contain Element` for an explanation about the
         ``loglevel`` argument.
         """
-        element = self._find_by_footer(locator, expected)
-        if element is None:
+        data = self._get_table(locator)
+        if data is not None:
+            found = data.footer_contains(expected)
+        else:
+            found = self._find_by_footer(locator, expected) is not None
+        if not found:
             self.ctx.log_source(loglevel)
             raise AssertionError(
                 f"Table '{locator}' footer did not contain text '{expected}'."
@@ -182,8 +380,12 @@ class TableElementKeywords(LibraryComponent):
         See `Page Should Contain Element` for an explanation about the
         ``loglevel`` argument.
         """
-        element = self._find_by_header(locator, expected)
-        if element is None:
+        data = self._get_table(locator)
+        if data is not None:
+            found = data.header_contains(expected)
+        else:
+            found = self._find_by_header(locator, expected) is not None
+        if not found:
             self.ctx.log_source(loglevel)
             raise AssertionError(
                 f"Table '{locator}' header did not contain text '{expected}'."
@@ -213,8 +415,13 @@ class TableElementKeywords(LibraryComponent):
         See `Page Should Contain Element` for an explanation about the
         ``loglevel`` argument.
         """
-        element = self._find_by_row(locator, row, expected)
-        if element is None:
+        self._index_to_position(row)
+        data = self._get_table(locator)
+        if data is not None:
+            found = data.row_contains(row, expected)
+        else:
+            found = self._find_by_row(locator, row, expected) is not None
+        if not found:
             self.ctx.log_source(loglevel)
             raise AssertionError(
                 f"Table '{locator}' row {row} did not contain text '{expected}'."
@@ -235,8 +442,12 @@ class TableElementKeywords(LibraryComponent):
         See `Page Should Contain Element` for an explanation about the
         ``loglevel`` argument.
         """
-        element = self._find_by_content(locator, expected)
-        if element is None:
+        data = self._get_table(locator)
+        if data is not None:
+            found = data.contains(expected)
+        else:
+            found = self._find_by_content(locator, expected) is not None
+        if not found:
             self.ctx.log_source(loglevel)
             raise AssertionError(
                 f"Table '{locator}' did not contain text '{expected}'."
@@ -17,13 +17,64 @@
 import time
 from datetime import timedelta
 
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    WebDriverException,
+)
 
 from SeleniumLibrary.base import LibraryComponent, keyword
 from SeleniumLibrary.errors import ElementNotFound
-from SeleniumLibrary.utils import secs_to_timestr
+from SeleniumLibrary.utils import Polling, secs_to_timestr
+from SeleniumLibrary.utils.performance import sleep
 from SeleniumLibrary.utils.types import Locator
 
+# Longest time to wait for a DOM change before checking the condition
+# anyway. Keeps waits working for changes that are not DOM mutations, like
+# CSS animations, and stays below the default script timeout.
+MAX_MUTATION_WAIT = 1.0
+# Shortest time between condition checks, so that pages that change all
+# the time, like ones with spinners or clocks, are not checked constantly.
+MIN_MUTATION_INTERVAL = 0.05
+
+DEFAULT_POLLING = Polling.fixed(0.2)
+
+# Counts DOM changes of the current document and returns the count once it
+# differs from the count seen earlier. Changes made after the previous call
+# returned, including the time the condition was checked, thus wake the wait
+# up immediately. The count is returned immediately also when the counter is
+# installed, because earlier changes of the document are then not known.
+WAIT_FOR_MUTATION_SCRIPT = """
+var seen = arguments[0];
+var timeout = arguments[1];
+var callback = arguments[arguments.length - 1];
+var options = {
+    attributes: true, characterData: true, childList: true, subtree: true
+};
+var state = document.__seleniumLibraryMutations;
+if (!state) {
+    state = document.__seleniumLibraryMutations = {count: 0};
+    new MutationObserver(function () { state.count++; }).observe(document, options);
+    callback(state.count);
+    return;
+}
+if (state.count !== seen) {
+    callback(state.count);
+    return;
+}
+var done = false;
+var observer = new MutationObserver(function () { finish(); });
+var timer = setTimeout(finish, timeout);
+function finish() {
+    if (!done) {
+        done = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        callback(state.count);
+    }
+}
+observer.observe(document, options);
+"""
+
 
 class WaitingKeywords(LibraryComponent):
     @keyword
@@ -32,6 +83,7 @@ class WaitingKeywords(LibraryComponent):
         condition: str,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until ``condition`` is true or ``timeout`` expires.
 
@@ -49,6 +101,9 @@ class WaitingKeywords(LibraryComponent):
         | `Wait For Condition` | return document.title == "New Title" |
         | `Wait For Condition` | return jQuery.active == 0            |
         | `Wait For Condition` | style = document.querySelector('h1').style; return style.background == "red" && style.color == "white" |
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         if "return" not in condition:
             raise ValueError(
@@ -59,6 +114,7 @@ class WaitingKeywords(LibraryComponent):
             f"Condition '{condition}' did not become true in <TIMEOUT>.",
             timeout,
             error,
+            polling=polling,
         )
 
     @keyword
@@ -67,6 +123,7 @@ class WaitingKeywords(LibraryComponent):
         expected: str,
         timeout: timedelta | None = None,
         message: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the current URL is ``expected``.
 
@@ -80,6 +137,9 @@ class WaitingKeywords(LibraryComponent):
         message.
 
         New in SeleniumLibrary 4.0
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
 
         expected = str(expected)
@@ -88,6 +148,7 @@ class WaitingKeywords(LibraryComponent):
             f"Location did not become '{expected}' in <TIMEOUT>.",
             timeout,
             message,
+            polling=polling,
         )
 
     @keyword
@@ -96,6 +157,7 @@ class WaitingKeywords(LibraryComponent):
         location: str,
         timeout: timedelta | None = None,
         message: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the current URL is not ``location``.
 
@@ -109,6 +171,9 @@ class WaitingKeywords(LibraryComponent):
         message.
 
         New in SeleniumLibrary 4.3
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         location = str(location)
         self._wait_until(
@@ -116,6 +181,7 @@ class WaitingKeywords(LibraryComponent):
             f"Location is '{location}' in <TIMEOUT>.",
             timeout,
             message,
+            polling=polling,
         )
 
     @keyword
@@ -124,6 +190,7 @@ class WaitingKeywords(LibraryComponent):
         expected: str,
         timeout: timedelta | None = None,
         message: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the current URL contains ``expected``.
 
@@ -137,6 +204,9 @@ class WaitingKeywords(LibraryComponent):
         message.
 
         New in SeleniumLibrary 4.0
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         expected = str(expected)
         self._wait_until(
@@ -144,6 +214,7 @@ class WaitingKeywords(LibraryComponent):
             f"Location did not contain '{expected}' in <TIMEOUT>.",
             timeout,
             message,
+            polling=polling,
         )
 
     @keyword
@@ -152,6 +223,7 @@ class WaitingKeywords(LibraryComponent):
         location: str,
         timeout: timedelta | None = None,
         message: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the current URL does not contains ``location``.
 
@@ -165,6 +237,9 @@ class WaitingKeywords(LibraryComponent):
         message.
 
         New in SeleniumLibrary 4.3
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         location = str(location)
         self._wait_until(
@@ -172,6 +247,7 @@ class WaitingKeywords(LibraryComponent):
             f"Location did contain '{location}' in <TIMEOUT>.",
             timeout,
             message,
+            polling=polling,
         )
 
     @keyword
@@ -180,6 +256,7 @@ class WaitingKeywords(LibraryComponent):
         text: str,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until ``text`` appears on the current page.
 
@@ -188,12 +265,17 @@ class WaitingKeywords(LibraryComponent):
         and their default value.
 
         ``error`` can be used to override the default error message.
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         self._wait_until(
             lambda: self.is_text_present(text),
             f"Text '{text}' did not appear in <TIMEOUT>.",
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -202,6 +284,7 @@ class WaitingKeywords(LibraryComponent):
         text: str,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until ``text`` disappears from the current page.
 
@@ -210,12 +293,17 @@ class WaitingKeywords(LibraryComponent):
         and their default value.
 
         ``error`` can be used to override the default error message.
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         self._wait_until(
             lambda: not self.is_text_present(text),
             f"Text '{text}' did not disappear in <TIMEOUT>.",
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -225,6 +313,7 @@ class WaitingKeywords(LibraryComponent):
         timeout: timedelta | None = None,
         error: str | None = None,
         limit: int | None = None,
+        polling: str | None = None,
     ):
         """Waits until the element ``locator`` appears on the current page.
 
@@ -241,6 +330,9 @@ class WaitingKeywords(LibraryComponent):
         contain same number of elements.
 
         ``limit`` is new in SeleniumLibrary 4.4
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         if limit is None:
             self._wait_until(
@@ -248,6 +340,8 @@ class WaitingKeywords(LibraryComponent):
                 f"Element '{locator}' did not appear in <TIMEOUT>.",
                 timeout,
                 error,
+                wake_on_mutation=True,
+                polling=polling,
             )
             return
         self._wait_until(
@@ -255,6 +349,8 @@ class WaitingKeywords(LibraryComponent):
             f'Page should have contained "{limit}" {locator} element(s) within <TIMEOUT>.',
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -264,6 +360,7 @@ class WaitingKeywords(LibraryComponent):
         timeout: timedelta | None = None,
         error: str | None = None,
         limit: int | None = None,
+        polling: str | None = None,
     ):
         """Waits until the element ``locator`` disappears from the current page.
 
@@ -280,6 +377,9 @@ class WaitingKeywords(LibraryComponent):
         contain same number of elements.
 
         ``limit`` is new in SeleniumLibrary 4.4
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         if limit is None:
             self._wait_until(
@@ -287,6 +387,8 @@ class WaitingKeywords(LibraryComponent):
                 f"Element '{locator}' did not disappear in <TIMEOUT>.",
                 timeout,
                 error,
+                wake_on_mutation=True,
+                polling=polling,
             )
             return
         self._wait_until(
@@ -294,6 +396,8 @@ class WaitingKeywords(LibraryComponent):
             f'Page should have not contained "{limit}" {locator} element(s) within <TIMEOUT>.',
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -302,6 +406,7 @@ class WaitingKeywords(LibraryComponent):
         locator: Locator,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the element ``locator`` is visible.
 
@@ -311,12 +416,17 @@ class WaitingKeywords(LibraryComponent):
         about the locator syntax.
 
         ``error`` can be used to override the default error message.
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         self._wait_until(
             lambda: self.is_visible(locator),
             f"Element '{locator}' not visible after <TIMEOUT>.",
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -325,6 +435,7 @@ class WaitingKeywords(LibraryComponent):
         locator: Locator,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the element ``locator`` is not visible.
 
@@ -334,12 +445,17 @@ class WaitingKeywords(LibraryComponent):
         about the locator syntax.
 
         ``error`` can be used to override the default error message.
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         self._wait_until(
             lambda: not self.is_visible(locator),
             f"Element '{locator}' still visible after <TIMEOUT>.",
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -348,6 +464,7 @@ class WaitingKeywords(LibraryComponent):
         locator: Locator,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the element ``locator`` is enabled.
 
@@ -362,12 +479,17 @@ class WaitingKeywords(LibraryComponent):
 
         Considering read-only elements to be disabled is a new feature
         in SeleniumLibrary 3.0.
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         self._wait_until(
             lambda: self.is_element_enabled(locator),
             f"Element '{locator}' was not enabled in <TIMEOUT>.",
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -377,6 +499,7 @@ class WaitingKeywords(LibraryComponent):
         text: str,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the element ``locator`` contains ``text``.
 
@@ -386,12 +509,17 @@ class WaitingKeywords(LibraryComponent):
         about the locator syntax.
 
         ``error`` can be used to override the default error message.
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         self._wait_until(
             lambda: text in self.find_element(locator).text,
             f"Element '{locator}' did not get text '{text}' in <TIMEOUT>.",
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
     @keyword
@@ -401,6 +529,7 @@ class WaitingKeywords(LibraryComponent):
         text: str,
         timeout: timedelta | None = None,
         error: str | None = None,
+        polling: str | None = None,
     ):
         """Waits until the element ``locator`` does not contain ``text``.
 
@@ -410,26 +539,51 @@ class WaitingKeywords(LibraryComponent):
         about the locator syntax.
 
         ``error`` can be used to override the default error message.
+
+        ``polling`` overrides the default `polling` strategy. It is new in
+        SeleniumLibrary 6.9.
         """
         self._wait_until(
             lambda: text not in self.find_element(locator).text,
             f"Element '{locator}' still had text '{text}' after <TIMEOUT>.",
             timeout,
             error,
+            wake_on_mutation=True,
+            polling=polling,
         )
 
-    def _wait_until(self, condition, error, timeout=None, custom_error=None):
+    def _wait_until(
+        self,
+        condition,
+        error,
+        timeout=None,
+        custom_error=None,
+        wake_on_mutation=False,
+        polling=None,
+    ):
         timeout = self.get_timeout(timeout)
         if custom_error is None:
             error = error.replace("<TIMEOUT>", secs_to_timestr(timeout))
         else:
             error = custom_error
-        self._wait_until_worker(condition, timeout, error)
+        polling = self.get_polling(polling, DEFAULT_POLLING)
+        self._wait_until_worker(condition, timeout, error, wake_on_mutation, polling)
 
-    def _wait_until_worker(self, condition, timeout, error):
+    def _wait_until_worker(
+        self,
+        condition,
+        timeout,
+        error,
+        wake_on_mutation=False,
+        polling=DEFAULT_POLLING,
+    ):
         max_time = time.time() + timeout
         not_found = None
+        intervals = polling.intervals()
+        wake_on_mutation = wake_on_mutation and self.ctx.event_driven_waits
+        mutations = None
         while time.time() < max_time:
+            checked = time.time()
             try:
                 if condition():
                     return
@@ -440,5 +594,31 @@ class WaitingKeywords(LibraryComponent):
                 not_found = err
             else:
                 not_found = None
-            time.sleep(0.2)
+            if wake_on_mutation:
+                wake_on_mutation, mutations = self._wait_for_mutation(
+                    max_time, checked, mutations
+                )
+            else:
+                sleep(min(next(intervals), max(max_time - time.time(), 0)))
         raise AssertionError(not_found or error)
+
+    def _wait_for_mutation(self, max_time, checked, mutations):
+        # The condition is still checked in Python, the browser only tells
+        # when it is worth checking again. Returns the number of DOM changes
+        # seen so far and False if waiting in the browser is not possible
+        # and polling should be used instead.
+        delay = min(max_time - time.time(), MAX_MUTATION_WAIT)
+        if delay <= 0:
+            return True, mutations
+        try:
+            mutations = self.driver.execute_async_script(
+                WAIT_FOR_MUTATION_SCRIPT, mutations, delay * 1000
+            )
+        except WebDriverException as error:
+            self.debug(f"Waiting for DOM changes failed, polling instead: {error}")
+            return False, None
+        now = time.time()
+        debounce = min(checked + MIN_MUTATION_INTERVAL, max_time) - now
+        if debounce > 0:
+            sleep(debounce)
+        return True, mutations
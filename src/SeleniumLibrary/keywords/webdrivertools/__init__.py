@@ -16,6 +16,12 @@
 
 from .webdrivertools import WebDriverCreator  # noqa
 from .webdrivertools import WebDriverCache  # noqa
+from .browserpool import BrowserPool  # noqa
+from .commandpipeline import CommandPipeline  # noqa
+from .commandpipeline import CommandStatistics  # noqa
+from .commandpipeline import RetryMiddleware  # noqa
+from .commandpipeline import SpeedMiddleware  # noqa
+from .commandtrace import CommandTrace  # noqa
 from .webdrivertools import SeleniumOptions  # noqa
 from .webdrivertools import SeleniumService  # noqa
 from .sl_file_detector import SelLibLocalFileDetector  # noqa
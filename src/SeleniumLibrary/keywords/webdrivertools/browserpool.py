@@ -0,0 +1,212 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections import defaultdict, deque
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import NamedTuple
+
+from robot.api import logger
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+
+RESET_STEPS = ("windows", "storage", "cookies", "blank")
+
+CLEAR_STORAGE_SCRIPT = """
+try {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+} catch (error) {
+    // Storage is not available on all pages, e.g. about:blank.
+}
+"""
+
+
+class PoolStatistics(NamedTuple):
+    size: int
+    idle: int
+    in_use: int
+    hits: int
+    misses: int
+
+
+def reset_browser(driver, steps: tuple[str, ...] = RESET_STEPS):
+    """Returns a browser to the state of a newly started browser.
+
+    ``steps`` tells what to reset and in which order:
+    - ``windows``: Closes all but the first window.
+    - ``storage``: Clears local and session storage of the current page.
+    - ``cookies``: Deletes cookies of the current page. With Chromium
+      based browsers cookies of all domains are deleted.
+    - ``blank``: Opens ``about:blank``.
+    """
+    if "windows" in steps:
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+    if "storage" in steps:
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+    if "cookies" in steps:
+        driver.delete_all_cookies()
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    if "blank" in steps:
+        driver.get("about:blank")
+
+
+def get_reset(value: str | None) -> Callable:
+    """Returns a reset function for steps separated with semicolons.
+
+    ``None`` means all steps and ``NONE`` means no reset at all.
+    """
+    if value is None:
+        return reset_browser
+    steps = tuple(step.strip().lower() for step in value.split(";") if step.strip())
+    if steps == ("none",):
+        steps = ()
+    invalid = [step for step in steps if step not in RESET_STEPS]
+    if invalid:
+        raise ValueError(
+            f"Invalid browser reset step '{invalid[0]}'. Valid steps are "
+            f"{', '.join(RESET_STEPS)} and NONE."
+        )
+    return partial(reset_browser, steps=steps)
+
+
+class BrowserPool:
+    def __init__(self, size: int, reset: Callable = reset_browser, reuse: bool = False):
+        """Pool of browsers started in advance in background threads.
+
+        Browsers are pooled by a key describing how they were created, so
+        that only a browser created the same way is handed out. When a
+        browser is taken from the pool, a new one is started to replace
+        it. Released browsers are reset and returned to the pool if there
+        is room for them or if ``reuse`` is true.
+
+        :param size: Number of browsers to keep ready for each key. Zero
+            means that browsers are not started in advance.
+        :type size: int
+        :param reset: Function resetting the state of a released browser.
+        :type reset: Callable
+        :param reuse: Keep all released browsers for later use.
+        :type reuse: bool
+        """
+        self.size = size
+        self.reset = reset
+        self.reuse = reuse
+        self.hits = 0
+        self.misses = 0
+        self._idle: dict[Hashable, deque[Future]] = defaultdict(deque)
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(size, 1),
+            thread_name_prefix="SeleniumLibrary-browser-pool",
+        )
+
+    def acquire(self, key: Hashable, create: Callable):
+        """Returns a browser created with ``create`` for ``key``.
+
+        A browser from the pool is used if there is one. Otherwise, a new
+        browser is created directly. In both cases, the pool is filled in
+        the background so that the next call gets a ready browser.
+        """
+        with self._lock:
+            idle = self._idle[key]
+            future = idle.popleft() if idle else None
+        driver = self._get_started(future)
+        hit = driver is not None
+        if not hit:
+            driver = create()
+        self._fill(key, create)
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._in_use[driver] = key
+        return driver
+
+    def _get_started(self, future):
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as error:
+            logger.debug(f"Starting browser in background failed: {error}")
+            return None
+
+    def _fill(self, key, create):
+        with self._lock:
+            idle = self._idle[key]
+            while len(idle) < self.size:
+                idle.append(self._executor.submit(create))
+
+    def release(self, driver) -> bool:
+        """Resets ``driver`` and returns it to the pool.
+
+        Returns ``False`` if the browser was not taken from this pool or
+        the pool is already full. The caller is then responsible for
+        quitting the browser.
+        """
+        if isinstance(driver, EventFiringWebDriver):
+            driver = driver.wrapped_driver
+        with self._lock:
+            key = self._in_use.pop(driver, None)
+            if key is None:
+                return False
+            if not self.reuse and len(self._idle[key]) >= self.size:
+                return False
+        try:
+            self.reset(driver)
+        except Exception as error:
+            logger.debug(f"Resetting browser failed: {error}")
+            return False
+        future = Future()
+        future.set_result(driver)
+        with self._lock:
+            self._idle[key].appendleft(future)
+        return True
+
+    def close(self):
+        """Quits all browsers in the pool."""
+        with self._lock:
+            futures = [future for idle in self._idle.values() for future in idle]
+            self._idle.clear()
+        for future in futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        for future in futures:
+            driver = None if future.cancelled() else self._get_started(future)
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception as error:
+                    logger.debug(f"Quitting pooled browser failed: {error}")
+
+    @property
+    def statistics(self) -> PoolStatistics:
+        with self._lock:
+            return PoolStatistics(
+                self.size,
+                sum(len(futures) for futures in self._idle.values()),
+                len(self._in_use),
+                self.hits,
+                self.misses,
+            )
@@ -0,0 +1,154 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import types
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import NamedTuple
+
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+from urllib3.exceptions import HTTPError
+
+
+class CommandPipeline:
+    def __init__(self, middlewares: Iterable[Callable] = ()):
+        """Chain of middlewares around ``WebDriver.execute``.
+
+        A middleware is a callable getting the driver, the command name,
+        the command parameters and a function that executes the command
+        with the rest of the chain. It must return the command response.
+        Middlewares are run in the order they are in ``middlewares``, so
+        the first middleware sees the whole execution of the others.
+
+        Middlewares can be added and removed at any time and the change
+        affects all drivers the pipeline has been installed to.
+
+        :param middlewares: Initial middlewares.
+        :type middlewares: Iterable[Callable]
+        """
+        self.middlewares = list(middlewares)
+
+    def install(self, driver):
+        """Routes commands of ``driver`` through this pipeline."""
+        if isinstance(driver, EventFiringWebDriver):
+            driver = driver.wrapped_driver
+        if not hasattr(driver, "_base_execute"):
+            driver._base_execute = driver.execute
+            driver.execute = types.MethodType(_execute, driver)
+        driver._command_pipeline = self
+
+    def execute(self, driver, command: str, params: dict | None = None):
+        middlewares = tuple(self.middlewares)
+
+        def call(index, command, params):
+            if index == len(middlewares):
+                return driver._base_execute(command, params)
+            proceed = partial(call, index + 1)
+            return middlewares[index](driver, command, params, proceed)
+
+        return call(0, command, params)
+
+
+def _execute(driver, driver_command, params=None):
+    return driver._command_pipeline.execute(driver, driver_command, params)
+
+
+class SpeedMiddleware:
+    """Waits the Selenium speed of the driver after each command."""
+
+    def __call__(self, driver, command, params, execute):
+        result = execute(command, params)
+        speed = driver._speed if hasattr(driver, "_speed") else 0.0
+        if speed > 0:
+            time.sleep(speed)
+        return result
+
+
+class RetryMiddleware:
+    def __init__(
+        self,
+        retries: int = 1,
+        delay: float = 0.5,
+        exceptions: tuple[type[Exception], ...] = (HTTPError, ConnectionError),
+        commands: Iterable[str] | None = None,
+    ):
+        """Retries commands failing because of connection problems.
+
+        :param retries: How many times a failed command is retried.
+        :type retries: int
+        :param delay: Seconds to wait before retrying.
+        :type delay: float
+        :param exceptions: Errors causing a retry. By default, errors in
+            the connection to the driver.
+        :type exceptions: tuple[type[Exception], ...]
+        :param commands: Names of commands to retry. By default, all
+            commands are retried, which is safe only if failing commands
+            never reach the browser.
+        :type commands: Iterable[str] | None
+        """
+        self.retries = retries
+        self.delay = delay
+        self.exceptions = exceptions
+        self.commands = None if commands is None else set(commands)
+
+    def __call__(self, driver, command, params, execute):
+        retries = self.retries if self._retry(command) else 0
+        for _ in range(retries):
+            try:
+                return execute(command, params)
+            except self.exceptions:
+                time.sleep(self.delay)
+        return execute(command, params)
+
+    def _retry(self, command):
+        return self.commands is None or command in self.commands
+
+
+class CommandStatistic(NamedTuple):
+    commands: int
+    time: float
+
+
+class CommandStatistics:
+    def __init__(self, keyword: Callable[[], str | None] = lambda: None):
+        """Counts and times commands per running keyword.
+
+        :param keyword: Returns the name of the running keyword. Commands
+            executed outside keywords are counted under ``None``.
+        :type keyword: Callable[[], str | None]
+        """
+        self.keyword = keyword
+        self.statistics: dict[str | None, CommandStatistic] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, driver, command, params, execute):
+        keyword = self.keyword()
+        start = time.perf_counter()
+        try:
+            return execute(command, params)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                commands, total = self.statistics.get(keyword, (0, 0.0))
+                self.statistics[keyword] = CommandStatistic(
+                    commands + 1, total + elapsed
+                )
+
+    def reset(self):
+        with self._lock:
+            self.statistics = {}
@@ -0,0 +1,107 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+
+from robot.utils import printable_name
+
+
+class CommandTrace:
+    def __init__(
+        self,
+        path: str,
+        keyword: Callable[[], str | None] = lambda: None,
+        scope: Callable[[], tuple[str | None, str | None]] = lambda: (None, None),
+    ):
+        """Writes every WebDriver command to a trace file.
+
+        The trace is newline-delimited JSON, compressed with gzip if
+        ``path`` ends with ``.gz``. Each command is written when it has
+        been executed, so memory usage does not grow with the trace. Each
+        line contains the start ``timestamp`` as seconds since the epoch,
+        the ``duration`` in seconds, the ``command`` name, the ``session``
+        id, sizes of the JSON serialized ``request`` and ``response``,
+        the running ``keyword``, ``suite`` and ``test``, and the ``error``
+        if the command failed.
+
+        :param path: Trace file.
+        :type path: str
+        :param keyword: Returns the name of the running keyword.
+        :type keyword: Callable[[], str | None]
+        :param scope: Returns long names of the running suite and test.
+            Called for every command, also in threads where Robot Framework
+            is not available, so it must not use Robot Framework APIs.
+        :type scope: Callable[[], tuple[str | None, str | None]]
+        """
+        self.path = path
+        self.keyword = keyword
+        self.scope = scope
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        opener = gzip.open if path.lower().endswith(".gz") else open
+        # The file is kept open until the library is closed.
+        self._file = opener(path, "wt", encoding="UTF-8")
+        self._lock = threading.Lock()
+
+    def __call__(self, driver, command, params, execute):
+        timestamp = time.time()
+        start = time.perf_counter()
+        try:
+            response = execute(command, params)
+        except Exception as error:
+            self._write(driver, command, params, None, timestamp, start, error)
+            raise
+        self._write(driver, command, params, response, timestamp, start)
+        return response
+
+    def _write(self, driver, command, params, response, timestamp, start, error=None):
+        duration = time.perf_counter() - start
+        suite, test = self.scope()
+        record = {
+            "timestamp": timestamp,
+            "duration": duration,
+            "command": command,
+            "session": getattr(driver, "session_id", None),
+            "request": _size(params),
+            "response": _size(response),
+            "keyword": _printable(self.keyword()),
+            "suite": suite,
+            "test": test,
+            "error": type(error).__name__ if error else None,
+        }
+        line = json.dumps(record, default=str)
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(f"{line}\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def _printable(keyword):
+    return printable_name(keyword, code_style=True) if keyword else None
+
+
+def _size(value) -> int:
+    # Values can contain WebElements, which are serialized as strings.
+    return 0 if value is None else len(json.dumps(value, default=str))
@@ -17,22 +17,29 @@ import ast
 import importlib
 import inspect
 import os
+import subprocess
+import threading
+import time
 import token
+from collections import deque
 from inspect import signature
 from io import StringIO
 from tokenize import generate_tokens
 from typing import ClassVar
 
 from robot.api import logger
-from robot.utils import ConnectionCache
+from robot.utils import ConnectionCache, secs_to_timestr
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import FirefoxProfile
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.ie.service import Service as IeService
 from selenium.webdriver.safari.service import Service as SafariService
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
 
+from SeleniumLibrary.keywords.webdrivertools.browserpool import BrowserPool
 from SeleniumLibrary.keywords.webdrivertools.sl_file_detector import (
     SelLibLocalFileDetector,
 )
@@ -386,9 +393,15 @@ class WebDriverCreator:
 
 
 class WebDriverCache(ConnectionCache):
-    def __init__(self):
+    max_quit_workers = 8
+
+    def __init__(self, pool: BrowserPool | None = None, quit_timeout: float = 60.0):
         ConnectionCache.__init__(self, no_current_msg="No current browser")
+        # Closed state is tracked by index, because a browser pool can hand
+        # a closed driver out again and it is then registered with a new index.
         self._closed = set()
+        self.pool = pool
+        self.quit_timeout = quit_timeout
 
     @property
     def drivers(self):
@@ -397,19 +410,30 @@ class WebDriverCache(ConnectionCache):
     @property
     def active_drivers(self):
         open_drivers = []
-        for driver in self._connections:
-            if driver not in self._closed:
+        for index, driver in enumerate(self._connections):
+            if index + 1 not in self._closed:
                 open_drivers.append(driver)
         return open_drivers
 
     @property
     def active_driver_ids(self):
         open_driver_ids = []
-        for index, driver in enumerate(self._connections):
-            if driver not in self._closed:
-                open_driver_ids.append(index + 1)
+        for index in range(1, len(self._connections) + 1):
+            if index not in self._closed:
+                open_driver_ids.append(index)
         return open_driver_ids
 
+    @property
+    def current_index(self):
+        for index, driver in enumerate(self._connections):
+            if driver is self.current and index + 1 not in self._closed:
+                return index + 1
+        return None
+
+    @current_index.setter
+    def current_index(self, index):
+        ConnectionCache.current_index.fset(self, index)
+
     @property
     def active_aliases(self):
         return self._aliases
@@ -417,19 +441,23 @@ class WebDriverCache(ConnectionCache):
     def close(self):
         if self.current:
             driver = self.current
+            index = self.current_index
             error = self._quit(driver, None)
             for alias in self._aliases:
-                if self._aliases[alias] == self.current_index:
+                if self._aliases[alias] == index:
                     del self._aliases[alias]
             self.current = self._no_current
-            self._closed.add(driver)
+            self._closed.add(index)
             if error:
                 raise error
 
     def close_all(self):
-        error = None
-        for driver in self._connections:
-            if driver not in self._closed:
+        drivers = self.active_drivers
+        if len(drivers) > 1:
+            error = self._quit_in_parallel(drivers)
+        else:
+            error = None
+            for driver in drivers:
                 error = self._quit(driver, error)
         self.empty_cache()
         if error:
@@ -437,20 +465,61 @@ class WebDriverCache(ConnectionCache):
         return self.current
 
     def _quit(self, driver, error):
+        exception = self._release_or_quit(driver)
+        return self._log_quit_error(exception) if exception else error
+
+    def _release_or_quit(self, driver):
         try:
-            driver.quit()
+            if self.pool is None or not self.pool.release(driver):
+                driver.quit()
         except Exception as exception:
-            logger.error(f"When closing browser, received exception: {exception}")
-            error = exception
+            return exception
+        return None
+
+    def _log_quit_error(self, exception):
+        logger.error(f"When closing browser, received exception: {exception}")
+        return exception
+
+    def _quit_in_parallel(self, drivers):
+        # Errors are logged in the main thread, because Robot Framework
+        # ignores messages logged by other threads.
+        quits = _ParallelQuit(drivers, self._release_or_quit)
+        for _ in range(min(len(drivers), self.max_quit_workers)):
+            quits.start_worker()
+        results, timed_out = quits.wait(self.quit_timeout)
+        error = None
+        for index, driver in enumerate(drivers):
+            if index not in timed_out:
+                exception = results[index]
+            else:
+                self._kill_service(driver)
+                exception = TimeoutException(
+                    "Closing browser did not finish in "
+                    f"{secs_to_timestr(self.quit_timeout)}."
+                )
+            if exception:
+                error = self._log_quit_error(exception)
         return error
 
+    def _kill_service(self, driver):
+        if isinstance(driver, EventFiringWebDriver):
+            driver = driver.wrapped_driver
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if isinstance(process, subprocess.Popen):
+            logger.debug(f"Killing hung browser driver process {process.pid}.")
+            process.kill()
+
     def get_index(self, alias_or_index):
         index = self._get_index(alias_or_index)
         try:
-            driver = self.get_connection(index)
+            self.get_connection(index)
         except RuntimeError:
             return None
-        return None if driver in self._closed else index
+        return None if index in self._closed else index
+
+    def empty_cache(self):
+        ConnectionCache.empty_cache(self)
+        self._closed = set()
 
     def _get_index(self, alias_or_index):
         try:
@@ -467,6 +536,68 @@ class WebDriverCache(ConnectionCache):
             return None
 
 
+class _ParallelQuit:
+    def __init__(self, drivers, quit_driver):
+        """Quits ``drivers`` with ``quit_driver`` in daemon threads.
+
+        Daemon threads do not prevent the interpreter from exiting if a
+        quit hangs, for example, against a remote Selenium Grid where there
+        is no local driver process to kill. The timeout of each quit starts
+        when the quit starts, and a worker hung on a timed out quit is
+        replaced so that the remaining browsers are still quit.
+        """
+        self._drivers = drivers
+        self._quit = quit_driver
+        self._pending = deque(range(len(drivers)))
+        self._started: dict[int, float] = {}
+        self._results: dict[int, Exception | None] = {}
+        self._condition = threading.Condition()
+
+    def start_worker(self):
+        threading.Thread(
+            target=self._work, name="SeleniumLibrary-quit", daemon=True
+        ).start()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                if not self._pending:
+                    return
+                index = self._pending.popleft()
+                self._started[index] = time.monotonic()
+                self._condition.notify_all()
+            result = self._quit(self._drivers[index])
+            with self._condition:
+                self._results[index] = result
+                self._condition.notify_all()
+
+    def wait(self, timeout: float) -> tuple[dict, set]:
+        """Returns results of finished quits and indexes of timed out quits."""
+        timed_out = set()
+        with self._condition:
+            while len(self._results) + len(timed_out) < len(self._drivers):
+                now = time.monotonic()
+                running = {
+                    index: started
+                    for index, started in self._started.items()
+                    if index not in self._results and index not in timed_out
+                }
+                for index, started in running.items():
+                    if now - started >= timeout:
+                        timed_out.add(index)
+                        self.start_worker()
+                deadlines = [
+                    started + timeout
+                    for index, started in running.items()
+                    if index not in timed_out
+                ]
+                if len(self._results) + len(timed_out) < len(self._drivers):
+                    self._condition.wait(
+                        max(min(deadlines) - now, 0) if deadlines else None
+                    )
+            return dict(self._results), timed_out
+
+
 class SeleniumService:
     def create(self, browser, service):
         if not service:
@@ -18,6 +18,8 @@ import time
 from selenium.common.exceptions import NoSuchWindowException
 
 from SeleniumLibrary.base import LibraryComponent, keyword
+from SeleniumLibrary.keywords.frames import clear_frame_cache
+from SeleniumLibrary.keywords.tableelement import clear_table_snapshot_cache
 from SeleniumLibrary.locators import WindowManager
 from SeleniumLibrary.utils import is_falsy, is_truthy, plural_or_not, timestr_to_secs
 
@@ -73,7 +75,10 @@ class WindowKeywords(LibraryComponent):
           opens a new window.
 
         The ``timeout`` is used to specify how long keyword will poll to select
-        the new window. The ``timeout`` is new in SeleniumLibrary 3.2.
+        the new window. The ``timeout`` is new in SeleniumLibrary 3.2. The
+        delay between attempts grows from 50 milliseconds to half a second,
+        and windows that did not match earlier are checked again only when
+        no new windows have been opened.
 
         Example:
         | `Click Link`      | popup1      |      | # Open new window |
@@ -115,6 +120,9 @@ class WindowKeywords(LibraryComponent):
         except NoSuchWindowException:
             pass
         finally:
+            self.element_finder.clear_element_cache()
+            clear_frame_cache(self.ctx)
+            clear_table_snapshot_cache(self.ctx)
             if not isinstance(browser, str) or browser.upper() != "CURRENT":
                 self.drivers.switch(browser)
             self._window_manager.select(locator, timeout)
@@ -122,6 +130,10 @@ class WindowKeywords(LibraryComponent):
     @keyword
     def close_window(self):
         """Closes currently opened and selected browser window/tab."""
+        self.element_finder.clear_element_cache()
+        self._window_manager.clear_cache()
+        clear_frame_cache(self.ctx)
+        clear_table_snapshot_cache(self.ctx)
         self.driver.close()
 
     @keyword
@@ -141,7 +153,8 @@ class WindowKeywords(LibraryComponent):
         """Returns and logs id attributes of all windows of the selected browser.
 
         How to select the ``browser`` scope of this keyword, see `Get Locations`."""
-        ids = [info.id for info in self._window_manager.get_window_infos(browser)]
+        infos = self._window_manager.get_window_infos(browser, ("id",))
+        ids = [info.id for info in infos]
         return self._log_list(ids)
 
     @keyword
@@ -149,7 +162,8 @@ class WindowKeywords(LibraryComponent):
         """Returns and logs names of all windows of the selected browser.
 
         How to select the ``browser`` scope of this keyword, see `Get Locations`."""
-        names = [info.name for info in self._window_manager.get_window_infos(browser)]
+        infos = self._window_manager.get_window_infos(browser, ("name",))
+        names = [info.name for info in infos]
         return self._log_list(names)
 
     @keyword
@@ -157,7 +171,8 @@ class WindowKeywords(LibraryComponent):
         """Returns and logs titles of all windows of the selected browser.
 
         How to select the ``browser`` scope of this keyword, see `Get Locations`."""
-        titles = [info.title for info in self._window_manager.get_window_infos(browser)]
+        infos = self._window_manager.get_window_infos(browser, ("title",))
+        titles = [info.title for info in infos]
         return self._log_list(titles)
 
     @keyword
@@ -175,8 +190,13 @@ class WindowKeywords(LibraryComponent):
           the currently active browser is selected.
 
         - If ``browser`` is ``ALL`` (case-insensitive)
-          the window information of all windows of all opened browsers are returned."""
-        urls = [info.url for info in self._window_manager.get_window_infos(browser)]
+          the window information of all windows of all opened browsers are returned.
+          Browsers are queried in parallel.
+
+        With Chromium based browsers, titles and URLs are read without
+        switching between windows. See also `Window information cache`."""
+        infos = self._window_manager.get_window_infos(browser, ("url",))
+        urls = [info.url for info in infos]
         return self._log_list(urls)
 
     @keyword
@@ -16,4 +16,4 @@
 
 from .customlocator import CustomLocator  # noqa
 from .elementfinder import ElementFinder  # noqa
-from .windowmanager import WindowManager  # noqa
+from .windowmanager import WindowInfoCache, WindowManager  # noqa
@@ -0,0 +1,132 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# JavaScript used to resolve locators inside the browser. The functions
+# mirror how WebDriver implements the corresponding `By` strategies, so
+# that a chain resolved in the browser returns the same elements as
+# resolving the chain one WebDriver call at a time.
+LOCATOR_FUNCTIONS = """
+function slFindByXpath(xpath, context) {
+    var doc = context.ownerDocument || context;
+    var result = doc.evaluate(
+        xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    var elements = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        var node = result.snapshotItem(i);
+        if (node.nodeType === 1) {
+            elements.push(node);
+        }
+    }
+    return elements;
+}
+function slFindByCss(css, context) {
+    return Array.prototype.slice.call(context.querySelectorAll(css));
+}
+function slLinkText(element) {
+    if (!element.getClientRects().length) {
+        return "";
+    }
+    return (element.innerText || "").trim();
+}
+function slFindLinks(context, matches) {
+    return slFindByCss("a", context).filter(function (element) {
+        return matches(slLinkText(element));
+    });
+}
+function slFind(strategy, criteria, context) {
+    switch (strategy) {
+        case "css":
+            return slFindByCss(criteria, context);
+        case "xpath":
+            return slFindByXpath(criteria, context);
+        case "id":
+            return slFindByCss('[id="' + CSS.escape(criteria) + '"]', context);
+        case "name":
+            return slFindByCss('[name="' + CSS.escape(criteria) + '"]', context);
+        case "identifier":
+            return slFind("id", criteria, context).concat(
+                slFind("name", criteria, context)
+            );
+        case "class":
+            return slFindByCss("." + CSS.escape(criteria), context);
+        case "tag":
+            return slFindByCss(criteria, context);
+        case "link":
+            return slFindLinks(context, function (text) {
+                return text === criteria;
+            });
+        case "partial link":
+            return slFindLinks(context, function (text) {
+                return text.indexOf(criteria) !== -1;
+            });
+    }
+    throw new Error("Unsupported browser locator strategy: " + strategy);
+}
+function slMatches(element, tag, constraints) {
+    if (element.tagName.toLowerCase() !== tag) {
+        return false;
+    }
+    for (var name in constraints) {
+        // Same lookup order as WebElement.get_attribute: property first.
+        var value = name in element ? element[name] : element.getAttribute(name);
+        var expected = constraints[name];
+        if (Array.isArray(expected) ? expected.indexOf(value) === -1
+                                    : value !== expected) {
+            return false;
+        }
+    }
+    return true;
+}
+function slFilter(elements, tag, constraints) {
+    if (tag === null) {
+        return elements;
+    }
+    return elements.filter(function (element) {
+        return slMatches(element, tag, constraints);
+    });
+}
+function slFindChain(chain, root, tag, constraints) {
+    var context = root || document;
+    for (var i = 0; i < chain.length - 1; i++) {
+        var found = slFind(chain[i][0], chain[i][1], context);
+        if (!found.length) {
+            return {missing: i};
+        }
+        context = found[0];
+    }
+    var last = chain[chain.length - 1];
+    var elements = slFind(last[0], last[1], context);
+    return {elements: slFilter(elements, tag, constraints)};
+}
+"""
+
+FIND_CHAIN_SCRIPT = f"""{LOCATOR_FUNCTIONS}
+return slFindChain(arguments[0], arguments[1], arguments[2], arguments[3]);
+"""
+
+# Returns indexes, not elements, so that the caller can keep the element
+# objects it already has, e.g. EventFiringWebElement wrappers.
+FILTER_ELEMENTS_SCRIPT = f"""{LOCATOR_FUNCTIONS}
+var elements = arguments[0], tag = arguments[1], constraints = arguments[2];
+var indexes = [];
+for (var i = 0; i < elements.length; i++) {{
+    if (slMatches(elements[i], tag, constraints)) {{
+        indexes.push(i);
+    }}
+}}
+return indexes;
+"""
@@ -17,6 +17,11 @@ import re
 
 from robot.api import logger
 from robot.utils import NormalizedDict
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.event_firing_webdriver import EventFiringWebElement
@@ -25,12 +30,23 @@ from SeleniumLibrary.base import ContextAware
 from SeleniumLibrary.errors import ElementNotFound
 from SeleniumLibrary.utils import escape_xpath_value, events, is_falsy
 
+from .browserlocator import FILTER_ELEMENTS_SCRIPT, FIND_CHAIN_SCRIPT
 from .customlocator import CustomLocator
+from .locatorcache import CacheInfo, CompiledLocator, LocatorCache, LocatorPart
+
+IMPLICIT_XPATH = re.compile(r"\(*//")
+# Prefixes handled before location strategies, like ``frame:`` used by frame
+# paths in `Select Frame`, cannot be custom strategy names.
+RESERVED_STRATEGIES = ("frame",)
 
 
 class ElementFinder(ContextAware):
     def __init__(self, ctx):
         ContextAware.__init__(self, ctx)
+        self._locator_cache = LocatorCache()
+        self.chain_locators_in_browser = False
+        self.element_cache = False
+        self._element_cache = {}
         strategies = {
             "identifier": self._find_by_identifier,
             "id": self._find_by_id,
@@ -52,6 +68,20 @@ class ElementFinder(ContextAware):
             initial=strategies, caseless=True, spaceless=True
         )
         self._default_strategies = list(strategies)
+        self._browser_strategies = {
+            strategies[name]: name
+            for name in (
+                "identifier",
+                "id",
+                "name",
+                "xpath",
+                "link",
+                "partial link",
+                "css",
+                "class",
+                "tag",
+            )
+        }
         self._key_attrs = {
             None: ["@id", "@name"],
             "a": [
@@ -83,6 +113,11 @@ class ElementFinder(ContextAware):
         required=True,
         parent=None,
     ):
+        if isinstance(locator, str):
+            compiled = self._get_compiled_locator(locator, tag)
+            if self.element_cache and first_only:
+                return self._find_cached(compiled, (locator, tag), required, parent)
+            return self._find_compiled(compiled, first_only, required, parent)
         element = parent
         locators = self._split_locator(locator)
         for split_locator in locators[:-1]:
@@ -91,6 +126,100 @@ class ElementFinder(ContextAware):
             )
         return self._find(locators[-1], tag, first_only, required, element)
 
+    def clear_element_cache(self):
+        self._element_cache.clear()
+
+    @property
+    def locator_cache_info(self) -> CacheInfo:
+        """Hits, misses and size of the compiled locator cache."""
+        return self._locator_cache.info
+
+    def _get_compiled_locator(self, locator: str, tag=None) -> CompiledLocator:
+        key = (locator, tag)
+        compiled = self._locator_cache.get(key)
+        if compiled is None:
+            compiled = self._compile_locator(locator, tag)
+            self._locator_cache.put(key, compiled)
+        return compiled
+
+    def _compile_locator(self, locator: str, tag=None) -> CompiledLocator:
+        parts = []
+        for split_locator in self._split_locator(locator):
+            prefix, criteria = self._parse_locator(split_locator)
+            strategy = self._strategies[prefix]
+            parts.append(LocatorPart(split_locator, prefix, criteria, strategy))
+        element_type = "Element" if not tag else tag.capitalize()
+        tag, constraints = self._get_tag_and_constraints(tag)
+        return CompiledLocator(
+            parts=tuple(parts),
+            element_type=element_type,
+            tag=tag,
+            constraints=tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in constraints.items()
+            ),
+            xpath_constraints=tuple(self._get_xpath_constraints(constraints)),
+            browser_chain=self._get_browser_chain(parts),
+        )
+
+    def _get_browser_chain(self, parts):
+        # Only chains made of built-in, WebDriver based strategies can be
+        # resolved in the browser with the same results.
+        if len(parts) < 2:
+            return None
+        chain = []
+        for part in parts:
+            name = self._browser_strategies.get(part.strategy)
+            if name is None:
+                return None
+            chain.append((name, part.criteria))
+        return tuple(chain)
+
+    def _find_compiled(self, compiled: CompiledLocator, first_only, required, parent):
+        self._verify_parent(parent)
+        if self.chain_locators_in_browser and compiled.browser_chain:
+            elements = self._find_chain_in_browser(compiled, parent)
+            if elements is not None:
+                return self._get_result(
+                    elements,
+                    compiled.element_type,
+                    compiled.parts[-1].locator,
+                    first_only,
+                    required,
+                )
+        element = parent
+        for part in compiled.parts[:-1]:
+            element = self._find_with_strategy(
+                part, "Element", None, {}, True, True, element, xpath_constraints=()
+            )
+        return self._find_with_strategy(
+            compiled.parts[-1],
+            compiled.element_type,
+            compiled.tag,
+            compiled.get_constraints(),
+            first_only,
+            required,
+            element,
+            compiled.xpath_constraints,
+        )
+
+    def _find_cached(self, compiled: CompiledLocator, key, required, parent):
+        self._verify_parent(parent)
+        key = (*key, parent.id if parent else None)
+        element = self._element_cache.get(key)
+        if element is not None:
+            try:
+                # Cheap call that fails if the element is no longer in the DOM.
+                element.tag_name  # noqa: B018
+                return element
+            except (NoSuchElementException, StaleElementReferenceException):
+                # Elements of another browsing context may not be found.
+                del self._element_cache[key]
+        element = self._find_compiled(compiled, True, required, parent)
+        if element is not None:
+            self._element_cache[key] = element
+        return element
+
     def _split_locator(self, locator: str | list) -> list:
         if isinstance(locator, list):
             return locator
@@ -110,16 +239,39 @@ class ElementFinder(ContextAware):
 
     def _find(self, locator, tag=None, first_only=True, required=True, parent=None):
         element_type = "Element" if not tag else tag.capitalize()
-        if parent and not self._is_webelement(parent):
-            raise ValueError(
-                f"Parent must be Selenium WebElement but it was {type(parent)}."
-            )
+        self._verify_parent(parent)
         if self._is_webelement(locator):
             return locator
         prefix, criteria = self._parse_locator(locator)
-        strategy = self._strategies[prefix]
+        part = LocatorPart(locator, prefix, criteria, self._strategies[prefix])
         tag, constraints = self._get_tag_and_constraints(tag)
-        elements = strategy(criteria, tag, constraints, parent=parent or self.driver)
+        return self._find_with_strategy(
+            part, element_type, tag, constraints, first_only, required, parent
+        )
+
+    def _find_with_strategy(
+        self,
+        part: LocatorPart,
+        element_type,
+        tag,
+        constraints,
+        first_only,
+        required,
+        parent,
+        xpath_constraints=None,
+    ):
+        parent = parent or self.driver
+        if xpath_constraints is not None and part.strategy == self._find_by_default:
+            elements = self._find_by_default(
+                part.criteria, tag, constraints, parent, xpath_constraints
+            )
+        else:
+            elements = part.strategy(part.criteria, tag, constraints, parent=parent)
+        return self._get_result(
+            elements, element_type, part.locator, first_only, required
+        )
+
+    def _get_result(self, elements, element_type, locator, first_only, required):
         if required and not elements:
             raise ElementNotFound(f"{element_type} with locator '{locator}' not found.")
         if first_only:
@@ -128,14 +280,43 @@ class ElementFinder(ContextAware):
             return elements[0]
         return elements
 
+    def _find_chain_in_browser(self, compiled: CompiledLocator, parent):
+        chain = [list(item) for item in compiled.browser_chain]
+        try:
+            result = self.driver.execute_script(
+                FIND_CHAIN_SCRIPT,
+                chain,
+                parent,
+                compiled.tag,
+                compiled.get_constraints(),
+            )
+        except JavascriptException as error:
+            logger.debug(f"Resolving locator chain in browser failed: {error}")
+            return None
+        if not isinstance(result, dict):
+            return None
+        if "missing" in result:
+            part = compiled.parts[int(result["missing"])]
+            raise ElementNotFound(f"Element with locator '{part.locator}' not found.")
+        if not isinstance(result.get("elements"), list):
+            return None
+        return result["elements"]
+
     def register(self, strategy_name, strategy_keyword, persist=False):
         strategy = CustomLocator(self.ctx, strategy_name, strategy_keyword)
+        if strategy.name in RESERVED_STRATEGIES:
+            raise RuntimeError(
+                f"The custom locator '{strategy.name}' cannot be registered. "
+                "The name is reserved."
+            )
         if strategy.name in self._strategies:
             raise RuntimeError(
                 f"The custom locator '{strategy.name}' cannot be registered. "
                 "A locator of that name already exists."
             )
         self._strategies[strategy.name] = strategy.find
+        self._locator_cache.clear()
+        self._element_cache.clear()
         if is_falsy(persist):
             # Unregister after current scope ends
             events.on("scope_end", "current", self.unregister, strategy.name)
@@ -150,6 +331,14 @@ class ElementFinder(ContextAware):
                 f"Cannot unregister the non-registered strategy '{strategy_name}'."
             )
         del self._strategies[strategy_name]
+        self._locator_cache.clear()
+        self._element_cache.clear()
+
+    def _verify_parent(self, parent):
+        if parent and not self._is_webelement(parent):
+            raise ValueError(
+                f"Parent must be Selenium WebElement but it was {type(parent)}."
+            )
 
     def _is_webelement(self, element):
         # Hook for unit tests
@@ -239,14 +428,17 @@ class ElementFinder(ContextAware):
         js = f"return isc.AutoTest.getElement('{criteria}')"
         return self._filter_elements([self.driver.execute_script(js)], tag, constraints)
 
-    def _find_by_default(self, criteria, tag, constraints, parent):
+    def _find_by_default(
+        self, criteria, tag, constraints, parent, xpath_constraints=None
+    ):
         if tag in self._key_attrs:
             key_attrs = self._key_attrs[tag]
         else:
             key_attrs = self._key_attrs[None]
         xpath_criteria = escape_xpath_value(criteria)
         xpath_tag = tag if tag is not None else "*"
-        xpath_constraints = self._get_xpath_constraints(constraints)
+        if xpath_constraints is None:
+            xpath_constraints = self._get_xpath_constraints(constraints)
         xpath_searchers = [f"{attr}={xpath_criteria}" for attr in key_attrs]
         xpath_searchers.extend(self._get_attrs_with_url(key_attrs, criteria))
         xpath = (
@@ -311,7 +503,7 @@ class ElementFinder(ContextAware):
         return tag, constraints
 
     def _parse_locator(self, locator):
-        if re.match(r"\(*//", locator):
+        if IMPLICIT_XPATH.match(locator):
             return "xpath", locator
         index = self._get_locator_separator_index(locator)
         if index != -1:
@@ -342,12 +534,31 @@ class ElementFinder(ContextAware):
         elements = self._normalize(elements)
         if tag is None:
             return elements
+        if len(elements) > 1:
+            matching = self._filter_elements_in_browser(elements, tag, constraints)
+            if matching is not None:
+                return matching
         return [
             element
             for element in elements
             if self._element_matches(element, tag, constraints)
         ]
 
+    def _filter_elements_in_browser(self, elements, tag, constraints):
+        # Filtering in Python needs one or more WebDriver calls per element.
+        if not all(self._is_webelement(element) for element in elements):
+            return None
+        try:
+            indexes = self.driver.execute_script(
+                FILTER_ELEMENTS_SCRIPT, elements, tag, constraints
+            )
+        except JavascriptException as error:
+            logger.debug(f"Filtering elements in browser failed: {error}")
+            return None
+        if not isinstance(indexes, list):
+            return None
+        return [elements[index] for index in indexes]
+
     def _get_attrs_with_url(self, key_attrs, criteria):
         attrs = []
         url = None
@@ -0,0 +1,88 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+
+class LocatorPart(NamedTuple):
+    locator: str
+    prefix: str
+    criteria: str
+    strategy: Callable
+
+
+class CompiledLocator(NamedTuple):
+    parts: tuple[LocatorPart, ...]
+    element_type: str
+    tag: str | None
+    constraints: tuple[tuple[str, Any], ...]
+    xpath_constraints: tuple[str, ...]
+    browser_chain: tuple[tuple[str, str], ...] | None = None
+
+    def get_constraints(self) -> dict:
+        # Strategies, including custom ones, get their own mutable copy.
+        return {
+            name: list(value) if isinstance(value, tuple) else value
+            for name, value in self.constraints
+        }
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class LocatorCache:
+    def __init__(self, maxsize: int = 1024):
+        """Least recently used cache for compiled locators.
+
+        :param maxsize: Maximum number of compiled locators to keep.
+        :type maxsize: int
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def get(self, key):
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def clear(self):
+        self._cache.clear()
+
+    @property
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, len(self._cache), self.maxsize)
+
+    def __len__(self):
+        return len(self._cache)
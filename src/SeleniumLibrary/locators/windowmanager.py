@@ -15,12 +15,14 @@
 # limitations under the License.
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import NamedTuple
 
 from selenium.common.exceptions import NoSuchWindowException, WebDriverException
 
 from SeleniumLibrary.base import ContextAware
 from SeleniumLibrary.errors import WindowNotFound
+from SeleniumLibrary.utils.performance import sleep
 
 
 class WindowInfo(NamedTuple):
@@ -31,9 +33,73 @@ class WindowInfo(NamedTuple):
     url: str
 
 
+WINDOW_INFO_FIELDS = WindowInfo._fields
+# Fields Chromium based browsers can list for all windows at once.
+CDP_FIELDS = ("handle", "title", "url")
+
+
+class WindowInfoCache:
+    def __init__(self, timeout: float = 0.0):
+        """Short-lived cache of window information of each browser.
+
+        Cached information is used only if it is younger than ``timeout``
+        seconds and the browser still has the same windows. Zero timeout
+        disables the cache.
+
+        :param timeout: How long cached information is valid in seconds.
+        :type timeout: float
+        """
+        self.timeout = timeout
+        self._infos = {}
+
+    def get(self, driver, handles: list[str]) -> list[WindowInfo] | None:
+        cached = self._infos.get(driver)
+        if not cached:
+            return None
+        expires, infos = cached
+        if time.monotonic() > expires or [info.handle for info in infos] != handles:
+            del self._infos[driver]
+            return None
+        return infos
+
+    def set(self, driver, infos: list[WindowInfo]):
+        if self.timeout > 0:
+            self._infos[driver] = (time.monotonic() + self.timeout, infos)
+
+    def clear(self):
+        self._infos.clear()
+
+
+class WindowIndex:
+    def __init__(self):
+        """Window information read during one window selection.
+
+        Information of windows read on earlier attempts is reused so that
+        only windows opened after the previous attempt are read. When no
+        new windows have appeared, all windows are read again because their
+        titles and URLs may have changed.
+        """
+        self.infos: dict[str, WindowInfo] = {}
+        self.complete = True
+
+    def handles_to_read(self, handles: list[str]) -> list[str]:
+        self.infos = {
+            handle: info for handle, info in self.infos.items() if handle in handles
+        }
+        new = [handle for handle in handles if handle not in self.infos]
+        self.complete = not new or len(new) == len(handles)
+        return handles if self.complete else new
+
+
 class WindowManager(ContextAware):
+    # Delays between attempts to select a window grow up to the maximum.
+    min_select_delay = 0.05
+    max_select_delay = 0.5
+    max_query_workers = 8
+
     def __init__(self, ctx):
         ContextAware.__init__(self, ctx)
+        self._index = None
         self._strategies = {
             "title": self._select_by_title,
             "name": self._select_by_name,
@@ -43,63 +109,126 @@ class WindowManager(ContextAware):
 
     def get_window_handles(self, browser):
         if isinstance(browser, str) and browser == "ALL":
-            handles = []
-            current_index = self.drivers.current_index
-            for index, _driver in enumerate(self.drivers, 1):
-                self.drivers.switch(index)
-                handles.extend(self.driver.window_handles)
-            self.drivers.switch(current_index)
-            return handles
+            handles = self._query_all_drivers(lambda driver: driver.window_handles)
+            return [handle for driver_handles in handles for handle in driver_handles]
         if isinstance(browser, str) and browser == "CURRENT":
             return self.driver.window_handles
-        current_index = self.drivers.current_index
-        self.drivers.switch(browser)
-        handles = self.driver.window_handles
-        self.drivers.switch(current_index)
-        return handles
+        return self.drivers.get_connection(browser).window_handles
 
-    def get_window_infos(self, browser="CURRENT"):
-        try:
-            current_index = self.drivers.current_index
-        except AttributeError:
-            current_index = None
+    def get_window_infos(self, browser="CURRENT", fields=WINDOW_INFO_FIELDS):
+        """Returns information of all windows of the given ``browser``.
+
+        Only ``fields`` of the returned infos are guaranteed to be set, which
+        allows getting titles and URLs without switching windows when the
+        browser supports it. With ``ALL``, browsers are queried in parallel.
+        """
         if isinstance(browser, str) and browser.upper() == "ALL":
-            infos = []
-            for index, _driver in enumerate(self.drivers, 1):
-                self.drivers.switch(index)
-                infos.extend(self._get_window_infos())
-            self.drivers.switch(current_index)
-            return infos
+            infos = self._query_all_drivers(
+                lambda driver: self._get_window_infos(fields, driver)
+            )
+            return [info for driver_infos in infos for info in driver_infos]
         if isinstance(browser, str) and browser.upper() == "CURRENT":
-            return self._get_window_infos()
-        self.drivers.switch(browser)
-        infos = self._get_window_infos()
-        self.drivers.switch(current_index)
+            return self._get_window_infos(fields)
+        return self._get_window_infos(fields, self.drivers.get_connection(browser))
+
+    def _query_all_drivers(self, query):
+        # Browsers are separate sessions, so they can be queried in parallel
+        # without changing the current browser.
+        drivers = self.drivers.active_drivers
+        if len(drivers) < 2:
+            return [query(driver) for driver in drivers]
+        with ThreadPoolExecutor(
+            max_workers=min(len(drivers), self.max_query_workers),
+            thread_name_prefix="SeleniumLibrary-windows",
+        ) as executor:
+            return list(executor.map(query, drivers))
+
+    @property
+    def window_info_cache(self) -> WindowInfoCache | None:
+        cache = getattr(self.ctx, "_window_info_cache", None)
+        return cache if isinstance(cache, WindowInfoCache) else None
+
+    def clear_cache(self):
+        if self.window_info_cache:
+            self.window_info_cache.clear()
+
+    def _get_window_infos(self, fields=WINDOW_INFO_FIELDS, driver=None):
+        if driver is None:
+            driver = self.driver
+        handles = driver.window_handles
+        infos = self._get_window_infos_without_switching(driver, handles, fields)
+        if infos is not None:
+            return infos
+        infos = self._get_window_infos_by_switching(driver, handles)
+        if self.window_info_cache:
+            self.window_info_cache.set(driver, infos)
+        return infos
+
+    def _get_window_infos_without_switching(self, driver, handles, fields):
+        if self.window_info_cache:
+            infos = self.window_info_cache.get(driver, handles)
+            if infos is not None:
+                return infos
+        if all(field in CDP_FIELDS for field in fields):
+            return self._get_cdp_window_infos(driver, handles)
+        return None
+
+    def _get_cdp_window_infos(self, driver, handles):
+        try:
+            result = driver.execute_cdp_cmd("Target.getTargets", {})
+        except (AttributeError, WebDriverException):
+            return None
+        if not isinstance(result, dict):
+            return None
+        pages = {
+            target.get("targetId"): target
+            for target in result.get("targetInfos", [])
+            if target.get("type") == "page"
+        }
+        infos = []
+        for handle in handles:
+            page = pages.get(handle)
+            # Chromium reports the URL as the title of pages without one,
+            # when WebDriver returns an empty title.
+            if page is None or not page.get("title") or page["title"] == page["url"]:
+                return None
+            infos.append(WindowInfo(handle, None, None, page["title"], page["url"]))
         return infos
 
-    def _get_window_infos(self):
+    def _get_window_infos_by_switching(self, driver, handles):
         infos = []
         try:
-            starting_handle = self.driver.current_window_handle
+            starting_handle = driver.current_window_handle
         except NoSuchWindowException:
             starting_handle = None
         try:
-            for handle in self.driver.window_handles:
-                self.driver.switch_to.window(handle)
-                infos.append(self._get_current_window_info())
+            for handle in handles:
+                driver.switch_to.window(handle)
+                infos.append(self._get_current_window_info(driver))
         finally:
             if starting_handle:
-                self.driver.switch_to.window(starting_handle)
+                driver.switch_to.window(starting_handle)
         return infos
 
     def select(self, locator, timeout=0):
-        while True:
-            try:
-                return self._select(locator)
-            except WindowNotFound:
-                if time.time() > timeout:
-                    raise
-                time.sleep(0.1)
+        self._index = WindowIndex()
+        delay = self.min_select_delay
+        try:
+            while True:
+                try:
+                    return self._select(locator)
+                except WindowNotFound:
+                    remaining = timeout - time.time()
+                    if remaining <= 0:
+                        if self._index.complete:
+                            raise
+                        # Read all windows once more before failing.
+                        self._index.infos.clear()
+                        continue
+                    sleep(min(delay, remaining))
+                    delay = min(delay * 2, self.max_select_delay)
+        finally:
+            self._index = None
 
     def _select(self, locator):
         if not isinstance(locator, str):
@@ -133,18 +262,21 @@ class WindowManager(ContextAware):
         self._select_matching(
             lambda window_info: window_info.title == title,
             f"Unable to locate window with title '{title}'.",
+            ("title",),
         )
 
     def _select_by_name(self, name):
         self._select_matching(
             lambda window_info: window_info.name == name,
             f"Unable to locate window with name '{name}'.",
+            ("name",),
         )
 
     def _select_by_url(self, url):
         self._select_matching(
             lambda window_info: window_info.url == url,
             f"Unable to locate window with URL '{url}'.",
+            ("url",),
         )
 
     def _select_main_window(self):
@@ -152,21 +284,15 @@ class WindowManager(ContextAware):
         self.driver.switch_to.window(handles[0])
 
     def _select_by_default(self, criteria):
-        try:
-            starting_handle = self.driver.current_window_handle
-        except NoSuchWindowException:
-            starting_handle = None
-        for handle in self.driver.window_handles:
-            self.driver.switch_to.window(handle)
-            if criteria == handle:
-                return
-            for item in self._get_current_window_info()[2:4]:
-                if item == criteria:
-                    return
-        if starting_handle:
-            self.driver.switch_to.window(starting_handle)
-        raise WindowNotFound(
-            f"No window matching handle, name, title or URL '{criteria}' found."
+        handles = self.driver.window_handles
+        if criteria in handles:
+            self.driver.switch_to.window(criteria)
+            return
+        self._select_matching(
+            lambda window_info: criteria in (window_info.name, window_info.title),
+            f"No window matching handle, name, title or URL '{criteria}' found.",
+            ("name", "title"),
+            handles,
         )
 
     def _select_by_last_index(self):
@@ -184,22 +310,35 @@ class WindowManager(ContextAware):
                 return
         raise WindowNotFound(f"No window not matching excludes {excludes} found.")
 
-    def _select_matching(self, matcher, error):
+    def _select_matching(self, matcher, error, fields=WINDOW_INFO_FIELDS, handles=None):
+        if handles is None:
+            handles = self.driver.window_handles
+        infos = self._get_window_infos_without_switching(self.driver, handles, fields)
+        if infos is not None:
+            for info in infos:
+                if matcher(info):
+                    self.driver.switch_to.window(info.handle)
+                    return
+            raise WindowNotFound(error)
+        index = self._index or WindowIndex()
         try:
             starting_handle = self.driver.current_window_handle
         except NoSuchWindowException:
             starting_handle = None
-        for handle in self.driver.window_handles:
+        for handle in index.handles_to_read(handles):
             self.driver.switch_to.window(handle)
-            if matcher(self._get_current_window_info()):
+            index.infos[handle] = self._get_current_window_info()
+            if matcher(index.infos[handle]):
                 return
         if starting_handle:
             self.driver.switch_to.window(starting_handle)
         raise WindowNotFound(error)
 
-    def _get_current_window_info(self):
+    def _get_current_window_info(self, driver=None):
+        if driver is None:
+            driver = self.driver
         try:
-            window_id, name = self.driver.execute_script(
+            window_id, name = driver.execute_script(
                 "return [ window.id, window.name ];"
             )
         except WebDriverException:
@@ -207,9 +346,9 @@ class WindowManager(ContextAware):
             # can't get window id or name this way.
             window_id = name = None
         return WindowInfo(
-            self.driver.current_window_handle,
+            driver.current_window_handle,
             window_id if window_id is not None else "undefined",
             name or "undefined",
-            self.driver.title or "undefined",
-            self.driver.current_url or "undefined",
+            driver.title or "undefined",
+            driver.current_url or "undefined",
         )
@@ -17,6 +17,7 @@
 from robot.utils import plural_or_not, secs_to_timestr, timestr_to_secs  # noqa
 
 from .librarylistener import LibraryListener  # noqa
+from .polling import Polling  # noqa
 from .types import (  # noqa
     is_falsy,
     is_noney,
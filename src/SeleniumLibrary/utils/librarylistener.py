@@ -20,14 +20,48 @@ from .events import dispatch
 class LibraryListener:
     ROBOT_LISTENER_API_VERSION = 2
 
+    def __init__(self):
+        # Actions of the library instance this listener belongs to. They
+        # are not registered as global events so that one library instance
+        # does not affect others.
+        self.close_actions = []
+        self.scope_end_actions = []
+        self._suites = []
+        self._test = None
+
+    @property
+    def scope(self) -> tuple[str | None, str | None]:
+        """Long names of the running suite and test.
+
+        Tracked from listener events, so that reading the scope is cheap and
+        works also in threads where Robot Framework APIs cannot be used.
+        """
+        return self._suites[-1] if self._suites else None, self._test
+
     def start_suite(self, name, attrs):
         dispatch("scope_start", attrs["longname"])
+        self._suites.append(attrs["longname"])
 
     def end_suite(self, name, attrs):
         dispatch("scope_end", attrs["longname"])
+        self._end_scope()
+        if self._suites:
+            self._suites.pop()
 
     def start_test(self, name, attrs):
         dispatch("scope_start", attrs["longname"])
+        self._test = attrs["longname"]
 
     def end_test(self, name, attrs):
         dispatch("scope_end", attrs["longname"])
+        self._end_scope()
+        self._test = None
+
+    def _end_scope(self):
+        for action in self.scope_end_actions:
+            action()
+
+    def close(self):
+        for action in self.close_actions:
+            action()
+        self.close_actions = []
@@ -0,0 +1,221 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import csv
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import NamedTuple
+
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
+from robot.utils import printable_name
+
+# WebDriver commands whose time is reported as locator time.
+FIND_COMMANDS = frozenset(
+    (
+        "findElement",
+        "findElements",
+        "findChildElement",
+        "findChildElements",
+        "findShadowChildElement",
+        "findShadowChildElements",
+    )
+)
+
+
+class _SleepTimer:
+    def __init__(self):
+        self.total = 0.0
+
+    def sleep(self, seconds: float):
+        """Same as ``time.sleep`` but time slept is included in performance reports."""
+        start = time.perf_counter()
+        time.sleep(seconds)
+        self.total += time.perf_counter() - start
+
+
+_sleep_timer = _SleepTimer()
+sleep = _sleep_timer.sleep
+
+
+def resolve_output_path(path: str) -> str:
+    """Returns ``path`` relative to the output directory."""
+    try:
+        output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}")
+    except RobotNotRunningError:
+        output_dir = os.getcwd()
+    return os.path.join(output_dir, os.path.expanduser(path))
+
+
+class KeywordTiming(NamedTuple):
+    suite: str | None
+    test: str | None
+    keyword: str
+    duration: float
+    command_time: float
+    commands: int
+    locator_time: float
+    wait_time: float
+
+
+class _Counters(NamedTuple):
+    start: float
+    command_time: float
+    commands: int
+    locator_time: float
+    wait_time: float
+
+
+REPORT_FIELDS = (
+    "scope",
+    "name",
+    "keyword",
+    "calls",
+    "duration",
+    "duration_p50",
+    "duration_p90",
+    "duration_p95",
+    "duration_max",
+    "command_time",
+    "commands",
+    "locator_time",
+    "wait_time",
+)
+
+
+class PerformanceRecorder:
+    def __init__(
+        self,
+        path: str,
+        scope: Callable[[], tuple[str | None, str | None]] = lambda: (None, None),
+    ):
+        """Records where time goes inside keywords.
+
+        For each keyword, the total duration, the time used by WebDriver
+        commands, the number of commands, the time used by commands finding
+        elements and the time slept while waiting are recorded. The
+        recorder must be added to the command pipeline to get command and
+        locator times.
+
+        :param path: Report file. The format is CSV if the path ends with
+            ``.csv`` and JSON otherwise. A relative path is relative to the
+            output directory.
+        :type path: str
+        :param scope: Returns long names of the running suite and test.
+        :type scope: Callable[[], tuple[str | None, str | None]]
+        """
+        self.path = resolve_output_path(path)
+        self.scope = scope
+        self.timings: list[KeywordTiming] = []
+        self._stack: list[_Counters] = []
+        self._command_time = 0.0
+        self._commands = 0
+        self._locator_time = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, driver, command, params, execute):
+        start = time.perf_counter()
+        try:
+            return execute(command, params)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._command_time += elapsed
+                self._commands += 1
+                if command in FIND_COMMANDS:
+                    self._locator_time += elapsed
+
+    def start_keyword(self):
+        self._stack.append(self._get_counters())
+
+    def end_keyword(self, name: str):
+        start = self._stack.pop()
+        end = self._get_counters()
+        suite, test = self.scope()
+        self.timings.append(
+            KeywordTiming(
+                suite,
+                test,
+                name,
+                *(after - before for before, after in zip(start, end, strict=True)),
+            )
+        )
+
+    def _get_counters(self):
+        return _Counters(
+            time.perf_counter(),
+            self._command_time,
+            self._commands,
+            self._locator_time,
+            _sleep_timer.total,
+        )
+
+    def get_report(self) -> list[dict]:
+        """Returns statistics per test, per suite and in total.
+
+        Each row contains the keyword, the number of calls, the total
+        duration and its percentiles and totals of other recorded times.
+        """
+        groups = defaultdict(list)
+        for timing in self.timings:
+            if timing.test:
+                groups["test", timing.test, timing.keyword].append(timing)
+            groups["suite", timing.suite, timing.keyword].append(timing)
+            groups["total", None, timing.keyword].append(timing)
+        return [
+            self._summarize(scope, name, keyword, timings)
+            for (scope, name, keyword), timings in groups.items()
+        ]
+
+    def _summarize(self, scope, name, keyword, timings):
+        durations = sorted(timing.duration for timing in timings)
+        return {
+            "scope": scope,
+            "name": name,
+            "keyword": printable_name(keyword, code_style=True),
+            "calls": len(timings),
+            "duration": sum(durations),
+            "duration_p50": _percentile(durations, 50),
+            "duration_p90": _percentile(durations, 90),
+            "duration_p95": _percentile(durations, 95),
+            "duration_max": durations[-1],
+            "command_time": sum(timing.command_time for timing in timings),
+            "commands": sum(timing.commands for timing in timings),
+            "locator_time": sum(timing.locator_time for timing in timings),
+            "wait_time": sum(timing.wait_time for timing in timings),
+        }
+
+    def write(self):
+        """Writes the report to the configured path."""
+        report = self.get_report()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="UTF-8", newline="") as file:
+            if self.path.lower().endswith(".csv"):
+                writer = csv.DictWriter(file, REPORT_FIELDS)
+                writer.writeheader()
+                writer.writerows(report)
+            else:
+                json.dump(report, file, indent=2)
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    # Nearest-rank percentile of sorted values.
+    return values[max(math.ceil(percent / 100 * len(values)) - 1, 0)]
@@ -0,0 +1,104 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import random
+from collections.abc import Iterator
+from datetime import timedelta
+from typing import NamedTuple
+
+from robot.utils import timestr_to_secs
+
+
+class Polling(NamedTuple):
+    initial: float
+    maximum: float
+    factor: float = 1.0
+    jitter: float = 0.0
+
+    @classmethod
+    def fixed(cls, interval: float) -> "Polling":
+        return cls(interval, interval)
+
+    @classmethod
+    def parse(cls, value: "str | float | timedelta | Polling") -> "Polling":
+        """Converts ``value`` to a polling strategy.
+
+        A number, a ``timedelta`` or a Robot Framework time string means
+        a fixed interval. ``adaptive`` means the default adaptive strategy
+        and ``name=value`` pairs separated with semicolons override
+        its ``initial``, ``maximum``, ``factor`` and ``jitter``.
+        """
+        if isinstance(value, Polling):
+            return value
+        if isinstance(value, timedelta):
+            return cls.fixed(value.total_seconds())._validate()
+        if isinstance(value, str):
+            if value.strip().upper() == "ADAPTIVE":
+                return ADAPTIVE_POLLING
+            if "=" in value:
+                return cls._parse_options(value)
+        return cls.fixed(timestr_to_secs(value))._validate()
+
+    @classmethod
+    def _parse_options(cls, value: str) -> "Polling":
+        options = ADAPTIVE_POLLING._asdict()
+        given = set()
+        for item in value.split(";"):
+            if not item.strip():
+                continue
+            name, _, option = item.partition("=")
+            name = name.strip().lower()
+            if name not in options:
+                raise ValueError(
+                    f"Invalid polling option '{name}'. Valid options are "
+                    f"{', '.join(options)}."
+                )
+            if name in ("initial", "maximum"):
+                options[name] = timestr_to_secs(option.strip())
+            else:
+                options[name] = float(option)
+            given.add(name)
+        if "maximum" not in given:
+            options["maximum"] = max(options["maximum"], options["initial"])
+        return cls(**options)._validate()
+
+    def _validate(self) -> "Polling":
+        if self.initial <= 0:
+            raise ValueError(f"Polling interval must be positive, got {self.initial}.")
+        if self.maximum < self.initial:
+            raise ValueError(
+                f"Polling maximum {self.maximum} is smaller than "
+                f"initial interval {self.initial}."
+            )
+        if self.factor < 1:
+            raise ValueError(f"Polling factor must be at least 1, got {self.factor}.")
+        if not 0 <= self.jitter < 1:
+            raise ValueError(
+                f"Polling jitter must be at least 0 and less than 1, got {self.jitter}."
+            )
+        return self
+
+    def intervals(self) -> Iterator[float]:
+        """Yields the time to sleep before each new check."""
+        interval = self.initial
+        while True:
+            if self.jitter:
+                yield interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            else:
+                yield interval
+            interval = min(interval * self.factor, self.maximum)
+
+
+ADAPTIVE_POLLING = Polling(initial=0.02, maximum=2.0, factor=1.5, jitter=0.1)
@@ -0,0 +1,69 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from SeleniumLibrary.entry.__main__ import cli
+from SeleniumLibrary.entry.trace import summarize_trace
+
+RECORDS = [
+    ("findElement", 0.2, "Click Element", "Suite.Test 1"),
+    ("clickElement", 1.5, "Click Element", "Suite.Test 1"),
+    ("findElement", 0.4, "Input Text", "Suite.Test 2"),
+    ("getTitle", 0.1, None, None),
+]
+
+
+def _write_trace(path: Path):
+    with gzip.open(path, "wt", encoding="UTF-8") as file:
+        for command, duration, keyword, test in RECORDS:
+            record = {"command": command, "duration": duration}
+            record.update(keyword=keyword, test=test)
+            file.write(json.dumps(record) + "\n")
+
+
+def test_summarize_trace(tmp_path: Path):
+    path = tmp_path / "trace.ndjson.gz"
+    _write_trace(path)
+    lines = summarize_trace(path, top=2)
+    assert lines[0] == "Trace contains 4 commands."
+    assert lines[2:6] == [
+        "Slowest commands:",
+        "| Command      | Duration (s) | Keyword       | Test         |",
+        "| ------------ | ------------ | ------------- | ------------ |",
+        "| clickElement | 1.500        | Click Element | Suite.Test 1 |",
+    ]
+    assert lines[6] == "| findElement  | 0.400        | Input Text    | Suite.Test 2 |"
+    assert "| clickElement | 1     | 1.500     | 1.500       |" in lines
+    assert "| findElement  | 2     | 0.600     | 0.300       |" in lines
+    assert "| Click Element | 2     | 1.700     | 0.850       |" in lines
+    assert not any("getTitle" in line for line in lines)
+
+
+def test_trace_command(tmp_path: Path):
+    path = tmp_path / "trace.ndjson.gz"
+    _write_trace(path)
+    result = CliRunner().invoke(cli, ["trace", str(path), "--top", "1"])
+    assert result.exit_code == 0, result.output
+    assert (
+        "| clickElement | 1.500        | Click Element | Suite.Test 1 |"
+        in result.output
+    )
+
+
+def test_summarize_empty_trace(tmp_path: Path):
+    path = tmp_path / "trace.ndjson"
+    path.write_text("", encoding="UTF-8")
+    assert summarize_trace(path) == ["Trace contains 0 commands."]
+    with pytest.raises(ValueError, match="must be at least 1, got 0"):
+        summarize_trace(path, top=0)
+
+
+def test_trace_command_validates_top(tmp_path: Path):
+    path = tmp_path / "trace.ndjson"
+    path.write_text("", encoding="UTF-8")
+    result = CliRunner().invoke(cli, ["trace", str(path), "--top", "0"])
+    assert result.exit_code == 2
+    assert "--top" in result.output
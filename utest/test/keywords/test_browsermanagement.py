@@ -1,9 +1,16 @@
+import threading
+import time
+
 import pytest
-from mockito import ANY, mock, verify, verifyNoUnwantedInteractions, when
+from mockito import ANY, KWARGS, mock, verify, verifyNoUnwantedInteractions, when
 from selenium import webdriver
 
 from SeleniumLibrary import SeleniumLibrary
-from SeleniumLibrary.keywords import BrowserManagementKeywords
+from SeleniumLibrary.keywords import (
+    BrowserManagementKeywords,
+    CommandPipeline,
+    WebDriverCache,
+)
 
 
 def test_set_selenium_timeout_only_affects_open_browsers():
@@ -104,8 +111,36 @@ def test_get_selenium_page_load_timeout():
     assert sl.get_selenium_page_load_timeout() == "15 seconds"
 
 
+def _pool_key(bm, browser="chrome", options=None, service=None):
+    return bm._get_pool_key(browser, None, None, None, options, None, None, service)
+
+
+def _chrome_options(*arguments):
+    options = webdriver.ChromeOptions()
+    for argument in arguments:
+        options.add_argument(argument)
+    return options
+
+
+def test_pool_key_compares_options_by_content():
+    bm = BrowserManagementKeywords(mock())
+    assert _pool_key(bm, "Chrome", _chrome_options("--headless")) == _pool_key(
+        bm, "chrome", _chrome_options("--headless")
+    )
+    assert _pool_key(bm, options=_chrome_options("--headless")) != _pool_key(
+        bm, options=_chrome_options()
+    )
+    assert _pool_key(bm, options="add_argument('--headless')") != _pool_key(bm)
+    assert _pool_key(
+        bm, service=webdriver.ChromeService("/bin/chromedriver")
+    ) == _pool_key(bm, service=webdriver.ChromeService("/bin/chromedriver"))
+    assert _pool_key(bm, "chrome") != _pool_key(bm, "firefox")
+
+
 def test_bad_browser_name():
     ctx = mock()
+    ctx._drivers = mock()
+    ctx._drivers.pool = None
     bm = BrowserManagementKeywords(ctx)
     with pytest.raises(ValueError, match=r"fireox is not a supported browser\."):
         bm._make_driver("fireox")
@@ -135,6 +170,8 @@ def test_create_webdriver():
 def test_open_browser_speed():
     ctx = mock()
     ctx._drivers = mock()
+    ctx._drivers.pool = None
+    ctx.command_pipeline = CommandPipeline()
     ctx.event_firing_webdriver = None
     ctx.speed = 5.0
     browser = mock()
@@ -152,6 +189,8 @@ def test_open_browser_speed():
 def test_create_webdriver_speed():
     ctx = mock()
     ctx._drivers = mock()
+    ctx._drivers.pool = None
+    ctx.command_pipeline = CommandPipeline()
     ctx.event_firing_webdriver = None
     ctx.speed = 0.0
     browser = mock()
@@ -275,3 +314,77 @@ def test_create_webdriver_speed():
     when(bm._webdriver_creator)._get_executable_path(ANY).thenReturn(executable_path)
     bm.open_browser("http://robotframework.org/", "chrome")
     verify(browser, times=0).__call__("_speed")
+
+
+def _open_browsers_keywords():
+    ctx = mock()
+    ctx._drivers = WebDriverCache()
+    ctx.event_firing_webdriver = None
+    when(ctx).register_driver(ANY, ANY).thenAnswer(ctx._drivers.register)
+    return BrowserManagementKeywords(ctx), ctx._drivers
+
+
+def test_open_browsers_starts_in_parallel_and_registers_in_order():
+    bm, drivers = _open_browsers_keywords()
+    barrier = threading.Barrier(2, timeout=5)
+    chrome, firefox = mock(), mock()
+
+    def make_driver(browser, **kwargs):
+        barrier.wait()
+        if browser == "chrome":
+            time.sleep(0.05)
+        return {"chrome": chrome, "firefox": firefox}[browser]
+
+    when(bm)._make_driver(ANY, **KWARGS).thenAnswer(make_driver)
+    indexes = bm.open_browsers(
+        "chrome", {"browser": "firefox", "alias": "fox"}, url="http://localhost/"
+    )
+    assert indexes == [1, 2]
+    assert drivers.drivers == [chrome, firefox]
+    assert drivers.current is firefox
+    assert drivers.get_index("fox") == 2
+    verify(chrome).get("http://localhost/")
+    verify(firefox).get("http://localhost/")
+
+
+def test_open_browsers_closes_started_browsers_on_failure():
+    bm, drivers = _open_browsers_keywords()
+    chrome = mock()
+
+    def make_driver(browser, **kwargs):
+        if browser == "firefox":
+            raise ValueError("No firefox.")
+        return chrome
+
+    when(bm)._make_driver(ANY, **KWARGS).thenAnswer(make_driver)
+    with pytest.raises(ValueError, match="No firefox"):
+        bm.open_browsers("chrome", "firefox")
+    verify(chrome).quit()
+    assert drivers.drivers == []
+
+
+def test_open_browsers_closes_all_browsers_when_closing_fails():
+    bm, drivers = _open_browsers_keywords()
+    chrome, firefox, edge = mock(), mock(), mock()
+    when(chrome).quit().thenRaise(RuntimeError("Chrome is gone."))
+    when(firefox).get("http://localhost/").thenRaise(ValueError("No page."))
+    when(bm)._make_driver(ANY, **KWARGS).thenAnswer(
+        lambda browser, **kwargs: {"chrome": chrome, "firefox": firefox}.get(
+            browser, edge
+        )
+    )
+    when(drivers)._log_quit_error(ANY).thenReturn(None)
+    with pytest.raises(ValueError, match="No page"):
+        bm.open_browsers("chrome", "firefox", "edge", url="http://localhost/")
+    verify(chrome).quit()
+    verify(firefox).quit()
+    verify(edge).quit()
+    verify(drivers, times=1)._log_quit_error(ANY)
+
+
+def test_open_browsers_invalid_arguments():
+    bm, _ = _open_browsers_keywords()
+    with pytest.raises(ValueError, match="Invalid browser argument 'name'"):
+        bm.open_browsers({"name": "chrome"})
+    with pytest.raises(ValueError, match="Alias 'x' is used more than once"):
+        bm.open_browsers({"alias": "x"}, {"browser": "chrome", "alias": "x"})
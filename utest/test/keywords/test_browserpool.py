@@ -0,0 +1,144 @@
+import pytest
+from mockito import mock, unstub, verify
+
+from SeleniumLibrary.keywords import BrowserPool, WebDriverCache
+from SeleniumLibrary.keywords.webdrivertools.browserpool import (
+    PoolStatistics,
+    get_reset,
+    reset_browser,
+)
+
+
+@pytest.fixture
+def pool():
+    pool = BrowserPool(1, reset=lambda driver: None)
+    yield pool
+    pool.close()
+    unstub()
+
+
+def _creator():
+    drivers = []
+
+    def create():
+        drivers.append(mock())
+        return drivers[-1]
+
+    return create, drivers
+
+
+def test_acquire_starts_browsers_in_background(pool):
+    create, drivers = _creator()
+    first = pool.acquire("key", create)
+    assert pool.statistics == PoolStatistics(1, 1, 1, hits=0, misses=1)
+    second = pool.acquire("key", create)
+    assert first is drivers[0]
+    assert second is drivers[1]
+    assert pool.statistics == PoolStatistics(1, 1, 2, hits=1, misses=1)
+
+
+def test_browsers_are_pooled_by_key(pool):
+    create, _ = _creator()
+    pool.acquire("first", create)
+    pool.acquire("second", create)
+    assert pool.statistics.misses == 2
+    assert pool.statistics.idle == 2
+
+
+def test_released_browser_is_reused(pool):
+    create, _ = _creator()
+    driver = pool.acquire("key", create)
+    assert not pool.release(driver)
+    pool._idle["key"].clear()
+    driver = pool.acquire("key", create)
+    pool._idle["key"].clear()
+    assert pool.release(driver)
+    assert pool.acquire("key", create) is driver
+
+
+def test_browser_is_not_reused_if_reset_fails():
+    def reset(driver):
+        raise RuntimeError("Reset failed")
+
+    pool = BrowserPool(1, reset=reset)
+    create, _ = _creator()
+    driver = pool.acquire("key", create)
+    pool._idle["key"].clear()
+    assert not pool.release(driver)
+    assert not pool.release(mock())
+    pool.close()
+
+
+def test_close_quits_idle_browsers(pool):
+    create, drivers = _creator()
+    pool.acquire("key", create)
+    pool.close()
+    verify(drivers[1]).quit()
+    verify(drivers[0], times=0).quit()
+    assert pool.statistics.idle == 0
+
+
+def test_webdrivercache_returns_browsers_to_pool(pool):
+    create, _ = _creator()
+    cache = WebDriverCache(pool)
+    driver = pool.acquire("key", create)
+    pool._idle["key"].clear()
+    cache.register(driver)
+    cache.close()
+    verify(driver, times=0).quit()
+    assert pool.statistics.idle == 1
+
+
+def test_webdrivercache_with_browser_handed_out_again():
+    pool = BrowserPool(0, reset=lambda driver: None, reuse=True)
+    create, _ = _creator()
+    cache = WebDriverCache(pool)
+    driver = pool.acquire("key", create)
+    cache.register(driver, "first")
+    cache.close()
+    assert pool.acquire("key", create) is driver
+    assert cache.register(driver, "second") == 2
+    assert cache.get_index("first") is None
+    assert cache.get_index("second") == 2
+    assert cache.get_index(1) is None
+    assert cache.active_drivers == [driver]
+    cache.switch(cache.get_index("second"))
+    assert cache.current_index == 2
+    cache.close_all()
+    assert pool.statistics == PoolStatistics(0, 1, 0, hits=1, misses=1)
+    pool.close()
+    verify(driver, times=1).quit()
+
+
+def test_reuse_keeps_all_released_browsers():
+    pool = BrowserPool(0, reset=lambda driver: None, reuse=True)
+    create, drivers = _creator()
+    first = pool.acquire("key", create)
+    second = pool.acquire("key", create)
+    assert pool.release(first)
+    assert pool.release(second)
+    assert pool.statistics == PoolStatistics(0, 2, 0, hits=0, misses=2)
+    assert pool.acquire("key", create) is second
+    assert len(drivers) == 2
+    pool.close()
+    verify(first).quit()
+
+
+def test_reset_browser():
+    driver = mock()
+    driver.window_handles = ["first", "second"]
+    driver.switch_to = mock()
+    reset_browser(driver)
+    verify(driver.switch_to).window("second")
+    verify(driver).close()
+    verify(driver.switch_to).window("first")
+    verify(driver).delete_all_cookies()
+    verify(driver).get("about:blank")
+
+
+def test_get_reset():
+    assert get_reset(None) is reset_browser
+    assert get_reset("cookies; BLANK").keywords == {"steps": ("cookies", "blank")}
+    assert get_reset("NONE").keywords == {"steps": ()}
+    with pytest.raises(ValueError, match="Invalid browser reset step 'history'"):
+        get_reset("cookies;history")
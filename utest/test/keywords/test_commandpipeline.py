@@ -0,0 +1,149 @@
+import time
+
+import pytest
+from mockito import mock, unstub, when
+from urllib3.exceptions import ProtocolError
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import (
+    BrowserManagementKeywords,
+    CommandPipeline,
+    CommandStatistics,
+    RetryMiddleware,
+    SpeedMiddleware,
+)
+
+
+class FakeDriver:
+    def __init__(self, failures=0):
+        self.commands = []
+        self.failures = failures
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        if self.failures:
+            self.failures -= 1
+            raise ProtocolError("Connection aborted.")
+        return {"value": driver_command}
+
+
+def test_middlewares_are_called_in_order():
+    calls = []
+
+    def middleware(name):
+        def call(driver, command, params, execute):
+            calls.append(f"{name} before {command}")
+            result = execute(command, params)
+            calls.append(f"{name} after {command}")
+            return result
+
+        return call
+
+    driver = FakeDriver()
+    pipeline = CommandPipeline([middleware("first")])
+    pipeline.install(driver)
+    pipeline.middlewares.append(middleware("second"))
+    assert driver.execute("getTitle") == {"value": "getTitle"}
+    assert calls == [
+        "first before getTitle",
+        "second before getTitle",
+        "second after getTitle",
+        "first after getTitle",
+    ]
+
+
+def test_install_is_idempotent():
+    driver = FakeDriver()
+    CommandPipeline().install(driver)
+    base = driver._base_execute
+    pipeline = CommandPipeline()
+    pipeline.install(driver)
+    assert driver._base_execute == base
+    assert driver._command_pipeline is pipeline
+
+
+def test_middleware_can_change_command():
+    def rename(driver, command, params, execute):
+        return execute(command.upper(), params)
+
+    driver = FakeDriver()
+    CommandPipeline([rename]).install(driver)
+    driver.execute("getTitle")
+    assert driver.commands == ["GETTITLE"]
+
+
+def test_speed_middleware():
+    driver = FakeDriver()
+    driver._speed = 0.01
+    CommandPipeline([SpeedMiddleware()]).install(driver)
+    sleeps = []
+    when(time).sleep(0.01).thenAnswer(sleeps.append)
+    try:
+        driver.execute("getTitle")
+    finally:
+        unstub()
+    assert sleeps == [0.01]
+
+
+def test_retry_middleware():
+    driver = FakeDriver(failures=2)
+    CommandPipeline([RetryMiddleware(retries=2, delay=0)]).install(driver)
+    assert driver.execute("getTitle") == {"value": "getTitle"}
+    assert driver.commands == ["getTitle"] * 3
+
+
+def test_retry_middleware_gives_up():
+    driver = FakeDriver(failures=2)
+    CommandPipeline([RetryMiddleware(retries=1, delay=0)]).install(driver)
+    with pytest.raises(ProtocolError):
+        driver.execute("getTitle")
+    assert driver.commands == ["getTitle"] * 2
+
+
+def test_retry_middleware_only_retries_given_commands():
+    driver = FakeDriver(failures=1)
+    retry = RetryMiddleware(retries=1, delay=0, commands=["getTitle"])
+    CommandPipeline([retry]).install(driver)
+    with pytest.raises(ProtocolError):
+        driver.execute("clickElement")
+    assert driver.commands == ["clickElement"]
+
+
+def test_library_retries_commands():
+    assert not any(
+        isinstance(middleware, RetryMiddleware)
+        for middleware in SeleniumLibrary().command_pipeline.middlewares
+    )
+    retry = SeleniumLibrary(command_retries=2).command_pipeline.middlewares[0]
+    assert isinstance(retry, RetryMiddleware)
+    assert retry.retries == 2
+
+
+def test_command_statistics_per_keyword():
+    keyword = [None]
+    statistics = CommandStatistics(lambda: keyword[0])
+    driver = FakeDriver(failures=1)
+    CommandPipeline([statistics]).install(driver)
+    keyword[0] = "click_element"
+    with pytest.raises(ProtocolError):
+        driver.execute("findElement")
+    driver.execute("clickElement")
+    keyword[0] = None
+    driver.execute("getTitle")
+    assert statistics.statistics["click_element"].commands == 2
+    assert statistics.statistics[None].commands == 1
+    statistics.reset()
+    assert statistics.statistics == {}
+
+
+def test_get_command_statistics_keyword():
+    ctx = mock()
+    ctx.command_statistics = CommandStatistics(lambda: "get_title")
+    driver = FakeDriver()
+    CommandPipeline([ctx.command_statistics]).install(driver)
+    driver.execute("getTitle")
+    keywords = BrowserManagementKeywords(ctx)
+    stats = keywords.get_command_statistics(reset=True)
+    assert list(stats) == ["Get Title"]
+    assert stats["Get Title"]["commands"] == 1
+    assert keywords.get_command_statistics() == {}
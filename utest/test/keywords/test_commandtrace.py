@@ -0,0 +1,71 @@
+import gzip
+import json
+
+import pytest
+
+from SeleniumLibrary.keywords import CommandPipeline, CommandTrace
+from SeleniumLibrary.utils import LibraryListener
+
+
+class FakeDriver:
+    session_id = "session"
+
+    def execute(self, driver_command, params=None):
+        if driver_command == "fail":
+            raise ValueError("Failing command.")
+        return {"value": "x" * 10}
+
+
+def _trace_commands(path):
+    trace = CommandTrace(
+        str(path), lambda: "click_element", lambda: ("Suite", "Suite.Test")
+    )
+    driver = FakeDriver()
+    CommandPipeline([trace]).install(driver)
+    driver.execute("clickElement", {"id": "1"})
+    with pytest.raises(ValueError, match="Failing command"):
+        driver.execute("fail")
+    trace.close()
+    driver.execute("afterClose")
+
+
+def _assert_trace(lines):
+    first, second = (json.loads(line) for line in lines)
+    assert first["command"] == "clickElement"
+    assert first["session"] == "session"
+    assert first["request"] == len('{"id": "1"}')
+    assert first["response"] == len('{"value": "xxxxxxxxxx"}')
+    assert first["keyword"] == "Click Element"
+    assert first["suite"] == "Suite"
+    assert first["test"] == "Suite.Test"
+    assert first["duration"] >= 0
+    assert first["error"] is None
+    assert second["command"] == "fail"
+    assert second["response"] == 0
+    assert second["error"] == "ValueError"
+
+
+def test_trace(tmp_path):
+    path = tmp_path / "trace" / "commands.ndjson"
+    _trace_commands(path)
+    with open(path, encoding="UTF-8") as file:
+        _assert_trace(file.readlines())
+
+
+def test_gzip_trace(tmp_path):
+    path = tmp_path / "commands.ndjson.gz"
+    _trace_commands(path)
+    with gzip.open(path, "rt", encoding="UTF-8") as file:
+        _assert_trace(file.readlines())
+
+
+def test_listener_tracks_scope():
+    listener = LibraryListener()
+    assert listener.scope == (None, None)
+    listener.start_suite("Root", {"longname": "Root"})
+    listener.start_suite("Child", {"longname": "Root.Child"})
+    listener.start_test("Test", {"longname": "Root.Child.Test"})
+    assert listener.scope == ("Root.Child", "Root.Child.Test")
+    listener.end_test("Test", {"longname": "Root.Child.Test"})
+    listener.end_suite("Child", {"longname": "Root.Child"})
+    assert listener.scope == ("Root", None)
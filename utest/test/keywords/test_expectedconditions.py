@@ -1,6 +1,12 @@
+import time
 import unittest
 
+import pytest
+from mockito import mock
+from selenium.common.exceptions import TimeoutException
+
 from SeleniumLibrary.keywords import ExpectedConditionKeywords
+from SeleniumLibrary.utils import Polling
 
 # Test cases
 
@@ -30,3 +36,13 @@ class TestExpectedConditionKeywords(unittest.TestCase):
         results = []
         results.append(self.ec_keywords._parse_condition("Element To Be Clickable"))
         results.append(self.ec_keywords._parse_condition("eLEment TO be ClIcKable"))
+
+
+def test_wait_does_not_sleep_past_timeout():
+    ctx = mock()
+    ctx.driver = mock()
+    keywords = ExpectedConditionKeywords(ctx)
+    start = time.monotonic()
+    with pytest.raises(TimeoutException):
+        keywords._wait_until(lambda driver: False, 0.05, Polling.fixed(10), "")
+    assert time.monotonic() - start < 1
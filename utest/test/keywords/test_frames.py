@@ -0,0 +1,81 @@
+import pytest
+from mockito import mock, unstub, verify, when
+from selenium.common.exceptions import StaleElementReferenceException
+
+from SeleniumLibrary.keywords import FrameKeywords
+from SeleniumLibrary.keywords.frames import FrameCache, clear_frame_cache
+
+
+@pytest.fixture
+def frames():
+    ctx = mock()
+    ctx.driver = mock()
+    ctx.driver.switch_to = mock()
+    ctx._element_finder = mock()
+    ctx._frame_cache = FrameCache()
+    keywords = FrameKeywords(ctx)
+    when(keywords).info(...)
+    return keywords
+
+
+def teardown_function():
+    unstub()
+
+
+def test_select_frame_path(frames):
+    outer, inner = mock(), mock()
+    when(frames).find_element("outer").thenReturn(outer)
+    when(frames).find_element("id:inner").thenReturn(inner)
+    frames.select_frame("frame:outer >> id:inner")
+    verify(frames.driver.switch_to).default_content()
+    verify(frames.driver.switch_to).frame(outer)
+    verify(frames.driver.switch_to).frame(inner)
+
+
+def test_select_frame_path_uses_cached_frames(frames):
+    outer, inner = mock(), mock()
+    when(frames).find_element("outer").thenReturn(outer)
+    when(frames).find_element("inner").thenReturn(inner)
+    frames.select_frame("frame:outer >> inner")
+    frames.select_frame("frame:outer>>inner")
+    verify(frames, times=1).find_element("outer")
+    verify(frames, times=1).find_element("inner")
+    verify(frames.driver.switch_to, times=2).default_content()
+    verify(frames.driver.switch_to, times=2).frame(inner)
+
+
+def test_select_frame_path_locates_stale_frame_again(frames):
+    stale, fresh, inner = mock(), mock(), mock()
+    when(frames).find_element("outer").thenReturn(stale).thenReturn(fresh)
+    when(frames).find_element("inner").thenReturn(inner)
+    frames.select_frame("frame:outer >> inner")
+    when(frames.driver.switch_to).frame(stale).thenRaise(
+        StaleElementReferenceException("stale")
+    )
+    frames.select_frame("frame:outer >> inner")
+    verify(frames, times=2).find_element("outer")
+    verify(frames, times=2).find_element("inner")
+    verify(frames.driver.switch_to).frame(fresh)
+
+
+def test_clear_frame_cache(frames):
+    when(frames).find_element("outer").thenReturn(mock())
+    frames.select_frame("frame:outer")
+    clear_frame_cache(frames.ctx)
+    frames.select_frame("frame:outer")
+    verify(frames, times=2).find_element("outer")
+
+
+def test_frame_should_contain_with_frame_path(frames):
+    outer, inner = mock(), mock()
+    when(frames).find_element("outer").thenReturn(outer)
+    when(frames).find_element("inner").thenReturn(inner)
+    when(frames).is_text_present("needle").thenReturn(True)
+    frames.frame_should_contain("frame:outer >> inner", "needle")
+    verify(frames.driver.switch_to).frame(inner)
+    verify(frames.driver.switch_to, times=2).default_content()
+
+
+def test_invalid_frame_path(frames):
+    with pytest.raises(ValueError, match="Invalid frame path"):
+        frames.select_frame("frame:outer >> ")
@@ -11,6 +11,7 @@ class KeywordArgumentsElementTest(unittest.TestCase):
         ctx.event_firing_webdriver = None
         ctx._browser = mock()
         ctx._drivers = mock()
+        ctx._element_finder = mock()
         self.ctx = ctx
         self.brorser = BrowserManagementKeywords(ctx)
 
@@ -1,7 +1,9 @@
 import pytest
-from mockito import mock, unstub, when
+from mockito import mock, unstub, verify, when
 
+from SeleniumLibrary.errors import ElementNotFound
 from SeleniumLibrary.keywords import FormElementKeywords
+from SeleniumLibrary.keywords.formelement import FILL_FORM_SCRIPT, FORM_FIELDS_SCRIPT
 
 FALSES = ["False", False, "", None, "NONE"]
 
@@ -85,3 +87,83 @@ def test_textarea_value_should_be(form):
     with pytest.raises(AssertionError) as error:
         form.textarea_value_should_be(locator, "value", "foobar")
     assert "foobar" in str(error.value)
+
+
+def _stub_fields(form, fields, kinds):
+    elements = [mock() for _ in fields]
+    for locator, element in zip(fields, elements, strict=True):
+        when(form).find_element(locator).thenReturn(element)
+    when(form.driver).execute_script(FORM_FIELDS_SCRIPT, elements).thenReturn(kinds)
+    return elements
+
+
+def test_fill_form(form):
+    fields = {"id:name": "Robot", "id:agree": "True", "id:news": "False"}
+    name, agree, news = _stub_fields(
+        form,
+        fields,
+        [
+            ["text", False, False],
+            ["checkbox", False, False],
+            ["checkbox", False, False],
+        ],
+    )
+    results = form.fill_form(fields)
+    verify(name).clear()
+    verify(name).send_keys("Robot")
+    verify(agree).click()
+    verify(news, times=0).click()
+    assert [result["status"] for result in results] == ["PASS", "PASS", "PASS"]
+    assert results[0] == {
+        "locator": "id:name",
+        "type": "text",
+        "status": "PASS",
+        "message": "",
+    }
+
+
+def test_fill_form_with_javascript(form):
+    fields = {"id:name": "Robot", "id:file": "/tmp/x", "id:agree": True}
+    name, upload, agree = _stub_fields(
+        form,
+        fields,
+        [["text", False, False], ["file", False, False], ["checkbox", False, False]],
+    )
+    when(form.driver).execute_script(
+        FILL_FORM_SCRIPT, [name, agree], ["text", "checkbox"], ["Robot", True], True
+    ).thenReturn([None, None])
+    form.fill_form(fields, javascript=True)
+    verify(upload).send_keys("/tmp/x")
+    verify(name, times=0).send_keys(...)
+
+
+def test_fill_form_sends_file_as_choose_file(form):
+    fields = {"id:file": "/tmp/x"}
+    (upload,) = _stub_fields(form, fields, [["file", False, False]])
+    running = []
+    when(upload).send_keys("/tmp/x").thenAnswer(
+        lambda value: running.append(form.ctx._running_keyword)
+    )
+    form.fill_form(fields)
+    assert running == ["choose_file"]
+    assert form.ctx._running_keyword is None
+
+
+def test_fill_form_reports_all_failures(form):
+    fields = {"id:missing": "x", "id:button": "x", "id:radio": False, "id:ok": "x"}
+    when(form).find_element("id:missing").thenRaise(
+        ElementNotFound("Element with locator 'id:missing' not found.")
+    )
+    _stub_fields(
+        form,
+        {"id:button": "x", "id:radio": False, "id:ok": "x"},
+        [[None, False, False], ["radio", False, True], ["text", False, False]],
+    )
+    with pytest.raises(AssertionError) as error:
+        form.fill_form(fields)
+    assert str(error.value) == (
+        "Filling 3 form fields failed:\n"
+        "id:missing: Element with locator 'id:missing' not found.\n"
+        "id:button: Element is not a supported form field.\n"
+        "id:radio: Radio button cannot be unselected."
+    )
@@ -1,14 +1,22 @@
 import unittest
 
-from mockito import mock, unstub, when
+import pytest
+from mockito import mock, unstub, verify, when
+from selenium.common.exceptions import JavascriptException, NoSuchElementException
 
 from SeleniumLibrary.keywords import SelectElementKeywords
+from SeleniumLibrary.keywords.selectelement import (
+    SELECT_BATCH_SCRIPT,
+    SELECT_OPTIONS_SCRIPT,
+    SelectOption,
+)
 
 
 class KeywordArgumentsElementTest(unittest.TestCase):
     def setUp(self):
         ctx = mock()
         ctx._browser = mock()
+        ctx.driver = mock()
         self.element = SelectElementKeywords(ctx)
         self.ctx = ctx
 
@@ -17,18 +25,92 @@ class KeywordArgumentsElementTest(unittest.TestCase):
 
     def test_get_list_items_false(self):
         locator = "//select"
-        element = mock()
-        element.text = "foo"
-        when(self.element)._get_options(locator).thenReturn([element])
-        self.element.get_list_items(locator)
-        self.element.get_list_items(locator, "None")
-        self.element.get_list_items(locator, "No")
+        option = SelectOption("foo", "bar", 0, False)
+        when(self.element)._get_options(locator).thenReturn([option])
+        assert self.element.get_list_items(locator) == ["foo"]
+        assert self.element.get_list_items(locator, "None") == ["foo"]
+        assert self.element.get_list_items(locator, "No") == ["foo"]
 
     def test_get_list_items_true(self):
         locator = "//select"
-        element = mock()
-        when(element).get_attribute("value").thenReturn("text")
-        when(self.element)._get_options(locator).thenReturn([element])
-        self.element.get_list_items(locator, True)
-        self.element.get_list_items(locator, "True")
-        self.element.get_list_items(locator, "Yes")
+        option = SelectOption("foo", "text", 0, False)
+        when(self.element)._get_options(locator).thenReturn([option])
+        assert self.element.get_list_items(locator, True) == ["text"]
+        assert self.element.get_list_items(locator, "True") == ["text"]
+        assert self.element.get_list_items(locator, "Yes") == ["text"]
+
+    def test_options_are_read_with_one_script(self):
+        select = mock()
+        when(self.element).find_element("//select", tag="list").thenReturn(select)
+        when(self.ctx.driver).execute_script(SELECT_OPTIONS_SCRIPT, select).thenReturn(
+            [["A", "a", 0, True], ["B", "b", 1, False], ["C", "c", 2, True]]
+        )
+        assert self.element.get_selected_list_labels("//select") == ["A", "C"]
+        assert self.element.get_selected_list_values("//select") == ["a", "c"]
+        assert self.element.get_selected_list_label("//select") == "A"
+        assert self.element.get_list_items("//select", values=True) == ["a", "b", "c"]
+        verify(select, times=0).find_elements(...)
+
+    def test_options_are_read_one_by_one_if_script_fails(self):
+        select = mock({"tag_name": "select"})
+        option = mock({"text": "A"})
+        when(option).get_attribute("value").thenReturn("a")
+        when(option).is_selected().thenReturn(False)
+        when(select).get_dom_attribute("multiple").thenReturn(None)
+        when(select).find_elements("tag name", "option").thenReturn([option])
+        when(self.element).find_element("//select", tag="list").thenReturn(select)
+        when(self.ctx.driver).execute_script(SELECT_OPTIONS_SCRIPT, select).thenRaise(
+            JavascriptException("CSP")
+        )
+        assert self.element.get_list_items("//select") == ["A"]
+        assert self.element.get_selected_list_labels("//select") == []
+        with pytest.raises(NoSuchElementException):
+            self.element.get_selected_list_value("//select")
+
+    def _multi_select(self):
+        element = mock({"tag_name": "select"})
+        when(element).get_dom_attribute("multiple").thenReturn("true")
+        when(self.element).find_element("//select", tag="list").thenReturn(element)
+        return element
+
+    def test_select_many_options_with_one_script(self):
+        element = self._multi_select()
+        when(self.ctx.driver).execute_script(
+            SELECT_BATCH_SCRIPT, element, "index", [1, 3], True
+        ).thenReturn({"changed": 2})
+        when(self.ctx.driver).execute_script(
+            SELECT_BATCH_SCRIPT, element, "label", ["A", "B"], False
+        ).thenReturn({"changed": 1})
+        self.element.select_from_list_by_index("//select", "1", "3")
+        self.element.unselect_from_list_by_label("//select", "A", "B")
+        verify(element, times=0).find_elements(...)
+
+    def test_select_many_options_errors(self):
+        element = self._multi_select()
+        when(self.ctx.driver).execute_script(
+            SELECT_BATCH_SCRIPT, element, "value", ["a", "x"], True
+        ).thenReturn({"error": "missing", "item": "x"})
+        when(self.ctx.driver).execute_script(
+            SELECT_BATCH_SCRIPT, element, "label", ["A", "B"], True
+        ).thenReturn({"error": "invisible", "item": "B"})
+        when(self.ctx.driver).execute_script(
+            SELECT_BATCH_SCRIPT, element, "all", [], True
+        ).thenReturn({"error": "disabled", "item": 2})
+        with pytest.raises(NoSuchElementException, match="value: x"):
+            self.element.select_from_list_by_value("//select", "a", "x")
+        with pytest.raises(NoSuchElementException, match="Invisible option"):
+            self.element.select_from_list_by_label("//select", "A", "B")
+        with pytest.raises(NotImplementedError, match="disabled option"):
+            self.element.select_all_from_list("//select")
+
+    def test_select_one_option_clicks_it(self):
+        element = self._multi_select()
+        option = mock()
+        when(option).is_selected().thenReturn(False)
+        when(option).is_enabled().thenReturn(True)
+        when(element).find_elements("css selector", 'option[value ="a"]').thenReturn(
+            [option]
+        )
+        self.element.select_from_list_by_value("//select", "a")
+        verify(option).click()
+        verify(self.ctx.driver, times=0).execute_script(...)
@@ -1,4 +1,7 @@
+import time
+
 import pytest
+from mockito import any as mockito_any
 from mockito import mock, unstub, when
 
 from SeleniumLibrary.keywords import WaitingKeywords
@@ -11,6 +14,8 @@ def waiting():
     ctx = mock()
     ctx.driver = mock()
     ctx.timeout = TIMEOUT
+    ctx.event_driven_waits = False
+    ctx.polling = None
     return WaitingKeywords(ctx)
 
 
@@ -39,3 +44,22 @@ def test_wait_until_page_contains(waiting):
     with pytest.raises(AssertionError) as error:
         waiting.wait_until_page_contains(text, None, "error")
     assert "error" in str(error.value)
+
+
+def test_polling_argument(waiting):
+    intervals = []
+    sleep = time.sleep
+
+    def record(seconds):
+        intervals.append(seconds)
+        sleep(seconds)
+
+    when(time).sleep(mockito_any()).thenAnswer(record)
+    try:
+        with pytest.raises(AssertionError):
+            waiting.wait_for_condition(
+                "return false", 0.2, polling="initial=0.01;factor=2;jitter=0"
+            )
+    finally:
+        unstub(time)
+    assert intervals[:3] == [0.01, 0.02, 0.04]
@@ -0,0 +1,88 @@
+import pytest
+from mockito import mock, unstub, verify, when
+from selenium.common.exceptions import JavascriptException
+
+from SeleniumLibrary.keywords import ElementKeywords
+from SeleniumLibrary.keywords.element import PAGE_TEXT_SCRIPT
+
+FRAMES = "xpath://frame|//iframe"
+
+
+@pytest.fixture
+def element():
+    ctx = mock()
+    ctx.driver = mock()
+    ctx.driver.switch_to = mock()
+    ctx._element_finder = mock()
+    keywords = ElementKeywords(ctx)
+    when(keywords).info(...)
+    return keywords
+
+
+def teardown_function():
+    unstub()
+
+
+def result(found=None, inaccessible=()):
+    return {"found": found, "inaccessible": list(inaccessible)}
+
+
+def test_text_in_main_document(element):
+    when(element.driver).execute_script(PAGE_TEXT_SCRIPT, "needle").thenReturn(
+        result({"path": [], "labels": []})
+    )
+    element.page_should_contain("needle")
+    verify(element).info("Current page contains text 'needle'.")
+    verify(element.driver.switch_to, times=1).default_content()
+    verify(element.driver.switch_to, times=0).frame(...)
+
+
+def test_text_in_same_origin_frame(element):
+    when(element.driver).execute_script(PAGE_TEXT_SCRIPT, "needle").thenReturn(
+        result({"path": [1, 0], "labels": ["outer", "inner"]})
+    )
+    element.page_should_contain("needle")
+    verify(element).info(
+        "Current page contains text 'needle' in frame 'outer >> inner'."
+    )
+    verify(element.driver.switch_to, times=0).frame(...)
+
+
+def test_text_in_cross_origin_frame(element):
+    outer, inner = mock(), mock()
+    # Path to the inner frame is switched through the outer frame.
+    frames = [[outer], [outer], [inner]]
+    when(element).find_elements(FRAMES).thenAnswer(lambda locator: frames.pop(0))
+    when(element.driver).execute_script(PAGE_TEXT_SCRIPT, "needle").thenReturn(
+        result(inaccessible=[{"path": [0], "labels": ["outer"]}])
+    ).thenReturn(result(inaccessible=[{"path": [0], "labels": ["inner"]}])).thenReturn(
+        result({"path": [], "labels": []})
+    )
+    element.page_should_contain("needle")
+    verify(element).info(
+        "Current page contains text 'needle' in frame 'outer >> inner'."
+    )
+    verify(element.driver.switch_to, times=2).frame(outer)
+    verify(element.driver.switch_to).frame(inner)
+    # Before each search and back to the main document at the end.
+    verify(element.driver.switch_to, times=4).default_content()
+    # Elements found in one frame are not used in another.
+    verify(element.element_finder, times=7).clear_element_cache()
+
+
+def test_text_not_found(element):
+    when(element.driver).execute_script(PAGE_TEXT_SCRIPT, "needle").thenReturn(result())
+    element.page_should_not_contain("needle")
+    with pytest.raises(AssertionError):
+        element.page_should_contain("needle")
+
+
+def test_fallback_without_javascript(element):
+    when(element.driver).execute_script(PAGE_TEXT_SCRIPT, "needle").thenRaise(
+        JavascriptException("no")
+    )
+    when(element).is_text_present("needle").thenReturn(False).thenReturn(True)
+    when(element).find_elements(FRAMES).thenReturn([mock()])
+    element.page_should_contain("needle")
+    verify(element).info("Current page contains text 'needle'.")
+    verify(element.driver.switch_to).frame(...)
@@ -0,0 +1,134 @@
+from SeleniumLibrary.keywords.tabledata import (
+    TableCell,
+    TableData,
+    TableRow,
+    TableSnapshot,
+)
+
+
+def _row(*texts, section="tbody", header=False, **config):
+    cells = tuple(TableCell(text, header) for text in texts)
+    return TableRow(" ".join(texts), cells, section, **config)
+
+
+def test_from_script_result():
+    result = {
+        "caption": "Caption",
+        "rows": [
+            {
+                "text": "A1 B1",
+                "section": "tbody",
+                "nested": False,
+                "position": 1,
+                "siblings": 1,
+                "footer": False,
+                "cells": [["A1", True, 1, 1], ["B1", False, 2, 1]],
+            }
+        ],
+    }
+    data = TableData.from_script_result(result)
+    assert data.caption == "Caption"
+    assert data.rows[0].cells == (
+        TableCell("A1", True, 1, 1),
+        TableCell("B1", False, 2, 1),
+    )
+    assert TableData.from_script_result(None) is None
+    assert TableData.from_script_result({"rows": None}) is None
+
+
+def test_section_rows_are_in_rendering_order():
+    data = TableData(
+        (
+            _row("foot", section="tfoot", footer=True),
+            _row("body"),
+            _row("nested", nested=True, section=None),
+            _row("head", section="thead", header=True),
+        )
+    )
+    assert data.to_list() == [["head"], ["body"], ["foot"]]
+
+
+def test_expand_spans():
+    data = TableData(
+        (
+            TableRow(
+                "",
+                (
+                    TableCell("A1", False, rowspan=2),
+                    TableCell("B1", False, colspan=2),
+                ),
+            ),
+            TableRow("", (TableCell("B2", False), TableCell("C2", False))),
+        )
+    )
+    assert data.to_list() == [["A1", "B1"], ["B2", "C2"]]
+    assert data.to_list(expand_spans=True) == [
+        ["A1", "B1", "B1"],
+        ["A1", "B2", "C2"],
+    ]
+
+
+def test_row_and_column_texts():
+    data = TableData(
+        (
+            _row("A1", "B1", siblings=2),
+            _row("A2", "B2", "C2", position=2, siblings=2),
+            _row("N1", nested=True, section=None),
+        )
+    )
+    assert list(data.row_texts(1)) == ["A1 B1", "N1"]
+    assert list(data.row_texts(-1)) == ["A2 B2 C2", "N1"]
+    assert list(data.column_texts(3)) == ["C2"]
+    assert list(data.column_texts(-2)) == ["A1", "B2"]
+
+
+def test_header_footer_and_all_texts():
+    data = TableData(
+        (
+            _row("H1", section="thead", header=True),
+            _row("F1", section="tfoot", footer=True),
+            _row("F2", section="tfoot", footer=True, header=True),
+        ),
+        caption="Caption",
+    )
+    assert list(data.header_texts()) == ["H1", "F2"]
+    assert list(data.footer_texts()) == ["F1"]
+    assert "Caption" in data.texts()
+
+
+def test_header_columns():
+    data = TableData(
+        (
+            _row("Name", "Age", "Name", section="thead", header=True),
+            _row("Alice", "42"),
+        )
+    )
+    assert data.header_columns() == {"Name": 1, "Age": 2}
+    assert TableData((_row("Alice", "42"),)).header_columns() == {}
+
+
+def test_snapshot_matches_table_data():
+    data = TableData(
+        (
+            _row("Name", "Age", section="thead", header=True),
+            _row("Alice", "42", siblings=2),
+            _row("Bob", "7", position=2, siblings=2),
+            _row("Total", "49", section="tfoot", footer=True),
+            _row("Nested", nested=True, section=None),
+        ),
+        caption="People",
+    )
+    snapshot = TableSnapshot(data)
+    assert snapshot.to_list() == data.to_list()
+    assert snapshot.header_columns() == data.header_columns()
+    for expected in ("Alice", "li", "4", "Bob 7", "Total", "Peo", "Nested", "xxx"):
+        assert snapshot.contains(expected) == data.contains(expected)
+        assert snapshot.header_contains(expected) == data.header_contains(expected)
+        assert snapshot.footer_contains(expected) == data.footer_contains(expected)
+        for index in (1, 2, 3, -1, -2, -3):
+            assert snapshot.row_contains(index, expected) == data.row_contains(
+                index, expected
+            )
+            assert snapshot.column_contains(index, expected) == data.column_contains(
+                index, expected
+            )
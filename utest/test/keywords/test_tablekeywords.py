@@ -1,8 +1,12 @@
 import unittest
 
-from mockito import mock, unstub, when
+import pytest
+from mockito import ANY, mock, unstub, verify, when
 
+from SeleniumLibrary import SeleniumLibrary
 from SeleniumLibrary.keywords import TableElementKeywords
+from SeleniumLibrary.keywords.tabledata import TABLE_DATA_SCRIPT
+from SeleniumLibrary.keywords.tableelement import clear_table_snapshot_cache
 
 
 class TableKeywordsTest(unittest.TestCase):
@@ -33,3 +37,84 @@ class TableKeywordsTest(unittest.TestCase):
         xpath = "//tr[position()=last()-2]"
         when(self.finder)._find("xpath=//table", xpath, "content").thenReturn(mock())
         self.finder._find_by_row("xpath=//table", -3, "content")
+
+    def _stub_table_data(self, *rows):
+        table = mock()
+        self.ctx.driver = mock()
+        when(self.finder).find_element("id:table", tag=None).thenReturn(table)
+        result = {
+            "caption": None,
+            "rows": [
+                {
+                    "text": " ".join(text for text, _ in cells),
+                    "section": "tbody",
+                    "nested": False,
+                    "position": position,
+                    "siblings": len(rows),
+                    "footer": False,
+                    "cells": [[text, header, 1, 1] for text, header in cells],
+                }
+                for position, cells in enumerate(rows, start=1)
+            ],
+        }
+        when(self.ctx.driver).execute_script(TABLE_DATA_SCRIPT, table).thenReturn(
+            result
+        )
+
+    def test_table_keywords_use_table_data(self):
+        self._stub_table_data([("A1", False), ("B1", False)])
+        self.finder.table_column_should_contain("id:table", -1, "B1")
+        self.finder.table_row_should_contain("id:table", 1, "A1")
+        self.finder.table_should_contain("id:table", "A1 B1")
+        with pytest.raises(AssertionError):
+            self.finder.table_column_should_contain("id:table", 1, "B1")
+        verify(self.finder, times=0)._find(ANY, ANY, ANY)
+
+    def test_table_snapshot(self):
+        self._stub_table_data(
+            [("Name", True), ("Age", True)], [("Alice", False), ("42", False)]
+        )
+        self.finder.capture_table_snapshot("id:table")
+        self.finder.table_column_should_contain("id:table", "Age", "42")
+        self.finder.table_row_should_contain("id:table", -1, "Alice")
+        self.finder.table_header_should_contain("id:table", "Name")
+        assert self.finder.get_table_cell("id:table", 2, "Name") == "Alice"
+        with pytest.raises(ValueError, match="has no column 'Foo'"):
+            self.finder.table_column_should_contain("id:table", "Foo", "42")
+        verify(self.ctx.driver, times=1).execute_script(ANY, ANY)
+        self.finder.refresh_table_snapshot("id:table")
+        verify(self.ctx.driver, times=2).execute_script(ANY, ANY)
+        self.finder.clear_table_snapshots()
+        with pytest.raises(ValueError, match="has no snapshot"):
+            self.finder.refresh_table_snapshot("id:table")
+
+    def test_table_snapshot_is_logged(self):
+        self._stub_table_data([("A1", False)])
+        self.finder.capture_table_snapshot("id:table")
+        when(self.finder).info(ANY).thenReturn(None)
+        self.finder.table_should_contain("id:table", "A1")
+        verify(self.finder).info("Using snapshot of table 'id:table'.")
+
+    def test_table_snapshot_belongs_to_browser(self):
+        self._stub_table_data([("A1", False)])
+        self.finder.capture_table_snapshot("id:table")
+        first = self.ctx.driver
+        self._stub_table_data([("B1", False)])
+        with pytest.raises(AssertionError):
+            self.finder.table_should_contain("id:table", "A1")
+        self.ctx.driver = first
+        self.finder.table_should_contain("id:table", "A1")
+
+    def test_table_snapshots_are_cleared(self):
+        self._stub_table_data([("A1", False)])
+        self.finder.capture_table_snapshot("id:table")
+        clear_table_snapshot_cache(self.ctx)
+        with pytest.raises(ValueError, match="has no snapshot"):
+            self.finder.refresh_table_snapshot("id:table")
+
+
+def test_table_snapshots_are_cleared_at_end_of_test():
+    library = SeleniumLibrary()
+    library._table_snapshots.set(None, "id:table", mock())
+    library._listener.end_test("Test", {"longname": "Suite.Test"})
+    assert library._table_snapshots.get(None, "id:table") is None
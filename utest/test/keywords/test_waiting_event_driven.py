@@ -0,0 +1,97 @@
+import time
+
+import pytest
+from mockito import any as mockito_any
+from mockito import mock, unstub, verify, when
+from selenium.common.exceptions import TimeoutException
+
+from SeleniumLibrary.keywords import WaitingKeywords
+from SeleniumLibrary.keywords.waiting import WAIT_FOR_MUTATION_SCRIPT
+
+
+@pytest.fixture
+def waiting():
+    ctx = mock()
+    ctx.driver = mock()
+    ctx.timeout = 5
+    ctx.event_driven_waits = True
+    ctx.polling = None
+    return WaitingKeywords(ctx)
+
+
+def teardown_function():
+    unstub()
+
+
+def test_wait_wakes_up_on_mutation(waiting):
+    element = mock()
+    when(waiting).find_element("id:foo", required=False).thenReturn(None).thenReturn(
+        element
+    )
+    when(waiting.driver).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, None, mockito_any()
+    ).thenReturn(0)
+    when(time).sleep(mockito_any()).thenReturn(None)
+    waiting.wait_until_page_contains_element("id:foo")
+    verify(waiting.driver, times=1).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, None, mockito_any()
+    )
+    verify(time, times=0).sleep(0.2)
+
+
+def test_wait_passes_seen_mutations_to_browser(waiting):
+    element = mock()
+    when(waiting).find_element("id:foo", required=False).thenReturn(None).thenReturn(
+        None
+    ).thenReturn(element)
+    when(waiting.driver).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, None, mockito_any()
+    ).thenReturn(3)
+    when(waiting.driver).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, 3, mockito_any()
+    ).thenReturn(4)
+    when(time).sleep(mockito_any()).thenReturn(None)
+    waiting.wait_until_page_contains_element("id:foo")
+    verify(waiting.driver, times=1).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, 3, mockito_any()
+    )
+
+
+def test_condition_checks_are_debounced(waiting):
+    sleeps = []
+    when(waiting).find_element("id:foo", required=False).thenReturn(None).thenReturn(
+        mock()
+    )
+    when(waiting.driver).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, None, mockito_any()
+    ).thenReturn(1)
+    when(time).sleep(mockito_any()).thenAnswer(sleeps.append)
+    waiting.wait_until_page_contains_element("id:foo")
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 0.05
+
+
+def test_wait_falls_back_to_polling(waiting):
+    element = mock()
+    when(waiting).find_element("id:foo", required=False).thenReturn(None).thenReturn(
+        None
+    ).thenReturn(element)
+    when(waiting.driver).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, None, mockito_any()
+    ).thenRaise(TimeoutException("timeout"))
+    when(time).sleep(0.2).thenReturn(None)
+    waiting.wait_until_page_contains_element("id:foo")
+    verify(waiting.driver, times=1).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, None, mockito_any()
+    )
+    verify(time, times=1).sleep(0.2)
+
+
+def test_location_waits_use_polling(waiting):
+    waiting.driver.current_url = "http://example.com"
+    when(time).sleep(mockito_any()).thenReturn(None)
+    with pytest.raises(AssertionError):
+        waiting.wait_until_location_contains("foo", timeout=0.01)
+    verify(waiting.driver, times=0).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, mockito_any(), mockito_any()
+    )
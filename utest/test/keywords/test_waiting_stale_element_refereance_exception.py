@@ -15,7 +15,9 @@ def _raise(*a):
 def waiting():
     ctx = mock()
     ctx.timeout = TIMEOUT
-    return WaitingKeywords(mock())
+    ctx.event_driven_waits = False
+    ctx.polling = None
+    return WaitingKeywords(ctx)
 
 
 def teardown_module():
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+import threading
 import unittest
 
 import pytest
@@ -220,7 +223,7 @@ class WebDriverCacheTests(unittest.TestCase):
         with pytest.raises(TimeoutException):
             cache.close()
         assert isinstance(cache.current, NoConnection)
-        assert driver in cache._closed
+        assert 1 in cache._closed
 
     def test_close_no_error(self):
         cache = WebDriverCache()
@@ -229,7 +232,63 @@ class WebDriverCacheTests(unittest.TestCase):
         cache.register(driver, "bar")
         cache.close()
         assert isinstance(cache.current, NoConnection)
-        assert driver in cache._closed
+        assert 1 in cache._closed
+
+    def test_close_all_quits_in_parallel(self):
+        cache = WebDriverCache()
+        barrier = threading.Barrier(3, timeout=5)
+        drivers = [mock(), mock(), mock()]
+        for index, driver in enumerate(drivers):
+            when(driver).quit().thenAnswer(barrier.wait)
+            cache.register(driver, f"bar{index}")
+        cache.close_all()
+        for driver in drivers:
+            verify(driver, times=1).quit()
+        self.verify_cache(cache)
+
+    def test_close_all_kills_hung_driver_service(self):
+        cache = WebDriverCache(quit_timeout=0.1)
+        release = threading.Event()
+        hung, driver = mock(), mock()
+        hung.service = mock()
+        hung.service.process = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"]
+        )
+        when(hung).quit().thenAnswer(lambda: release.wait(5))
+        when(driver).quit().thenReturn(None)
+        cache.register(hung, "hung")
+        cache.register(driver, "driver")
+        try:
+            with pytest.raises(TimeoutException, match="did not finish in 100 milli"):
+                cache.close_all()
+            assert hung.service.process.wait(5) != 0
+        finally:
+            release.set()
+            hung.service.process.kill()
+        verify(driver, times=1).quit()
+        self.verify_cache(cache)
+
+    def test_close_all_quits_queued_browsers_after_timeout(self):
+        cache = WebDriverCache(quit_timeout=0.1)
+        cache.max_quit_workers = 1
+        release = threading.Event()
+        hung, driver = mock(), mock()
+        threads = []
+        when(hung).quit().thenAnswer(
+            lambda: threads.append(threading.current_thread()) or release.wait(5)
+        )
+        when(driver).quit().thenReturn(None)
+        cache.register(hung, "hung")
+        cache.register(driver, "driver")
+        try:
+            with pytest.raises(TimeoutException):
+                cache.close_all()
+        finally:
+            release.set()
+        # The browser queued behind the hung one was quit and not timed out.
+        verify(driver, times=1).quit()
+        assert threads[0].daemon
+        self.verify_cache(cache)
 
     def verify_cache(self, cache):
         assert cache._connections == []
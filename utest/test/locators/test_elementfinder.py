@@ -5,9 +5,18 @@ from approvaltests import verify_all
 from approvaltests.reporters import GenericDiffReporterFactory
 from mockito import any as mockito_any
 from mockito import mock, unstub, verify, when
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.by import By
 
 from SeleniumLibrary.errors import ElementNotFound
+from SeleniumLibrary.locators.browserlocator import (
+    FILTER_ELEMENTS_SCRIPT,
+    FIND_CHAIN_SCRIPT,
+)
 from SeleniumLibrary.locators.elementfinder import ElementFinder
 
 
@@ -97,6 +106,12 @@ def test_registered_strategy_can_be_used_as_prefix():
     _verify_parse_locator("registered:yes!!", "registered", "yes!!", finder)
 
 
+def test_reserved_strategy_cannot_be_registered():
+    finder = ElementFinder(None)
+    with pytest.raises(RuntimeError, match="'frame' cannot be registered"):
+        finder.register("frame", lambda *args: None, persist=True)
+
+
 def _verify_parse_locator(locator, prefix, criteria, finder=None):
     if not finder:
         finder = ElementFinder(None)
@@ -754,6 +769,173 @@ def test_locator_split_with_non_strings(finder: ElementFinder):
     assert finder._split_locator(locator) == [locator]
 
 
+def test_compiled_locator_is_cached(finder):
+    driver = _get_driver(finder)
+    elements = _make_mock_elements("div", "a")
+    when(driver).find_elements(By.CSS_SELECTOR, "#test1").thenReturn(elements)
+    assert finder.find("css:#test1", first_only=False) == elements
+    assert finder.find("css:#test1", first_only=False) == elements
+    assert finder.find("css:#test1", tag="a", first_only=False) == [elements[1]]
+    info = finder.locator_cache_info
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.size == 2
+
+
+def test_compiled_locator_parts(finder):
+    compiled = finder._get_compiled_locator("css:div >> xpath://a", "text field")
+    assert [(p.prefix, p.criteria) for p in compiled.parts] == [
+        ("css", "div"),
+        ("xpath", "//a"),
+    ]
+    assert compiled.element_type == "Text field"
+    assert compiled.tag == "input"
+    assert (
+        compiled.get_constraints() == finder._get_tag_and_constraints("text field")[1]
+    )
+    assert compiled.xpath_constraints == tuple(
+        finder._get_xpath_constraints(compiled.get_constraints())
+    )
+
+
+def test_locator_cache_is_cleared_when_strategies_change(finder):
+    finder._get_compiled_locator("custom:foo")
+    assert finder._get_compiled_locator("custom:foo").parts[0].prefix == "default"
+    finder.register("custom", lambda *args: None, persist=True)
+    assert finder.locator_cache_info.size == 0
+    assert finder._get_compiled_locator("custom:foo").parts[0].prefix == "custom"
+    finder.unregister("custom")
+    assert finder.locator_cache_info.size == 0
+    assert finder._get_compiled_locator("custom:foo").parts[0].prefix == "default"
+
+
+def test_chain_resolved_in_browser(finder):
+    finder.chain_locators_in_browser = True
+    driver = _get_driver(finder)
+    chain = [["css", "#test1"], ["xpath", "//a"]]
+    elements = _make_mock_elements("div", "a", "a")
+    when(driver).execute_script(FIND_CHAIN_SCRIPT, chain, None, None, {}).thenReturn(
+        {"elements": elements}
+    )
+    when(driver).execute_script(FIND_CHAIN_SCRIPT, chain, None, "a", {}).thenReturn(
+        {"elements": elements[1:]}
+    )
+    result = finder.find("css:#test1 >> xpath://a", tag="a", first_only=False)
+    assert result == elements[1:]
+    assert finder.find("css:#test1 >> xpath://a") == elements[0]
+    verify(driver, times=2).execute_script(
+        FIND_CHAIN_SCRIPT, chain, None, mockito_any(), {}
+    )
+    verify(driver, times=0).find_elements(mockito_any(), mockito_any())
+
+
+def test_chain_resolved_in_browser_missing_part(finder):
+    finder.chain_locators_in_browser = True
+    driver = _get_driver(finder)
+    chain = [["css", "#test1"], ["id", "foo"], ["xpath", "//a"]]
+    when(driver).execute_script(FIND_CHAIN_SCRIPT, chain, None, None, {}).thenReturn(
+        {"missing": 1}
+    )
+    with pytest.raises(
+        ElementNotFound, match="Element with locator 'id:foo' not found"
+    ):
+        finder.find("css:#test1 >> id:foo >> xpath://a")
+
+
+def test_chain_in_browser_falls_back_to_webdriver(finder):
+    finder.chain_locators_in_browser = True
+    driver = _get_driver(finder)
+    div = _make_mock_element("div")
+    link = _make_mock_element("a")
+    when(driver).find_elements(By.CSS_SELECTOR, "#test1").thenReturn([div])
+    when(div).find_elements(By.XPATH, "//a").thenReturn([link])
+    assert finder.find("css:#test1 >> xpath://a") == link
+    verify(driver).execute_script(
+        FIND_CHAIN_SCRIPT, [["css", "#test1"], ["xpath", "//a"]], None, None, {}
+    )
+
+
+def test_filter_elements_in_browser(finder):
+    driver = _get_driver(finder)
+    elements = _make_mock_elements("input", "div", "input", "input")
+    for element in elements:
+        when(finder)._is_webelement(element).thenReturn(True)
+    tag, constraints = finder._get_tag_and_constraints("checkbox")
+    when(driver).execute_script(
+        FILTER_ELEMENTS_SCRIPT, elements, "input", {"type": "checkbox"}
+    ).thenReturn([0, 3])
+    result = finder._filter_elements(elements, tag, constraints)
+    assert result == [elements[0], elements[3]]
+
+
+def test_filter_elements_in_browser_falls_back_to_python(finder):
+    driver = _get_driver(finder)
+    elements = _make_mock_elements("input", "div", "input")
+    elements[0].set_attribute("type", "checkbox")
+    elements[2].set_attribute("type", "text")
+    for element in elements:
+        when(finder)._is_webelement(element).thenReturn(True)
+    when(driver).execute_script(
+        FILTER_ELEMENTS_SCRIPT, mockito_any(), mockito_any(), mockito_any()
+    ).thenRaise(JavascriptException("CSP"))
+    tag, constraints = finder._get_tag_and_constraints("checkbox")
+    assert finder._filter_elements(elements, tag, constraints) == [elements[0]]
+
+
+def test_browser_chain_requires_browser_strategies(finder):
+    assert finder._get_compiled_locator("css:div").browser_chain is None
+    assert finder._get_compiled_locator("dom:foo >> css:div").browser_chain is None
+    compiled = finder._get_compiled_locator("id:foo >> link:Bar")
+    assert compiled.browser_chain == (("id", "foo"), ("link", "Bar"))
+
+
+def test_element_cache(finder):
+    finder.element_cache = True
+    driver = _get_driver(finder)
+    elements = _make_mock_elements("div", "a")
+    when(driver).find_elements(By.CSS_SELECTOR, "#test1").thenReturn(elements)
+    assert finder.find("css:#test1") == elements[0]
+    assert finder.find("css:#test1") == elements[0]
+    assert finder.find("css:#test1", tag="a") == elements[1]
+    assert finder.find("css:#test1", first_only=False) == elements
+    verify(driver, times=3).find_elements(By.CSS_SELECTOR, "#test1")
+    finder.clear_element_cache()
+    assert finder.find("css:#test1") == elements[0]
+    verify(driver, times=4).find_elements(By.CSS_SELECTOR, "#test1")
+
+
+@pytest.mark.parametrize(
+    "error", [StaleElementReferenceException, NoSuchElementException]
+)
+def test_element_cache_finds_stale_element_again(finder, error):
+    finder.element_cache = True
+    driver = _get_driver(finder)
+
+    class StaleElement:
+        @property
+        def tag_name(self):
+            raise error("stale")
+
+    stale = StaleElement()
+    element = _make_mock_element("div")
+    when(driver).find_elements(By.CSS_SELECTOR, "#test1").thenReturn(
+        [stale]
+    ).thenReturn([element])
+    assert finder.find("css:#test1") == stale
+    assert finder.find("css:#test1") == element
+    assert finder.find("css:#test1") == element
+    verify(driver, times=2).find_elements(By.CSS_SELECTOR, "#test1")
+
+
+def test_element_cache_is_not_used_by_default(finder):
+    driver = _get_driver(finder)
+    elements = _make_mock_elements("div")
+    when(driver).find_elements(By.CSS_SELECTOR, "#test1").thenReturn(elements)
+    finder.find("css:#test1")
+    finder.find("css:#test1")
+    verify(driver, times=2).find_elements(By.CSS_SELECTOR, "#test1")
+
+
 def _make_mock_elements(*tags):
     elements = []
     for tag in tags:
@@ -0,0 +1,30 @@
+from SeleniumLibrary.locators.locatorcache import LocatorCache
+
+
+def test_get_counts_hits_and_misses():
+    cache = LocatorCache()
+    assert cache.get("foo") is None
+    cache.put("foo", 1)
+    assert cache.get("foo") == 1
+    assert cache.info == (1, 1, 1, 1024)
+
+
+def test_least_recently_used_is_evicted():
+    cache = LocatorCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_clear_keeps_statistics():
+    cache = LocatorCache()
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.info == (1, 1, 0, 1024)
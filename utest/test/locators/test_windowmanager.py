@@ -1,11 +1,13 @@
+import threading
 import unittest
 import uuid
 
 import pytest
-from mockito import mock
+from mockito import mock, unstub, when
 
 from SeleniumLibrary.errors import WindowNotFound
-from SeleniumLibrary.locators import WindowManager
+from SeleniumLibrary.keywords import WebDriverCache
+from SeleniumLibrary.locators import WindowInfoCache, WindowManager, windowmanager
 
 
 class WindowManagerTests(unittest.TestCase):
@@ -198,34 +200,259 @@ class WindowManagerTests(unittest.TestCase):
             "http://url.3",
         ]
 
+    def test_get_window_titles_and_urls_with_cdp(self):
+        manager = WindowManagerWithMockBrowser(*WINDOWS, cdp=True)
+        infos = manager.get_window_infos(fields=("title", "url"))
+        assert [info.title for info in infos] == ["Title 1", "Title 2", "Title 3"]
+        assert [info.url for info in infos] == [
+            "http://localhost/page1.html",
+            "http://localhost/page2.html",
+            "http://localhost/page3.html",
+        ]
+        assert manager.driver.switches == []
+
+    def test_get_window_names_with_cdp_switches_windows(self):
+        manager = WindowManagerWithMockBrowser(*WINDOWS, cdp=True)
+        infos = manager.get_window_infos(fields=("name",))
+        assert [info.name for info in infos] == ["win1", "win2", "win3"]
+        # Three windows and back to the starting window.
+        assert len(manager.driver.switches) == 4
+
+    def test_cdp_title_same_as_url_switches_windows(self):
+        manager = WindowManagerWithMockBrowser(
+            {"name": "win1", "title": "Title 1", "url": "http://localhost/page1.html"},
+            {"name": "win2", "title": "", "url": "http://localhost/page2.html"},
+            cdp=True,
+        )
+        infos = manager.get_window_infos(fields=("title",))
+        assert [info.title for info in infos] == ["Title 1", "undefined"]
+        assert len(manager.driver.switches) == 3
+
+    def test_select_by_title_with_cdp(self):
+        manager = WindowManagerWithMockBrowser(*WINDOWS, cdp=True)
+        manager.select("title=Title 3")
+        assert manager.driver.current_window.name == "win3"
+        assert len(manager.driver.switches) == 1
+        with pytest.raises(WindowNotFound):
+            manager.select("url=http://localhost/page-1.html")
+
+    def test_window_info_cache(self):
+        manager = WindowManagerWithMockBrowser(*WINDOWS)
+        manager.ctx._window_info_cache = WindowInfoCache(10)
+        names = [info.name for info in manager.get_window_infos()]
+        assert len(manager.driver.switches) == 4
+        assert [info.name for info in manager.get_window_infos()] == names
+        manager.select("win2")
+        assert manager.driver.current_window.name == "win2"
+        assert len(manager.driver.switches) == 5
+        manager.clear_cache()
+        manager.get_window_infos()
+        assert len(manager.driver.switches) == 9
+
+    def test_window_info_cache_is_not_used_when_windows_change(self):
+        manager = WindowManagerWithMockBrowser(*WINDOWS)
+        manager.ctx._window_info_cache = WindowInfoCache(10)
+        manager.get_window_infos()
+        manager.driver.window_handles.pop()
+        assert len(manager.get_window_infos()) == 2
+        assert len(manager.driver.switches) == 7
+
+
+class SelectWithTimeoutTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = [1000.0]
+        self.delays = []
+        when(windowmanager.time).time().thenAnswer(lambda: self.clock[0])
+        when(windowmanager).sleep(...).thenAnswer(self.sleep)
+        self.manager = WindowManagerWithMockBrowser(*WINDOWS)
+        self.driver = self.manager.driver
+        self.on_sleep = None
+
+    def tearDown(self):
+        unstub()
+
+    def sleep(self, delay):
+        self.delays.append(delay)
+        self.clock[0] += delay
+        if self.on_sleep:
+            self.on_sleep()
+            self.on_sleep = None
+
+    def test_only_new_windows_are_read(self):
+        self.on_sleep = lambda: self.manager.add_window(
+            self.driver, {"name": "popup", "title": "Popup", "url": "http://popup"}
+        )
+        self.manager.select("title=Popup", timeout=1010)
+        assert self.driver.current_window.name == "popup"
+        # Three windows and back to the starting window, then the new window.
+        assert len(self.driver.switches) == 5
+
+    def test_all_windows_are_read_again_when_no_new_windows(self):
+        def change_title():
+            self.driver.window_infos[self.driver.window_handles[1]][2] = "Changed"
+
+        self.on_sleep = change_title
+        self.manager.select("Changed", timeout=1010)
+        assert self.driver.current_window.name == "win2"
+        assert len(self.driver.switches) == 6
+
+    def test_delay_between_attempts_grows(self):
+        with pytest.raises(WindowNotFound):
+            self.manager.select("title=Popup", timeout=1001.5)
+        assert self.delays == [0.05, 0.1, 0.2, 0.4, 0.5, 0.25]
+
+    def test_all_windows_are_read_before_failing(self):
+        self.on_sleep = lambda: self.manager.add_window(
+            self.driver, {"name": "popup", "title": "Popup", "url": "http://popup"}
+        )
+        self.driver.window_infos[self.driver.window_handles[0]][2] = "Loading"
+        with pytest.raises(WindowNotFound):
+            self.manager.select("title=Title 1", timeout=1000.05)
+        # Everything, only the new window and everything once more.
+        assert len(self.driver.switches) == 4 + 2 + 5
+
+
+class AllBrowsersTests(unittest.TestCase):
+    def setUp(self):
+        self.barrier = threading.Barrier(3, timeout=5)
+        ctx = mock()
+        ctx._drivers = WebDriverCache()
+        for index in range(1, 4):
+            ctx._drivers.register(BarrierDriver(index, self.barrier), f"b{index}")
+        ctx._drivers.switch("b2")
+        ctx.driver = ctx._drivers.current
+        self.manager = WindowManager(ctx)
+
+    def test_window_handles_are_queried_in_parallel(self):
+        handles = self.manager.get_window_handles("ALL")
+        assert handles == ["1a", "1b", "2a", "2b", "3a", "3b"]
+        assert self.manager.drivers.current_index == 2
+
+    def test_window_infos_are_queried_in_parallel(self):
+        infos = self.manager.get_window_infos("ALL")
+        assert [info.title for info in infos] == ["1a", "1b", "2a", "2b", "3a", "3b"]
+        assert self.manager.drivers.current_index == 2
+
+    def test_other_browser_is_queried_without_switching(self):
+        self.barrier.abort()
+        handles = self.manager.get_window_handles("b3")
+        infos = self.manager.get_window_infos("b1")
+        assert handles == ["3a", "3b"]
+        assert [info.url for info in infos] == ["http://1a", "http://1b"]
+        assert self.manager.drivers.current_index == 2
+
+    def test_closed_browsers_are_not_queried(self):
+        self.barrier.abort()
+        self.manager.drivers.close()
+        self.manager.drivers.switch("b3")
+        assert self.manager.get_window_handles("ALL") == ["1a", "1b", "3a", "3b"]
+        infos = self.manager.get_window_infos("ALL")
+        assert [info.title for info in infos] == ["1a", "1b", "3a", "3b"]
+
+
+class BarrierDriver:
+    def __init__(self, index, barrier):
+        self.barrier = barrier
+        self.current_window_handle = f"{index}a"
+        self.switch_to = self
+        self._handles = [f"{index}a", f"{index}b"]
+
+    @property
+    def window_handles(self):
+        # Waits until all drivers are queried at the same time.
+        if not self.barrier.broken:
+            self.barrier.wait()
+        return list(self._handles)
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def quit(self):
+        pass
+
+    def execute_script(self, script):
+        return [None, self.current_window_handle]
+
+    @property
+    def title(self):
+        return self.current_window_handle
+
+    @property
+    def current_url(self):
+        return f"http://{self.current_window_handle}"
+
+
+class WindowInfoCacheTests(unittest.TestCase):
+    def tearDown(self):
+        unstub()
+
+    def test_expires(self):
+        cache = WindowInfoCache(2)
+        driver = object()
+        infos = [windowmanager.WindowInfo("h1", "id", "name", "title", "url")]
+        when(windowmanager.time).monotonic().thenReturn(100)
+        cache.set(driver, infos)
+        when(windowmanager.time).monotonic().thenReturn(101.5)
+        assert cache.get(driver, ["h1"]) == infos
+        when(windowmanager.time).monotonic().thenReturn(102.5)
+        assert cache.get(driver, ["h1"]) is None
+
+    def test_disabled(self):
+        cache = WindowInfoCache()
+        driver = object()
+        cache.set(driver, [windowmanager.WindowInfo("h1", "id", "name", "t", "u")])
+        assert cache.get(driver, ["h1"]) is None
+
+
+WINDOWS = (
+    {"name": "win1", "title": "Title 1", "url": "http://localhost/page1.html"},
+    {"name": "win2", "title": "Title 2", "url": "http://localhost/page2.html"},
+    {"name": "win3", "title": "Title 3", "url": "http://localhost/page3.html"},
+)
+
 
 class WindowManagerWithMockBrowser(WindowManager):
-    def __init__(self, *window_specs):
+    def __init__(self, *window_specs, cdp=False):
         ctx = mock()
         ctx.driver = self._make_mock_driver(*window_specs)
+        if cdp:
+            ctx.driver.execute_cdp_cmd = self._make_cdp(ctx.driver)
         WindowManager.__init__(self, ctx)
 
+    def _make_cdp(self, driver):
+        def execute_cdp_cmd(command, params):
+            assert command == "Target.getTargets"
+            targets = [{"targetId": "worker", "type": "service_worker"}]
+            for handle in reversed(driver.window_handles):
+                _, _, title, url = driver.window_infos[handle]
+                targets.append(
+                    {
+                        "targetId": handle,
+                        "type": "page",
+                        "title": title or url,
+                        "url": url,
+                    }
+                )
+            return {"targetInfos": targets}
+
+        return execute_cdp_cmd
+
     def _make_mock_driver(self, *window_specs):
         driver = mock()
         current_window = mock()
+        driver.switches = []
         driver.window_handles = []
         window_infos = {}
+        driver.window_infos = window_infos
         for window_spec in window_specs:
-            handle = uuid.uuid4().hex
-            driver.window_handles.append(handle)
-            id_ = window_spec.get("id")
-            if not id_:
-                id_ = "undefined"
-            window_info = [
-                id_,
-                window_spec.get("name"),
-                window_spec.get("title"),
-                window_spec.get("url"),
-            ]
-            window_infos[handle] = window_info
+            self.add_window(driver, window_spec)
+        if driver.window_handles:
+            driver.current_window_handle = driver.window_handles[0]
 
         def window(handle_):
+            driver.switches.append(handle_)
             if handle_ in driver.window_handles:
+                driver.current_window_handle = handle_
                 driver.session_id = handle_
                 current_window.name = window_infos[handle_][1]
                 driver.current_window = current_window
@@ -244,3 +471,14 @@ class WindowManagerWithMockBrowser(WindowManager):
 
         driver.execute_script = execute_script
         return driver
+
+    def add_window(self, driver, window_spec):
+        handle = uuid.uuid4().hex
+        driver.window_handles.append(handle)
+        driver.window_infos[handle] = [
+            window_spec.get("id") or "undefined",
+            window_spec.get("name"),
+            window_spec.get("title"),
+            window_spec.get("url"),
+        ]
+        return handle
@@ -0,0 +1,102 @@
+import csv
+import json
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.utils.performance import (
+    KeywordTiming,
+    PerformanceRecorder,
+    sleep,
+)
+
+
+def _slow_command(command, params):
+    sleep(0.001)
+    return command
+
+
+def test_keyword_timing_is_recorded(tmp_path):
+    recorder = PerformanceRecorder(
+        str(tmp_path / "report.json"), lambda: ("Root.Suite", "Root.Suite.Test")
+    )
+    recorder.start_keyword()
+    recorder(None, "getTitle", {}, _slow_command)
+    recorder.start_keyword()
+    recorder(None, "findElement", {}, _slow_command)
+    sleep(0.01)
+    recorder.end_keyword("get_webelement")
+    recorder.end_keyword("click_element")
+    inner, outer = recorder.timings
+    assert inner.keyword == "get_webelement"
+    assert inner.commands == 1
+    assert inner.locator_time == inner.command_time > 0
+    assert inner.wait_time >= 0.01
+    assert outer.commands == 2
+    assert outer.duration >= inner.duration
+    assert outer.wait_time >= inner.wait_time
+    assert outer.locator_time == inner.locator_time
+    assert outer.command_time > outer.locator_time
+    assert outer.suite == "Root.Suite"
+    assert outer.test == "Root.Suite.Test"
+
+
+def _timing(test, keyword, duration, suite="Suite"):
+    return KeywordTiming(suite, test, keyword, duration, duration / 2, 2, 0.1, 0.0)
+
+
+def _recorder(path):
+    recorder = PerformanceRecorder(str(path))
+    recorder.timings = [
+        _timing("Suite.T1", "click_element", 1.0),
+        _timing("Suite.T1", "click_element", 3.0),
+        _timing("Suite.T2", "click_element", 2.0),
+        _timing(None, "open_browser", 5.0),
+    ]
+    return recorder
+
+
+def test_report(tmp_path):
+    report = _recorder(tmp_path / "report.json").get_report()
+    rows = {(row["scope"], row["name"], row["keyword"]): row for row in report}
+    assert len(rows) == 6
+    test = rows["test", "Suite.T1", "Click Element"]
+    assert test["calls"] == 2
+    assert test["duration"] == 4.0
+    assert test["duration_p50"] == 1.0
+    assert test["duration_max"] == 3.0
+    total = rows["total", None, "Click Element"]
+    assert total["calls"] == 3
+    assert total["duration_p50"] == 2.0
+    assert total["duration_p95"] == 3.0
+    assert total["commands"] == 6
+    assert rows["suite", "Suite", "Open Browser"]["command_time"] == 2.5
+
+
+def test_write_json_and_csv(tmp_path):
+    _recorder(tmp_path / "report.json").write()
+    with open(tmp_path / "report.json", encoding="UTF-8") as file:
+        assert len(json.load(file)) == 6
+    _recorder(tmp_path / "reports" / "report.csv").write()
+    with open(tmp_path / "reports" / "report.csv", encoding="UTF-8") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 6
+    assert rows[0]["keyword"] == "Click Element"
+
+
+def test_library_records_keywords(tmp_path):
+    library = SeleniumLibrary(performance_report=str(tmp_path / "report.csv"))
+    library.run_keyword("set_selenium_speed", ("0",), {})
+    assert [timing.keyword for timing in library.performance.timings] == [
+        "set_selenium_speed"
+    ]
+    assert library.performance in library.command_pipeline.middlewares
+
+
+def test_library_close_writes_only_own_report(tmp_path):
+    first = SeleniumLibrary(performance_report=str(tmp_path / "first.json"))
+    second = SeleniumLibrary(performance_report=str(tmp_path / "second.json"))
+    first._listener.close()
+    assert (tmp_path / "first.json").exists()
+    assert not (tmp_path / "second.json").exists()
+    second._listener.close()
+    assert (tmp_path / "second.json").exists()
+    assert second._listener.close_actions == []
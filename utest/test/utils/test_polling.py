@@ -0,0 +1,52 @@
+from datetime import timedelta
+from itertools import islice
+
+import pytest
+
+from SeleniumLibrary.utils import Polling
+from SeleniumLibrary.utils.polling import ADAPTIVE_POLLING
+
+
+def test_fixed_polling():
+    assert Polling.parse("200 ms") == Polling(0.2, 0.2)
+    assert Polling.parse(0.5) == Polling(0.5, 0.5)
+    assert Polling.parse(timedelta(seconds=1)) == Polling(1.0, 1.0)
+    assert list(islice(Polling.parse("0.1").intervals(), 3)) == [0.1, 0.1, 0.1]
+
+
+def test_adaptive_polling():
+    assert Polling.parse("Adaptive") == ADAPTIVE_POLLING
+    polling = Polling.parse("initial=10ms; maximum=40ms; factor=2; jitter=0")
+    assert polling == Polling(0.01, 0.04, 2.0, 0.0)
+    assert list(islice(polling.intervals(), 5)) == [0.01, 0.02, 0.04, 0.04, 0.04]
+
+
+def test_adaptive_polling_defaults():
+    polling = Polling.parse("maximum=5s")
+    assert polling == ADAPTIVE_POLLING._replace(maximum=5.0)
+
+
+def test_adaptive_polling_maximum_defaults_to_initial():
+    assert Polling.parse("initial=3 s").maximum == 3.0
+    assert Polling.parse("initial=1 s").maximum == ADAPTIVE_POLLING.maximum
+
+
+def test_polling_jitter():
+    polling = Polling(1.0, 1.0, jitter=0.2)
+    for interval in islice(polling.intervals(), 50):
+        assert 0.8 <= interval <= 1.2
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        ("0", "Polling interval must be positive"),
+        ("initial=2s;maximum=1s", "Polling maximum 1.0 is smaller"),
+        ("factor=0.5", "Polling factor must be at least 1"),
+        ("jitter=1", "Polling jitter must be at least 0 and less than 1"),
+        ("speed=1", "Invalid polling option 'speed'"),
+    ],
+)
+def test_invalid_polling(value, message):
+    with pytest.raises(ValueError, match=message):
+        Polling.parse(value)